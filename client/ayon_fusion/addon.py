@@ -1,6 +1,7 @@
 import os
 import re
-from ayon_core.addon import AYONAddon, IHostAddon
+import json
+from ayon_core.addon import AYONAddon, IHostAddon, click_wrap
 from ayon_core.lib import Logger
 
 from .version import __version__
@@ -73,3 +74,236 @@ class FusionAddon(AYONAddon, IHostAddon):
 
     def get_workfile_extensions(self):
         return [".comp"]
+
+    def cli(self, click_group):
+        click_group.add_command(cli_main.to_click_obj())
+
+
+@click_wrap.group(FusionAddon.name, help="Fusion addon commands.")
+def cli_main():
+    pass
+
+
+@cli_main.command("publish-workfiles")
+@click_wrap.argument("workfiles", nargs=-1)
+@click_wrap.option(
+    "--app", "app_name", required=True,
+    help="Full application name to launch, e.g. 'fusion/19'.")
+@click_wrap.option(
+    "--project", "project_name", default=None,
+    help="Project name of the workfiles.")
+@click_wrap.option(
+    "--folder", "folder_path", default=None,
+    help="Folder path of the workfiles.")
+@click_wrap.option(
+    "--task", "task_name", default=None,
+    help="Task name of the workfiles.")
+@click_wrap.option(
+    "--jobs", "jobs_path", default=None,
+    help=(
+        "JSON file with a list of jobs with 'workfile' and optional "
+        "'project_name', 'folder_path' and 'task_name' keys to publish "
+        "workfiles of different contexts."
+    ))
+@click_wrap.option(
+    "--workers", type=int, default=2,
+    help="Amount of Fusion processes to publish with concurrently.")
+@click_wrap.option(
+    "--retries", type=int, default=1,
+    help="Amount of retries for a failed publish.")
+@click_wrap.option(
+    "--timeout", type=float, default=None,
+    help="Seconds after which a publishing Fusion process is killed.")
+@click_wrap.option(
+    "--log-dir", default=None,
+    help="Directory to write per workfile logs and results to.")
+@click_wrap.option(
+    "--report", "report_path", default=None,
+    help="Write JSON report of all publish results to this path.")
+@click_wrap.option(
+    "--extra-arg", "extra_args", multiple=True,
+    help="Extra argument to pass to Fusion on launch, e.g. '-headless'.")
+def publish_workfiles(
+    workfiles,
+    app_name,
+    project_name,
+    folder_path,
+    task_name,
+    jobs_path,
+    workers,
+    retries,
+    timeout,
+    log_dir,
+    report_path,
+    extra_args,
+):
+    """Publish Fusion workfiles headless in parallel Fusion processes."""
+    from .batch_publish import publish_workfiles, format_summary
+
+    context = {
+        "project_name": project_name,
+        "folder_path": folder_path,
+        "task_name": task_name,
+    }
+    jobs = [dict(context, workfile=workfile) for workfile in workfiles]
+    if jobs_path:
+        with open(jobs_path, "r") as stream:
+            for job in json.load(stream):
+                jobs.append(dict(context, **job))
+
+    for job in jobs:
+        missing = [key for key, value in job.items() if not value]
+        if missing:
+            raise ValueError(
+                "Missing {} for workfile: {}".format(
+                    ", ".join(missing), job.get("workfile")
+                )
+            )
+
+    results = publish_workfiles(
+        jobs,
+        app_name,
+        workers=workers,
+        retries=retries,
+        timeout=timeout,
+        log_dir=log_dir,
+        extra_args=extra_args,
+    )
+    print(format_summary(results))
+
+    if report_path:
+        with open(report_path, "w") as stream:
+            json.dump(results, stream, indent=4)
+
+    if not all(result.get("success") for result in results):
+        raise SystemExit(1)
+
+
+@cli_main.command("update-containers")
+@click_wrap.argument("paths", nargs=-1)
+@click_wrap.option(
+    "--project", "project_name", default=None,
+    help="Project name for containers without imprinted project name.")
+@click_wrap.option(
+    "--dry-run", is_flag=True, default=False,
+    help="Only print the changes, don't write the comp files.")
+@click_wrap.option(
+    "--workers", type=int, default=None,
+    help="Amount of processes to read and write comp files with.")
+def update_containers(paths, project_name, dry_run, workers):
+    """Update Loader containers in comp files to their latest versions.
+
+    Paths can be comp files or directories to search for comp files.
+    """
+    from .comp_file import find_comp_files
+    from .offline_update import update_comp_files, format_summary
+
+    report = update_comp_files(
+        find_comp_files(paths),
+        project_name=project_name,
+        dry_run=dry_run,
+        workers=workers,
+    )
+    if dry_run:
+        for result in report["files"]:
+            if result["diff"]:
+                print(result["diff"])
+    print(format_summary(report, dry_run=dry_run))
+
+    if report["errors"]:
+        raise SystemExit(1)
+
+
+@cli_main.command("relink-paths")
+@click_wrap.argument("paths", nargs=-1)
+@click_wrap.option(
+    "--project", "project_name", default=None,
+    help="Project name to map the anatomy roots of.")
+@click_wrap.option(
+    "--source-site", default=None,
+    help="Site of the current paths, to map its anatomy roots from.")
+@click_wrap.option(
+    "--destination-site", default=None,
+    help="Site of the new paths, to map the anatomy roots to.")
+@click_wrap.option(
+    "--platform", default=None,
+    help="Platform of the new paths, defaults to the current platform.")
+@click_wrap.option(
+    "--map", "extra_mappings", multiple=True,
+    help="Extra path mapping as 'source=destination'.")
+@click_wrap.option(
+    "--dry-run", is_flag=True, default=False,
+    help="Only print the changes, don't write the comp files.")
+@click_wrap.option(
+    "--no-verify", is_flag=True, default=False,
+    help="Skip reporting paths that can't be resolved after relink.")
+@click_wrap.option(
+    "--workers", type=int, default=None,
+    help="Amount of processes to read and write comp files with.")
+@click_wrap.option(
+    "--report", "report_path", default=None,
+    help="Write JSON report of all results to this path.")
+def relink_paths(
+    paths,
+    project_name,
+    source_site,
+    destination_site,
+    platform,
+    extra_mappings,
+    dry_run,
+    no_verify,
+    workers,
+    report_path,
+):
+    """Relink file paths in comp files to new project roots.
+
+    Paths can be comp files or directories to search for comp files.
+    """
+    from .comp_file import iter_comp_files
+    from .relink import (
+        relink_comp_files,
+        get_anatomy_root_mappings,
+        format_result,
+    )
+
+    mappings = []
+    if project_name:
+        mappings.extend(get_anatomy_root_mappings(
+            project_name, source_site, destination_site, platform
+        ))
+    for mapping in extra_mappings:
+        source, sep, destination = mapping.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid path mapping: {mapping}")
+        mappings.append((source, destination))
+    if not mappings:
+        raise ValueError("No path mappings to relink with.")
+
+    results = []
+    for result in relink_comp_files(
+        iter_comp_files(paths),
+        mappings,
+        dry_run=dry_run,
+        verify=not no_verify,
+        workers=workers,
+    ):
+        if dry_run and result["diff"]:
+            print(result["diff"])
+        print("\n".join(format_result(result)))
+        results.append(result)
+
+    relinked = [result for result in results if result["relinked"]]
+    unresolved = [result for result in results if result["unresolved"]]
+    failed = [result for result in results if result["error"]]
+    print(
+        f"{len(relinked)}/{len(results)} comp files "
+        f"{'to relink' if dry_run else 'relinked'}, "
+        f"{len(unresolved)} with unresolved paths, {len(failed)} failed."
+    )
+
+    if report_path:
+        with open(report_path, "w") as stream:
+            json.dump(results, stream, indent=4)
+
+    if failed:
+        raise SystemExit(1)
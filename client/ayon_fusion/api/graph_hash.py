@@ -0,0 +1,378 @@
+"""Hash the upstream graph of Savers to detect which frames changed.
+
+The hash of a frame covers everything that contributes to the frame
+rendered by a Saver: the settings of the Saver and its upstream tools, the
+values of their animated inputs at the frame and the state of the media
+files they read. Frames with an unchanged hash render the same result.
+
+When all tools of the graph are known to only change over time through
+their animated inputs, the frame number is not part of the hash.
+Consecutive frames with the same hash then render identical images, e.g. a
+slate or a hold.
+"""
+import os
+import re
+import hashlib
+
+from ayon_core.lib import Logger
+
+from ayon_fusion.api.lib import (
+    execute_lua,
+    get_frame_path,
+    iter_upstream,
+    lua_list,
+    lua_quote,
+    MOVIE_EXTENSIONS,
+)
+
+log = Logger.get_logger(__name__)
+
+GRAPH_DATA_KEY = "AYON.GraphHash.Data"
+
+# Tools reading other frames of their inputs, or simulating from the start
+# of the render, so their result at a frame depends on the whole range
+TIME_DEPENDENT_TOOL_IDS = {
+    "TimeSpeed",
+    "TimeStretcher",
+    "Trails",
+    "OpticalFlow",
+}
+PARTICLE_TOOL_ID_REGEX = re.compile(r"^p[A-Z]")
+
+# Tools of which the result only changes over time through their animated
+# inputs. Any other tool, e.g. a noise, a Custom tool using `time` or a 3D
+# mesh reading animated geometry, may change every frame. Loaders are only
+# the same every frame when they read a still image.
+STATIC_TOOL_IDS = {
+    # Generators, masks and text
+    "Background",
+    "BitmapMask",
+    "BSplineMask",
+    "EllipseMask",
+    "PolylineMask",
+    "RangesMask",
+    "RectangleMask",
+    "TextPlus",
+    "TriangleMask",
+    # Color
+    "AutoDomain",
+    "BrightnessContrast",
+    "ChangeDepth",
+    "ChannelBoolean",
+    "CineonLog",
+    "ColorCorrector",
+    "ColorCurves",
+    "ColorGain",
+    "FileLUT",
+    "GamutConvert",
+    "HueCurves",
+    "OCIOCDLTransform",
+    "OCIOColorSpace",
+    "OCIOFileTransform",
+    "SetDomain",
+    "WhiteBalance",
+    # Filters
+    "Blur",
+    "Defocus",
+    "DirectionalBlur",
+    "ErodeDilate",
+    "Filter",
+    "Glow",
+    "Sharpen",
+    "SoftGlow",
+    "UnsharpMask",
+    # Compositing and transforms
+    "BetterResize",
+    "CornerPositioner",
+    "Crop",
+    "Dissolve",
+    "DVE",
+    "Letterbox",
+    "MatteControl",
+    "Merge",
+    "PerspectivePositioner",
+    "PipeRouter",
+    "Scale",
+    "Transform",
+    "Underlay",
+    # I/O
+    "Loader",
+    "Saver",
+}
+
+# Collect the settings of the tools, the values of their animated inputs per
+# frame and the media files they read in a single remote call. Inputs are
+# animated when connected to a spline or modifier or driven by an
+# expression. When an animated value can't be compared, e.g. a mask's
+# polyline, the settings of the connected spline or modifier are used. The
+# output files of Savers are not media read by the graph.
+GRAPH_DATA_SCRIPT = """
+local names = {%s}
+local frame_start, frame_end = %d, %d
+local listed = {}
+local tools = {}
+for index, name in ipairs(names) do
+    listed[name] = true
+    tools[index] = comp:FindTool(name)
+end
+
+local result = {
+    ids = {}, animated = {}, files = {}, clips = {}, fallback = {}
+}
+local fallback_tools = {}
+for _, tool in ipairs(tools) do
+    result.ids[tool.Name] = tool.ID
+    for _, input in pairs(tool:GetInputList()) do
+        local id = input:GetAttrs().INPS_ID
+        local output = input:GetConnectedOutput()
+        local source = output and output:GetTool()
+        if (source and not listed[source.Name]) or input:GetExpression() then
+            local values = {}
+            local comparable = true
+            for frame = frame_start, frame_end do
+                local value = input[frame]
+                if type(value) == "userdata" then
+                    comparable = false
+                    break
+                end
+                if value == nil then
+                    value = false
+                end
+                values[frame - frame_start + 1] = value
+            end
+            if comparable then
+                table.insert(result.animated, {
+                    tool = tool.Name, input = id, values = values
+                })
+            elseif source then
+                table.insert(fallback_tools, source)
+            else
+                table.insert(result.fallback, input:GetExpression())
+            end
+        elseif tool.ID ~= "Saver" and string.find(id, "File") then
+            local value = input[TIME_UNDEFINED]
+            if type(value) == "string" and value ~= "" then
+                table.insert(result.files, value)
+            end
+        end
+    end
+    if tool.ID == "Loader" then
+        local clips = tool:GetAttrs().TOOLST_Clip_Name or {}
+        result.clips[tool.Name] = clips
+        for _, clip in pairs(clips) do
+            table.insert(result.files, clip)
+        end
+    end
+end
+
+local function strip(settings)
+    for _, tool_settings in pairs(settings.Tools or {}) do
+        tool_settings.ViewInfo = nil
+        tool_settings.CustomData = nil
+    end
+    return settings.Tools
+end
+result.settings = strip(comp:CopySettings(tools))
+if #fallback_tools > 0 then
+    table.insert(result.fallback, strip(comp:CopySettings(fallback_tools)))
+end
+comp:SetData(%s, result)
+"""
+
+
+def _update_hash(hasher, value):
+    """Update hash with value, with dictionaries in a stable order."""
+    if isinstance(value, dict):
+        hasher.update(b"{")
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode("utf-8"))
+            _update_hash(hasher, value[key])
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for item in value:
+            _update_hash(hasher, item)
+        hasher.update(b"]")
+    else:
+        hasher.update(repr(value).encode("utf-8"))
+
+
+def get_value_hash(value):
+    """Return a stable sha256 hex digest of a value received from Fusion."""
+    hasher = hashlib.sha256()
+    _update_hash(hasher, value)
+    return hasher.hexdigest()
+
+
+def is_time_dependent_tool(tool_id):
+    """Return whether the result of a tool depends on other frames."""
+    return bool(
+        tool_id in TIME_DEPENDENT_TOOL_IDS
+        or PARTICLE_TOOL_ID_REGEX.match(tool_id)
+    )
+
+
+def is_time_varying_tool(tool_id):
+    """Return whether the result of a tool may change without animation.
+
+    Only tools known to be static are not, see `STATIC_TOOL_IDS`.
+    """
+    return tool_id not in STATIC_TOOL_IDS
+
+
+def get_file_state(path, _listings=None):
+    """Return name, size and modification time of the files of a path.
+
+    For an image sequence the state of all files of the sequence is
+    returned, as the frame a Loader reads depends on its trim and hold
+    settings.
+
+    Args:
+        path (str): Absolute file path, frame numbers are detected like for
+            Saver paths.
+        _listings (Optional[dict]): Cache of folder listings.
+
+    Returns:
+        list[tuple[str, int, float]]: State of each file.
+
+    """
+    if _listings is None:
+        _listings = {}
+    directory, filename = os.path.split(path)
+    if directory not in _listings:
+        try:
+            _listings[directory] = {
+                entry.name: entry.stat()
+                for entry in os.scandir(directory)
+                if entry.is_file()
+            }
+        except OSError:
+            _listings[directory] = {}
+    listing = _listings[directory]
+
+    head, _, ext = get_frame_path(filename)
+    pattern = re.compile(
+        r"^{}\d+{}$".format(re.escape(head), re.escape(ext))
+    )
+    return [
+        (name, stat.st_size, stat.st_mtime)
+        for name, stat in sorted(listing.items())
+        if name == filename or pattern.match(name)
+    ]
+
+
+def get_saver_frame_hashes(saver, frame_start, frame_end):
+    """Return the hash per frame of the upstream graph of a Saver.
+
+    The upstream tools are found with `iter_upstream`. A frame's hash
+    changes when the settings of the Saver or an upstream tool change, when
+    an animated input has another value at that frame or when media read by
+    the tools changed on disk. When any upstream tool depends on other
+    frames, e.g. a TimeSpeed or particles, the values of all frames are
+    part of each frame's hash.
+
+    The frame number is not part of the hash only when all tools of the
+    graph are known to be static, see `is_time_varying_tool`, and Loaders
+    read still images.
+
+    Args:
+        saver (Tool): The Saver.
+        frame_start (int): First frame of the range.
+        frame_end (int): Last frame of the range.
+
+    Returns:
+        Optional[dict[int, str]]: Hash per frame, None when the graph could
+            not be read.
+
+    """
+    comp = saver.Composition
+    names = [saver.Name]
+    names.extend(tool.Name for tool in iter_upstream(saver))
+    data = execute_lua(
+        comp,
+        GRAPH_DATA_SCRIPT % (
+            ", ".join(lua_quote(name) for name in names),
+            frame_start,
+            frame_end,
+            lua_quote(GRAPH_DATA_KEY),
+        ),
+        result_key=GRAPH_DATA_KEY
+    )
+    if not data:
+        log.warning(f"Failed to read the upstream graph of {saver.Name}")
+        return None
+
+    listings = {}
+    files = sorted({
+        comp.MapPath(path) for path in lua_list(data.get("files"))
+    })
+    graph_hash = get_value_hash({
+        "settings": data.get("settings"),
+        "fallback": data.get("fallback"),
+        "files": [(path, get_file_state(path, listings)) for path in files],
+    })
+
+    animated = [
+        (item["tool"], item["input"], lua_list(item["values"]))
+        for item in lua_list(data.get("animated"))
+    ]
+    animated.sort(key=lambda item: item[:2])
+    tool_ids = (data.get("ids") or {}).values()
+    if any(is_time_dependent_tool(tool_id) for tool_id in tool_ids):
+        graph_hash = get_value_hash([graph_hash, animated])
+        animated = []
+
+    time_varying = any(is_time_varying_tool(tool_id) for tool_id in tool_ids)
+    for clips in (data.get("clips") or {}).values():
+        for clip in lua_list(clips):
+            # Only a Loader reading a still image is the same every frame
+            path = comp.MapPath(clip)
+            if (
+                os.path.splitext(path)[1].lower() in MOVIE_EXTENSIONS
+                or len(get_file_state(path, listings)) != 1
+            ):
+                time_varying = True
+
+    frame_hashes = {}
+    for index, frame in enumerate(range(frame_start, frame_end + 1)):
+        frame_values = [
+            (tool_name, input_id, values[index] if index < len(values)
+             else None)
+            for tool_name, input_id, values in animated
+        ]
+        frame_hashes[frame] = get_value_hash([
+            graph_hash, frame if time_varying else None, frame_values
+        ])
+    return frame_hashes
+
+
+def get_held_frame_spans(frame_hashes):
+    """Return spans of consecutive frames which render the same image.
+
+    >>> get_held_frame_spans({1: "a", 2: "a", 3: "b", 4: "c", 5: "c"})
+    [(1, 2), (4, 5)]
+
+    Args:
+        frame_hashes (dict[int, str]): Hash per frame, see
+            `get_saver_frame_hashes`.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive start and end frame of each span
+            of at least two frames.
+
+    """
+    spans = []
+    span_start = previous = None
+    for frame in sorted(frame_hashes):
+        if (
+            previous is None
+            or frame != previous + 1
+            or frame_hashes[frame] != frame_hashes[previous]
+        ):
+            if previous is not None and previous > span_start:
+                spans.append((span_start, previous))
+            span_start = frame
+        previous = frame
+    if previous is not None and previous > span_start:
+        spans.append((span_start, previous))
+    return spans
@@ -15,6 +15,14 @@ from ayon_core.pipeline.context_tools import (
 self = sys.modules[__name__]
 self._project = None
 
+# Fusion render flag to avoid Render Completed dialog to pop up after render
+# This also suppresses the render failed dialog.
+# See: https://www.steakunderwater.com/wesuckless/viewtopic.php?p=53312
+REQF_Quiet = 524288
+
+# Extensions of outputs and media stored as a single movie file
+MOVIE_EXTENSIONS = {".mov", ".mp4", ".avi", ".mxf"}
+
 
 def update_frame_range(start, end, comp=None, set_render_range=True,
                        handle_start=0, handle_end=0):
@@ -244,6 +252,138 @@ def maintained_comp_range(comp=None,
         comp.SetAttrs(preserve_attrs)
 
 
+@contextlib.contextmanager
+def enabled_savers(comp, savers):
+    """Enable only the `savers` in Comp during the context.
+
+    Any Saver tool in the passed composition that is not in the savers list
+    will be set to passthrough during the context.
+
+    Args:
+        comp (object): Fusion composition object.
+        savers (list): List of Saver tool objects.
+
+    """
+    passthrough_key = "TOOLB_PassThrough"
+    original_states = {}
+    enabled_saver_names = {saver.Name for saver in savers}
+
+    all_savers = comp.GetToolList(False, "Saver").values()
+    savers_by_name = {saver.Name: saver for saver in all_savers}
+
+    try:
+        for saver in all_savers:
+            original_state = saver.GetAttrs()[passthrough_key]
+            original_states[saver.Name] = original_state
+
+            # The passthrough state we want to set (passthrough != enabled)
+            state = saver.Name not in enabled_saver_names
+            if state != original_state:
+                saver.SetAttrs({passthrough_key: state})
+        yield
+    finally:
+        for saver_name, original_state in original_states.items():
+            saver = savers_by_name[saver_name]
+            saver.SetAttrs({"TOOLB_PassThrough": original_state})
+
+
+@contextlib.contextmanager
+def passthrough_tools(tools):
+    """Set the tools to passthrough during the context.
+
+    Args:
+        tools (list): List of tool objects.
+
+    """
+    passthrough_key = "TOOLB_PassThrough"
+    original_states = []
+    try:
+        for tool in tools:
+            original_state = tool.GetAttrs()[passthrough_key]
+            original_states.append((tool, original_state))
+            if not original_state:
+                tool.SetAttrs({passthrough_key: True})
+        yield
+    finally:
+        for tool, original_state in original_states:
+            if not original_state:
+                tool.SetAttrs({passthrough_key: original_state})
+
+
+@contextlib.contextmanager
+def preserve_inputs(tool, inputs):
+    """Preserve the tool's inputs after context"""
+
+    comp = tool.Comp()
+
+    values = {}
+    for name in inputs:
+        tool_input = getattr(tool, name)
+        value = tool_input[comp.TIME_UNDEFINED]
+        values[name] = value
+
+    try:
+        yield
+    finally:
+        for name, value in values.items():
+            tool_input = getattr(tool, name)
+            tool_input[comp.TIME_UNDEFINED] = value
+
+
+def loader_shift(loader, frame, relative=True):
+    """Shift global in time by i preserving duration
+
+    This moves the loader by i frames preserving global duration. When relative
+    is False it will shift the global in to the start frame.
+
+    Args:
+        loader (tool): The fusion loader tool.
+        frame (int): The amount of frames to move.
+        relative (bool): When True the shift is relative, else the shift will
+            change the global in to frame.
+
+    Returns:
+        int: The resulting relative frame change (how much it moved)
+
+    """
+    comp = loader.Comp()
+    time = comp.TIME_UNDEFINED
+
+    old_in = loader["GlobalIn"][time]
+    old_out = loader["GlobalOut"][time]
+
+    if relative:
+        shift = frame
+    else:
+        shift = frame - old_in
+
+    if not shift:
+        return 0
+
+    # Shifting global in will try to automatically compensate for the change
+    # in the "ClipTimeStart" and "HoldFirstFrame" inputs, so we preserve those
+    # input values to "just shift" the clip
+    with preserve_inputs(
+        loader,
+        inputs=[
+            "ClipTimeStart",
+            "ClipTimeEnd",
+            "HoldFirstFrame",
+            "HoldLastFrame",
+        ],
+    ):
+        # GlobalIn cannot be set past GlobalOut or vice versa
+        # so we must apply them in the order of the shift.
+        if shift > 0:
+            loader["GlobalOut"][time] = old_out + shift
+            loader["GlobalIn"][time] = old_in + shift
+        else:
+            loader["GlobalIn"][time] = old_in + shift
+            loader["GlobalOut"][time] = old_out + shift
+
+    return int(shift)
+
+
 def get_frame_path(path):
     """Get filename for the Fusion Saver with padded number as '#'
 
@@ -278,6 +418,57 @@ def get_frame_path(path):
     return filename, padding, ext
 
 
+def get_connected_input_tools(tool):
+    """Return the tools connected to the inputs of a tool."""
+    inputs = []
+
+    # Filter only to actual types that will have sensible upstream
+    # connections. So we ignore just "Number" inputs as they can be
+    # many to iterate, slowing things down quite a bit - and in practice
+    # they don't have upstream connections.
+    VALID_INPUT_TYPES = ['Image', 'Particles', 'Mask', 'DataType3D']
+    for type_ in VALID_INPUT_TYPES:
+        for input_ in tool.GetInputList(type_).values():
+            output = input_.GetConnectedOutput()
+            if output:
+                input_tool = output.GetTool()
+                inputs.append(input_tool)
+
+    return inputs
+
+
+def iter_upstream(tool):
+    """Yields all upstream inputs for the current tool.
+
+    Yields:
+        tool: The input tools.
+
+    """
+
+    # Initialize process queue with the node's inputs itself
+    queue = get_connected_input_tools(tool)
+
+    # We keep track of which node names we have processed so far, to ensure we
+    # don't process the same hierarchy again. We are not pushing the tool
+    # itself into the set as that doesn't correctly recognize the same tool.
+    # Since tool names are unique in a comp in Fusion we rely on that.
+    collected = set(tool.Name for tool in queue)
+
+    # Traverse upstream references for all nodes and yield them as we
+    # process the queue.
+    while queue:
+        upstream_tool = queue.pop()
+        yield upstream_tool
+
+        # Find upstream tools that are not collected yet.
+        upstream_inputs = get_connected_input_tools(upstream_tool)
+        upstream_inputs = [t for t in upstream_inputs if
+                           t.Name not in collected]
+
+        queue.extend(upstream_inputs)
+        collected.update(tool.Name for tool in upstream_inputs)
+
+
 def get_fusion_module():
     """Get current Fusion instance"""
     fusion = getattr(sys.modules["__main__"], "fusion", None)
@@ -298,6 +489,55 @@ def get_current_comp():
         return comp
 
 
+def lua_quote(value):
+    """Return value as double quoted Lua string literal."""
+    value = (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+    return f'"{value}"'
+
+
+def lua_list(value):
+    """Return Lua array received from Fusion as Python list.
+
+    Fusion converts Lua arrays to dictionaries with float keys `1.0, 2.0,
+    ...` when returned to Python.
+    """
+    if not value:
+        return []
+    if isinstance(value, dict):
+        return [value[key] for key in sorted(value)]
+    return list(value)
+
+
+def execute_lua(comp, script, result_key=None):
+    """Run a Lua script inside Fusion as a single remote call.
+
+    Each Python call on Fusion objects is a remote call, so operations on
+    many tools or inputs are much faster when done inside Fusion. A script
+    can return a value by storing it with `comp:SetData(result_key, value)`.
+
+    Args:
+        comp (Composition): The comp to run the script in.
+        script (str): Lua script, `comp` is available as global.
+        result_key (Optional[str]): Comp data key the script stores its
+            result in.
+
+    Returns:
+        Any: The result stored under `result_key`, if any.
+
+    """
+    comp.Execute(script)
+    if result_key is None:
+        return None
+    result = comp.GetData(result_key)
+    comp.SetData(result_key, None)
+    return result
+
+
 @contextlib.contextmanager
 def comp_lock_and_undo_chunk(
     comp,
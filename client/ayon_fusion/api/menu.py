@@ -16,9 +16,11 @@ from ayon_fusion.api.lib import (
 from ayon_core.pipeline import get_current_folder_path
 from ayon_core.resources import get_ayon_icon_filepath
 from ayon_core.tools.utils import get_qt_app
+from ayon_fusion.tracing import get_launch_tracer
 
 from .pipeline import FusionEventHandler
 from .pulse import FusionPulse
+from .worker import MenuCommandServer
 
 
 MENU_LABEL = os.environ["AYON_MENU_LABEL"]
@@ -129,6 +131,42 @@ class AYONMenu(QtWidgets.QWidget):
         self._event_handler = FusionEventHandler(parent=self)
         self._event_handler.start()
 
+        # Allow menu actions in Fusion to reuse this process instead of
+        # launching a new one for each action
+        self._command_server = MenuCommandServer(
+            {
+                "ping": lambda: None,
+                "menu": self.show_menu,
+                "workfiles": self.on_workfile_clicked,
+                "create": self.on_create_clicked,
+                "load": self.on_load_clicked,
+                "publish": self.on_publish_clicked,
+                "manage": self.on_manager_clicked,
+                "library": self.on_libload_clicked,
+                "set_frame_range": self.on_set_framerange_clicked,
+                "set_resolution": self.on_set_resolution_clicked,
+                "duplicate_with_inputs": (
+                    self.on_duplicate_with_inputs_clicked
+                ),
+            },
+            parent=self
+        )
+        self._command_server.start()
+        QtWidgets.QApplication.instance().aboutToQuit.connect(
+            self._command_server.stop
+        )
+
+    def show_menu(self):
+        """Show the menu and bring it to the front"""
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def run_command(self, command):
+        return self._command_server.run_command(command)
+
     def on_task_changed(self):
         # Update current context label
         label = get_current_folder_path()
@@ -174,16 +212,34 @@ class AYONMenu(QtWidgets.QWidget):
         set_current_context_framerange()
 
 
-def launch_ayon_menu():
-    app = get_qt_app()
+def launch_ayon_menu(command=None):
+    """Launch the AYON menu and keep the process running for the session.
+
+    The process stays alive when the menu window is closed so that later
+    menu actions can be sent to it (see `ayon_fusion.api.worker`). It exits
+    once Fusion is closed (see `FusionPulse`).
+
+    Args:
+        command (Optional[str]): Menu command to run once the menu has
+            started, e.g. "publish". Defaults to showing the menu.
+
+    """
+    tracer = get_launch_tracer()
+    with tracer.span("Show AYON menu", category="menu"):
+        app = get_qt_app()
+        app.setQuitOnLastWindowClosed(False)
+
+        ayon_menu = AYONMenu()
 
-    ayon_menu = AYONMenu()
+        stylesheet = load_stylesheet()
+        ayon_menu.setStyleSheet(stylesheet)
 
-    stylesheet = load_stylesheet()
-    ayon_menu.setStyleSheet(stylesheet)
+        ayon_menu.show()
+        self.menu = ayon_menu
+    tracer.flush()
 
-    ayon_menu.show()
-    self.menu = ayon_menu
+    if command and command != "menu":
+        QtCore.QTimer.singleShot(0, lambda: ayon_menu.run_command(command))
 
     result = app.exec_()
     print("Shutting down..")
@@ -3,7 +3,11 @@ Basic avalon integration
 """
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
+import threading
 import contextlib
 from pathlib import Path
 
@@ -48,9 +52,54 @@ _about_to_save = False
 
 
 class FusionLogHandler(logging.Handler):
+    """Log handler that prints records to the Fusion console.
+
+    Every `fusion.Print` call is a remote call to the Fusion process, so
+    instead of printing each record directly the formatted entries are put
+    on a queue and a background thread flushes them in batches. A batch is
+    flushed whenever `flush_interval` seconds have passed or `batch_size`
+    entries are waiting, whichever comes first.
+
+    To avoid flooding the console on very verbose publishes at most
+    `rate_limit` entries are printed per second; entries beyond that are
+    dropped and a summary with the amount of dropped entries is printed
+    instead. Set `rate_limit` to 0 to disable rate limiting.
+
+    When Fusion (or the comp) is not available anymore to print to the
+    entries are written to `sys.stderr` instead.
+
+    """
     # Keep a reference to fusion's Print function (Remote Object)
     _print = None
 
+    def __init__(self, level=logging.NOTSET,
+                 flush_interval=None,
+                 batch_size=None,
+                 rate_limit=None):
+        super().__init__(level=level)
+        if flush_interval is None:
+            flush_interval = int(
+                os.environ.get("AYON_FUSION_LOG_FLUSH_INTERVAL", 250)
+            ) / 1000.0
+        if batch_size is None:
+            batch_size = int(os.environ.get("AYON_FUSION_LOG_BATCH_SIZE", 100))
+        if rate_limit is None:
+            rate_limit = int(os.environ.get("AYON_FUSION_LOG_RATE_LIMIT", 500))
+
+        self.flush_interval = flush_interval
+        self.batch_size = max(batch_size, 1)
+        self.rate_limit = rate_limit
+
+        self._queue = queue.Queue()
+        self._flush_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._dropped = 0
+        self._rate_window_start = time.monotonic()
+        self._rate_window_count = 0
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        atexit.register(self.close)
+
     @property
     def print(self):
         if self._print is not None:
@@ -67,8 +116,115 @@ class FusionLogHandler(logging.Handler):
         return _print
 
     def emit(self, record):
-        entry = self.format(record)
-        self.print(entry)
+        try:
+            entry = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if self._stopped.is_set():
+            # Handler was closed, print directly instead
+            self._write([entry])
+            return
+
+        self._ensure_thread()
+        self._queue.put(entry)
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Request the background thread to print all queued entries."""
+        self._flush_requested.set()
+
+    def close(self):
+        """Stop the background thread and print remaining entries."""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._flush_requested.set()
+            thread = self._thread
+            if (
+                thread is not None
+                and thread is not threading.current_thread()
+            ):
+                thread.join(timeout=max(self.flush_interval * 4, 1.0))
+            # Print anything that was queued after the thread stopped
+            self._process_batch(self._drain())
+        super().close()
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._run,
+                name="FusionLogHandler",
+                daemon=True
+            )
+            thread.start()
+            self._thread = thread
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            self._process_batch(self._drain())
+
+        self._process_batch(self._drain())
+
+    def _drain(self):
+        entries = []
+        while True:
+            try:
+                entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                return entries
+
+    def _process_batch(self, entries):
+        if not entries and not self._dropped:
+            return
+
+        if self.rate_limit > 0:
+            now = time.monotonic()
+            if now - self._rate_window_start >= 1.0:
+                self._rate_window_start = now
+                self._rate_window_count = 0
+
+            allowed = max(self.rate_limit - self._rate_window_count, 0)
+            if len(entries) > allowed:
+                self._dropped += len(entries) - allowed
+                entries = entries[:allowed]
+            self._rate_window_count += len(entries)
+
+            if self._dropped and allowed > len(entries):
+                # We're allowed to print again so report what was dropped
+                entries.append(
+                    "[Log rate limit] Dropped {} log entries\n".format(
+                        self._dropped
+                    )
+                )
+                self._dropped = 0
+
+        if entries:
+            self._write(entries)
+
+    def _write(self, entries):
+        text = "".join(entries)
+        try:
+            self.print(text)
+            return
+        except Exception:
+            # Fusion or the comp may have been closed, in which case the
+            # remote print function is invalid. Reset so we try to resolve
+            # it again on the next batch.
+            self._print = None
+
+        try:
+            sys.stderr.write(text)
+            sys.stderr.flush()
+        except Exception:
+            pass
 
 
 class FusionHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
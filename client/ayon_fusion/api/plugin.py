@@ -1,10 +1,11 @@
 from copy import deepcopy
 import os
+import re
+import json
+import hashlib
 
-from ayon_fusion.api import (
-    get_current_comp,
-    comp_lock_and_undo_chunk,
-)
+from ayon_fusion.api import comp_lock_and_undo_chunk
+from ayon_fusion.api.lib import get_frame_path
 
 from ayon_core.lib import (
     BoolDef,
@@ -16,9 +17,257 @@ from ayon_core.pipeline import (
     AVALON_INSTANCE_ID,
     AYON_INSTANCE_ID,
 )
+from ayon_core.pipeline.colorspace import get_imageio_file_rules
+from ayon_core.pipeline.publish import ColormanagedPyblishPluginMixin
 from ayon_core.pipeline.template_data import get_template_data
 from ayon_core.pipeline.workfile import get_workdir
 
+# Saver inputs of the EXR creator attributes with the input values per
+# attribute value. The "default" value resets the input to Fusion's default.
+EXR_COMPRESSION_VALUES = {
+    "default": None,
+    "none": 0,
+    "rle": 1,
+    "zip1": 2,
+    "zip16": 3,
+    "piz": 4,
+    "pxr24": 5,
+    "b44": 6,
+    "b44a": 7,
+    "dwaa": 8,
+    "dwab": 9,
+}
+EXR_DEPTH_VALUES = {
+    "default": None,
+    "half": 1,
+    "float": 2,
+}
+SAVER_FORMAT_OPTIONS = {
+    "exr": {
+        "exr_compression": (
+            "OpenEXRFormat.Compression", EXR_COMPRESSION_VALUES
+        ),
+        "exr_depth": ("OpenEXRFormat.Depth", EXR_DEPTH_VALUES),
+    },
+}
+
+
+def set_saver_format_options(tool, image_format, options):
+    """Set file format inputs of a Saver.
+
+    Args:
+        tool (Tool): The Saver.
+        image_format (str): The Saver's output extension, e.g. "exr".
+        options (dict[str, str]): Option values by attribute name, e.g.
+            {"exr_compression": "dwaa", "exr_depth": "half"}.
+
+    """
+    format_options = SAVER_FORMAT_OPTIONS.get(image_format, {})
+    for key, (input_name, values) in format_options.items():
+        value = values.get(options.get(key, "default"))
+        if value is None:
+            value = _get_input_default(tool, input_name)
+        if value is not None:
+            tool.SetInput(input_name, value)
+
+
+def _get_input_default(tool, input_id):
+    """Return Fusion's default value of a tool's number input."""
+    for tool_input in tool.GetInputList().values():
+        attrs = tool_input.GetAttrs()
+        if attrs.get("INPS_ID") == input_id:
+            return attrs.get("INPN_Default")
+    return None
+
+
+# Tool data key linking the review Saver and its Scale tool to the instance
+# Saver, see `CreateSaver`
+REVIEW_SAVER_DATA_KEY = "ayon_review"
+
+
+def get_review_tools(saver):
+    """Return review Saver and Scale tool linked to an instance Saver.
+
+    Returns:
+        tuple[Optional[Tool], Optional[Tool]]: The review Saver and the
+            Scale tool, None if they don't exist.
+
+    """
+    comp = saver.Composition
+    tools = []
+    for key in ("saver", "scale"):
+        name = saver.GetData(f"{REVIEW_SAVER_DATA_KEY}.{key}")
+        tools.append(comp.FindTool(name) if name else None)
+    return tuple(tools)
+
+
+def get_review_expected_files(review_saver, frame_start, frame_end):
+    """Return files the review Saver renders for the frame range."""
+    comp = review_saver.Composition
+    path = comp.MapPath(review_saver["Clip"][comp.TIME_UNDEFINED])
+    head, padding, ext = get_frame_path(path)
+    if ext.lower() == ".mov":
+        return [path]
+    return [
+        f"{head}{str(frame).zfill(padding)}{ext}"
+        for frame in range(frame_start, frame_end + 1)
+    ]
+
+
+def get_review_saver_representation(instance):
+    """Return review representation of the instance's review Saver.
+
+    Returns:
+        Optional[dict]: Representation of the review Saver output, None
+            when the instance has no review Saver or its files don't exist.
+
+    """
+    review_saver = instance.data.get("reviewSaver")
+    if not review_saver:
+        return None
+
+    start = instance.data["frameStartHandle"]
+    end = instance.data["frameEndHandle"]
+    expected_files = get_review_expected_files(review_saver, start, end)
+    if not all(os.path.exists(path) for path in expected_files):
+        return None
+
+    files = [os.path.basename(path) for path in expected_files]
+    if len(files) == 1:
+        files = files[0]
+    _, padding, ext = get_frame_path(expected_files[0])
+    return {
+        "name": "review",
+        "ext": ext[1:],
+        "frameStart": f"%0{padding}d" % start,
+        "files": files,
+        "stagingDir": os.path.dirname(expected_files[0]),
+        # Only used as source of the review, not integrated itself
+        "tags": ["review", "delete"],
+    }
+
+
+class FusionColormanagedPluginMixin(ColormanagedPyblishPluginMixin):
+    """Colormanaged publish plugin mixin which caches resolved colorspaces.
+
+    Savers usually render into the same file path layout which only differs
+    by product name, e.g. `renders/fusion/{product}/{product}.####.exr`.
+    Instead of evaluating the file rules and OCIO config for each of them
+    the resolved colorspace data is cached for the publish by that layout,
+    i.e. the file path with the product name and frame number masked, and
+    the imageio settings.
+
+    The layout is only used when no file rule matches differently with the
+    product name masked, so a rule matching product names still resolves
+    each product on its own file path. File rules of the OCIO config are
+    assumed not to match product names.
+    """
+
+    colorspace_cache_key = "fusionColorspaceCache"
+    product_name_mask = "{product}"
+
+    def set_representation_colorspace_cached(self, representation, instance):
+        """Set colorspace data on representation, cached per publish.
+
+        Args:
+            representation (dict): Representation with "ext" and
+                "stagingDir".
+            instance (pyblish.api.Instance): The instance of the
+                representation.
+
+        """
+        context = instance.context
+        cache = context.data.get(self.colorspace_cache_key)
+        if cache is None:
+            cache = {
+                "settings_hash": self._get_imageio_settings_hash(context),
+                "file_rules": self._get_file_rules(context),
+                "entries": {},
+                "hits": 0,
+                "misses": 0,
+            }
+            context.data[self.colorspace_cache_key] = cache
+
+        key = (
+            self._get_colorspace_cache_path(
+                representation,
+                instance.data.get("productName"),
+                cache["file_rules"],
+            ),
+            cache["settings_hash"],
+        )
+        if key in cache["entries"]:
+            cache["hits"] += 1
+            colorspace_data = cache["entries"][key]
+            if colorspace_data is not None:
+                representation["colorspaceData"] = deepcopy(colorspace_data)
+        else:
+            cache["misses"] += 1
+            self.set_representation_colorspace(
+                representation=representation,
+                context=context,
+            )
+            cache["entries"][key] = deepcopy(
+                representation.get("colorspaceData")
+            )
+
+        self.log.debug(
+            "Colorspace cache {} hits, {} misses".format(
+                cache["hits"], cache["misses"]
+            )
+        )
+
+    @classmethod
+    def _get_colorspace_cache_path(
+        cls, representation, product_name, file_rules
+    ):
+        """Return first file path of representation to cache by.
+
+        The frame number is masked. The product name is masked too unless
+        a file rule matches the masked path differently.
+        """
+        filename = representation["files"]
+        if isinstance(filename, (list, tuple)):
+            filename = filename[0]
+        head, padding, ext = get_frame_path(filename)
+        if f"{head}{ext}" != filename:
+            filename = "{}{}{}".format(head, "#" * padding, ext)
+        path = os.path.join(
+            os.path.normpath(representation["stagingDir"]), filename
+        )
+        if not product_name:
+            return path
+
+        masked_path = path.replace(product_name, cls.product_name_mask)
+        for file_rule in file_rules:
+            pattern = file_rule["pattern"]
+            try:
+                matches = bool(re.search(pattern, path))
+                masked_matches = bool(re.search(pattern, masked_path))
+            except re.error:
+                return path
+            if matches != masked_matches:
+                return path
+        return masked_path
+
+    @staticmethod
+    def _get_file_rules(context):
+        return get_imageio_file_rules(
+            context.data["projectName"],
+            "fusion",
+            project_settings=context.data.get("project_settings"),
+        ) or []
+
+    @staticmethod
+    def _get_imageio_settings_hash(context):
+        project_settings = context.data.get("project_settings") or {}
+        imageio_settings = {
+            "core": project_settings.get("core", {}).get("imageio"),
+            "fusion": project_settings.get("fusion", {}).get("imageio"),
+        }
+        payload = json.dumps(imageio_settings, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 class GenericCreateSaver(Creator):
     default_variants = ["Main", "Mask"]
@@ -32,6 +281,8 @@ class GenericCreateSaver(Creator):
     settings_category = "fusion"
 
     image_format = "exr"
+    exr_compression = "default"
+    exr_depth = "default"
 
     # TODO: This should be renamed together with Nuke so it is aligned
     temp_rendering_path_template = (
@@ -54,7 +305,7 @@ class GenericCreateSaver(Creator):
             creator=self,
         )
         data = instance.data_to_store()
-        comp = get_current_comp()
+        comp = self.create_context.host.get_current_comp()
         with comp_lock_and_undo_chunk(comp):
             args = (-32768, -32768)  # Magical position numbers
             saver = comp.AddTool("Saver", *args)
@@ -72,7 +323,7 @@ class GenericCreateSaver(Creator):
         return instance
 
     def collect_instances(self):
-        comp = get_current_comp()
+        comp = self.create_context.host.get_current_comp()
         tools = comp.GetToolList(False, "Saver").values()
         for tool in tools:
             data = self.get_managed_tool_data(tool)
@@ -138,6 +389,13 @@ class GenericCreateSaver(Creator):
         ):
             self._configure_saver_tool(data, tool, product_name)
 
+        elif any(
+            tool.GetData(f"openpype.creator_attributes.{key}")
+            != data["creator_attributes"].get(key)
+            for key in ("exr_compression", "exr_depth")
+        ):
+            self._configure_saver_format_options(data, tool)
+
     def _configure_saver_tool(self, data, tool, product_name):
         formatting_data = deepcopy(data)
 
@@ -217,14 +475,22 @@ class GenericCreateSaver(Creator):
 
         filepath = temp_rendering_path_template.format(**formatting_data)
 
-        comp = get_current_comp()
+        comp = self.create_context.host.get_current_comp()
         tool["Clip"] = comp.ReverseMapPath(os.path.normpath(filepath))
 
+        self._configure_saver_format_options(data, tool)
+
         # Rename tool
         if tool.Name != product_name:
             print(f"Renaming {tool.Name} -> {product_name}")
             tool.SetAttrs({"TOOLS_Name": product_name})
 
+    def _configure_saver_format_options(self, data, tool):
+        creator_attributes = data["creator_attributes"]
+        set_saver_format_options(
+            tool, creator_attributes["image_format"], creator_attributes
+        )
+
     def get_managed_tool_data(self, tool):
         """Return data of the tool if it matches creator identifier"""
         data = tool.GetData("openpype")
@@ -286,3 +552,37 @@ class GenericCreateSaver(Creator):
             default=self.image_format,
             label="Output Image Format",
         )
+
+    def _get_exr_options_defs(self):
+        return [
+            EnumDef(
+                "exr_compression",
+                items={
+                    "default": "Saver default",
+                    "none": "None",
+                    "rle": "RLE",
+                    "zip1": "ZIP (1 line)",
+                    "zip16": "ZIP (16 lines)",
+                    "piz": "PIZ",
+                    "pxr24": "PXR24",
+                    "b44": "B44",
+                    "b44a": "B44A",
+                    "dwaa": "DWAA",
+                    "dwab": "DWAB",
+                },
+                default=self.exr_compression,
+                label="EXR Compression",
+                tooltip="Only used for exr output.",
+            ),
+            EnumDef(
+                "exr_depth",
+                items={
+                    "default": "Saver default",
+                    "half": "Half float (16 bit)",
+                    "float": "Float (32 bit)",
+                },
+                default=self.exr_depth,
+                label="EXR Depth",
+                tooltip="Only used for exr output.",
+            ),
+        ]
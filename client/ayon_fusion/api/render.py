@@ -0,0 +1,807 @@
+"""Helpers to render Savers of the current comp locally."""
+import os
+import json
+import time
+import shutil
+import statistics
+import tempfile
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from ayon_core.lib import Logger
+
+from ayon_fusion.api.lib import (
+    get_frame_path,
+    iter_upstream,
+    MOVIE_EXTENSIONS,
+)
+
+
+def get_saver_output_path(saver):
+    """Return the absolute output path of a Saver with PathMaps resolved."""
+    comp = saver.Composition
+    return comp.MapPath(saver["Clip"][comp.TIME_UNDEFINED])
+
+
+def get_saver_frame_paths(saver, frame_start, frame_end):
+    """Return the output path per frame of a Saver.
+
+    Movie outputs are rendered as a single file, which can't be rendered
+    partially.
+
+    Returns:
+        Optional[dict[int, str]]: Output path per frame, None when the
+            Saver renders a single movie file.
+
+    """
+    path = get_saver_output_path(saver)
+    head, padding, ext = get_frame_path(path)
+    if ext.lower() in MOVIE_EXTENSIONS:
+        return None
+    return {
+        frame: f"{head}{str(frame).zfill(padding)}{ext}"
+        for frame in range(frame_start, frame_end + 1)
+    }
+
+
+def get_frame_ranges(frames):
+    """Return sorted frames as list of inclusive (start, end) ranges.
+
+    >>> get_frame_ranges([1, 2, 3, 5, 7, 8])
+    [(1, 3), (5, 5), (7, 8)]
+
+    """
+    ranges = []
+    for frame in sorted(frames):
+        if ranges and ranges[-1][1] == frame - 1:
+            ranges[-1] = (ranges[-1][0], frame)
+        else:
+            ranges.append((frame, frame))
+    return ranges
+
+
+def get_sequence_key(path):
+    """Return a key identifying the file or image sequence of a path.
+
+    >>> get_sequence_key("/renders/precomp.1001.exr")
+    ('/renders', 'precomp.', '.exr')
+
+    """
+    directory, filename = os.path.split(os.path.normpath(path))
+    head, _, ext = get_frame_path(filename)
+    return os.path.normcase(directory), os.path.normcase(head), ext.lower()
+
+
+def get_precomp_dependencies(comp, savers):
+    """Return the precomp Savers the Savers read through Loaders.
+
+    A Saver depends on another Saver when a Loader upstream of it reads the
+    other Saver's output. Precomp Savers which are not in `savers` are
+    included with their own dependencies, unless they are set to
+    passthrough.
+
+    Args:
+        comp (Composition): The comp of the Savers.
+        savers (list[Tool]): The Savers to render.
+
+    Returns:
+        tuple[dict[str, set[str]], dict[str, Tool]]: Names of the Savers
+            each Saver depends on and the Savers by name.
+
+    """
+    savers_by_name = {saver.Name: saver for saver in savers}
+    savers_by_key = {}
+    for saver in comp.GetToolList(False, "Saver").values():
+        if (
+            saver.Name in savers_by_name
+            or not saver.GetAttrs()["TOOLB_PassThrough"]
+        ):
+            key = get_sequence_key(get_saver_output_path(saver))
+            savers_by_key[key] = saver
+
+    dependencies = {}
+    queue = list(savers)
+    while queue:
+        saver = queue.pop()
+        if saver.Name in dependencies:
+            continue
+        dependencies[saver.Name] = set()
+        for tool in iter_upstream(saver):
+            if tool.ID != "Loader":
+                continue
+            clip = tool["Clip"][comp.TIME_UNDEFINED]
+            if not clip:
+                continue
+            source = savers_by_key.get(get_sequence_key(comp.MapPath(clip)))
+            if source is None or source.Name == saver.Name:
+                continue
+            dependencies[saver.Name].add(source.Name)
+            savers_by_name.setdefault(source.Name, source)
+            queue.append(source)
+
+    return dependencies, savers_by_name
+
+
+def get_render_levels(dependencies):
+    """Return Saver names in levels which only depend on earlier levels.
+
+    The Savers of a level don't depend on each other, so they render
+    together in the same render. Savers in a dependency cycle can't be
+    ordered and are rendered together in the last level.
+
+    >>> get_render_levels({"comp": {"pre"}, "pre": set(), "bg": set()})
+    [['bg', 'pre'], ['comp']]
+
+    Args:
+        dependencies (dict[str, set[str]]): Names of the Savers each Saver
+            depends on, see `get_precomp_dependencies`.
+
+    Returns:
+        list[list[str]]: Saver names per level.
+
+    """
+    remaining = {
+        name: set(depends_on) & set(dependencies)
+        for name, depends_on in dependencies.items()
+    }
+    levels = []
+    while remaining:
+        level = sorted(
+            name for name, depends_on in remaining.items() if not depends_on
+        )
+        if not level:
+            level = sorted(remaining)
+        levels.append(level)
+        for name in level:
+            remaining.pop(name)
+        for depends_on in remaining.values():
+            depends_on.difference_update(level)
+    return levels
+
+
+class RenderJournal:
+    """Journal of the verified rendered frames of a Saver.
+
+    The journal is stored next to the Saver's output and records the size,
+    modification time and upstream graph hash of each rendered frame. When
+    loaded, frames of which the graph hash differs or which changed on disk
+    since are invalidated. So a render interrupted by e.g. a crash of Fusion
+    continues with only the missing frames, and only frames of which the
+    upstream graph changed are rendered again. The journal also records
+    whether the render finished, so a finished render can be rendered again
+    in full.
+
+    Args:
+        path (str): Path of the journal file.
+        frame_paths (dict[int, str]): Output path per frame.
+        frame_hashes (dict[int, str]): Graph hash per frame, see
+            `get_saver_frame_hashes`.
+
+    """
+
+    version = 3
+
+    def __init__(self, path, frame_paths, frame_hashes):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self.path = path
+        self.frame_paths = frame_paths
+        self.frame_hashes = frame_hashes
+        self.frames = {}
+        self._previous_records = {}
+        self._dirty = False
+
+    @classmethod
+    def for_saver(cls, saver, frame_paths, frame_hashes):
+        """Return the unloaded journal of a Saver next to its frames."""
+        first_path = frame_paths[min(frame_paths)]
+        head, _, _ = get_frame_path(os.path.basename(first_path))
+        path = os.path.join(
+            os.path.dirname(first_path),
+            ".{}.journal.json".format(head.rstrip("._") or saver.Name),
+        )
+        return cls(path, frame_paths, frame_hashes)
+
+    def load(self, reuse_finished=True):
+        """Load the frames of the journal that are still valid.
+
+        Args:
+            reuse_finished (bool): Load the frames of a finished render,
+                otherwise only frames of an interrupted render are loaded.
+
+        Returns:
+            int: Amount of invalidated frames.
+
+        """
+        self.frames = {}
+        invalidated = self._load_frames(reuse_finished)
+        self._snapshot_missing_frames()
+        return invalidated
+
+    def _load_frames(self, reuse_finished):
+        try:
+            with open(self.path, "r") as stream:
+                data = json.load(stream)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError):
+            self.log.warning(f"Ignoring unreadable journal: {self.path}")
+            return 0
+
+        recorded = data.get("frames", {})
+        if data.get("version") != self.version:
+            return len(recorded)
+        if data.get("finished") and not reuse_finished:
+            self.log.debug(f"Ignoring journal of finished render: {self.path}")
+            return 0
+
+        invalidated = 0
+        for frame, record in recorded.items():
+            frame = int(frame)
+            path = self.frame_paths.get(frame)
+            if path is None:
+                # Frame outside of the frame range, keep it as it was
+                self.frames[frame] = record
+            elif (
+                record.get("hash") == self.frame_hashes.get(frame)
+                and self._get_record(path) == {
+                    "size": record.get("size"), "mtime": record.get("mtime")
+                }
+            ):
+                self.frames[frame] = record
+            else:
+                invalidated += 1
+        return invalidated
+
+    def _snapshot_missing_frames(self):
+        # Existing files of missing frames are from an earlier render, they
+        # are only recorded once they were written again
+        self._previous_records = {
+            frame: self._get_record(self.frame_paths[frame])
+            for frame in self.get_missing_frames()
+        }
+
+    @staticmethod
+    def _get_record(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not stat.st_size:
+            return None
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def get_missing_frames(self):
+        """Return the frames of the frame range that are not rendered."""
+        return [
+            frame for frame in sorted(self.frame_paths)
+            if frame not in self.frames
+        ]
+
+    def record_frames(self, frame_end=None):
+        """Record the frames of the frame range rendered since loading.
+
+        Args:
+            frame_end (Optional[int]): Only record frames up to this frame,
+                e.g. the last frame Fusion finished rendering.
+
+        Returns:
+            int: Amount of newly recorded frames.
+
+        """
+        recorded = 0
+        for frame in self.get_missing_frames():
+            if frame_end is not None and frame > frame_end:
+                break
+            record = self._get_record(self.frame_paths[frame])
+            if (
+                record is not None
+                and record != self._previous_records.get(frame)
+            ):
+                record["hash"] = self.frame_hashes.get(frame)
+                self.frames[frame] = record
+                recorded += 1
+        self._dirty = self._dirty or bool(recorded)
+        return recorded
+
+    def save(self):
+        """Write the journal, when changed, replacing it atomically."""
+        if not self._dirty:
+            return
+        data = {
+            "version": self.version,
+            "finished": not self.get_missing_frames(),
+            "frames": {
+                str(frame): record
+                for frame, record in sorted(self.frames.items())
+            },
+        }
+        tmp = f"{self.path}.partial"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(tmp, "w") as stream:
+            json.dump(data, stream, indent=1)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def link_frame(src, dst):
+    """Hardlink a rendered frame to another frame's path, or copy it.
+
+    Returns:
+        bool: Whether the frame was hardlinked.
+
+    """
+    tmp = f"{dst}.partial"
+    try:
+        os.link(src, tmp)
+        linked = True
+    except OSError:
+        shutil.copyfile(src, tmp)
+        linked = False
+    os.replace(tmp, dst)
+    return linked
+
+
+def unlink_shared_frames(paths):
+    """Remove frames hardlinked to other files before rendering them.
+
+    Fusion may write into the existing file of a frame, which would also
+    change all frames hardlinked to it by `link_frame` and published frames
+    hardlinked to it by `PrepareFramesHardlinks`.
+    """
+    for path in paths:
+        try:
+            if os.stat(path).st_nlink > 1:
+                os.remove(path)
+        except FileNotFoundError:
+            continue
+
+
+@contextlib.contextmanager
+def redirected_savers(comp, savers, scratch_root):
+    """Render the Savers into a local scratch folder during the context.
+
+    Args:
+        comp (Composition): The comp of the Savers.
+        savers (list[Tool]): Savers to redirect.
+        scratch_root (str): Local folder to create the scratch folders in.
+
+    Yields:
+        dict[str, dict]: Per Saver name its "scratch_dir" and the
+            "output_dir" of its original output path.
+
+    """
+    os.makedirs(scratch_root, exist_ok=True)
+    original_clips = {}
+    outputs = {}
+    try:
+        for saver in savers:
+            clip = saver["Clip"][comp.TIME_UNDEFINED]
+            output_path = comp.MapPath(clip)
+            scratch_dir = tempfile.mkdtemp(
+                prefix=f"{saver.Name}_", dir=scratch_root
+            )
+            original_clips[saver.Name] = (saver, clip)
+            outputs[saver.Name] = {
+                "scratch_dir": scratch_dir,
+                "output_dir": os.path.dirname(output_path),
+            }
+            saver["Clip"] = os.path.join(
+                scratch_dir, os.path.basename(output_path)
+            )
+        yield outputs
+    finally:
+        for saver, clip in original_clips.values():
+            saver["Clip"] = clip
+
+
+class StreamingFrameCopier:
+    """Copy rendered frames from scratch folders while the render runs.
+
+    A background thread polls the scratch folders and copies each frame
+    once its size and modification time stopped changing. When the render
+    finished all remaining frames are copied and the size of every copied
+    frame is verified against its scratch frame.
+
+    Args:
+        outputs (dict[str, dict]): Scratch and output dirs per Saver, as
+            yielded by `redirected_savers`.
+        workers (int): Amount of threads copying frames.
+        poll_interval (float): Seconds between polling the scratch folders.
+
+    """
+
+    def __init__(self, outputs, workers=4, poll_interval=0.5):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._outputs = outputs
+        self._poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._states = {}
+        self._futures = {}
+        self._start_time = None
+
+    def start(self):
+        self._start_time = time.time()
+        for output in self._outputs.values():
+            os.makedirs(output["output_dir"], exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="StreamingFrameCopier", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.wait(self._poll_interval):
+            try:
+                self._poll(final=False)
+            except OSError:
+                self.log.warning("Failed to poll scratch folders",
+                                 exc_info=True)
+
+    def _iter_scratch_files(self):
+        for output in self._outputs.values():
+            for entry in os.scandir(output["scratch_dir"]):
+                if entry.is_file():
+                    yield (
+                        entry.path,
+                        os.path.join(output["output_dir"], entry.name),
+                        entry.stat(),
+                    )
+
+    def _poll(self, final):
+        for src, dst, stat in self._iter_scratch_files():
+            if src in self._futures:
+                continue
+            state = (stat.st_size, stat.st_mtime)
+            # The frame is considered complete when it did not change since
+            # the last poll, or when the render finished
+            if final or self._states.get(src) == state:
+                self._futures[src] = self._executor.submit(
+                    self._copy, src, dst
+                )
+            else:
+                self._states[src] = state
+
+    @staticmethod
+    def _copy(src, dst):
+        tmp = f"{dst}.partial"
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+        return os.path.getsize(dst)
+
+    def finish(self):
+        """Copy remaining frames and verify all copied frames.
+
+        Returns:
+            dict: Report with "files", "bytes", "seconds", "recopied" and
+                "errors".
+
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._poll(final=True)
+
+        errors = []
+        recopied = 0
+        total_bytes = 0
+        for src, future in self._futures.items():
+            exc = future.exception()
+            if exc is not None:
+                errors.append(f"{src}: {exc}")
+        self._executor.shutdown(wait=True)
+
+        # Verify sizes, a frame may have been copied while still written
+        for src, dst, stat in self._iter_scratch_files():
+            try:
+                if os.path.getsize(dst) != stat.st_size:
+                    self._copy(src, dst)
+                    recopied += 1
+                if os.path.getsize(dst) != stat.st_size:
+                    errors.append(f"{dst}: Size differs from {src}")
+                total_bytes += stat.st_size
+            except OSError as exc:
+                errors.append(f"{dst}: {exc}")
+
+        return {
+            "files": len(self._futures),
+            "bytes": total_bytes,
+            "seconds": time.time() - self._start_time,
+            "recopied": recopied,
+            "errors": errors,
+        }
+
+    def cleanup(self):
+        """Remove the scratch folders."""
+        for output in self._outputs.values():
+            shutil.rmtree(output["scratch_dir"], ignore_errors=True)
+
+
+class RenderDriver:
+    """Render a frame range of a comp without blocking on the render.
+
+    The render is started with `Wait: False` and the comp is polled for
+    its render state, so progress can be reported per frame and the render
+    can be aborted with `comp.AbortRender()`. The render time per frame is
+    the frame time Fusion reports when a single frame finished since the
+    last poll. Otherwise the time since the previous finished frame is
+    shared equally by the frames finished within the poll. The time before
+    the first frame, e.g. to prepare the tools, is recorded as startup time.
+    When the first frame's time can't be told apart from it, no time is
+    recorded for the first frame.
+
+    Args:
+        comp (Composition): The comp to render.
+        frame_start (int): First frame to render.
+        frame_end (int): Last frame to render.
+        render_flags (Optional[int]): Fusion render flags.
+        poll_interval (float): Seconds between polling the render state.
+        progress_callback (Optional[Callable]): Called with the last
+            rendered frame, the amount of rendered frames, the total amount
+            of frames and the elapsed seconds whenever a frame finished.
+        idle_callback (Optional[Callable]): Called on each poll, e.g. to
+            process UI events. When it returns True the render is aborted.
+        timeout (Optional[float]): Seconds after which the render is
+            aborted.
+        frame_exists_callback (Optional[Callable]): Called with a frame to
+            check whether its output was written. Fusion keeps reporting
+            the last rendered frame of a previous render, so a single frame
+            render of that same frame is only successful when its output
+            exists.
+
+    """
+
+    def __init__(
+        self,
+        comp,
+        frame_start,
+        frame_end,
+        render_flags=None,
+        poll_interval=0.5,
+        progress_callback=None,
+        idle_callback=None,
+        timeout=None,
+        frame_exists_callback=None,
+    ):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._comp = comp
+        self._frame_start = frame_start
+        self._frame_end = frame_end
+        self._render_flags = render_flags
+        self._poll_interval = poll_interval
+        self._progress_callback = progress_callback
+        self._idle_callback = idle_callback
+        self._timeout = timeout
+        self._frame_exists_callback = frame_exists_callback
+        self._cancel_event = threading.Event()
+        self._stale_frame = None
+        self._last_frame = None
+        self._last_elapsed = 0.0
+        self._frame_times = {}
+        self._startup = None
+
+    def cancel(self):
+        """Abort the render on the next poll."""
+        self._cancel_event.set()
+
+    def render(self):
+        """Render the frame range and wait until the render finished.
+
+        Returns:
+            dict: Render result with "success", "cancelled",
+                "last_frame", "seconds", the "startup" seconds before the
+                first frame and the "frame_times" in seconds per rendered
+                frame with a known render time.
+
+        """
+        comp = self._comp
+        render_kwargs = {
+            "Start": self._frame_start,
+            "End": self._frame_end,
+            "Wait": False,
+        }
+        if self._render_flags is not None:
+            render_kwargs["RenderFlags"] = self._render_flags
+
+        # The last rendered frame of a previous render is reported until
+        # this render finished its first frame
+        self._stale_frame = comp.GetAttrs().get("COMPN_LastFrameRendered")
+        self._last_frame = None
+        self._last_elapsed = 0.0
+        self._frame_times = {}
+        self._startup = None
+
+        start = time.time()
+        result = {
+            "success": False,
+            "cancelled": False,
+            "last_frame": None,
+            "seconds": 0.0,
+            "startup": None,
+            "frame_times": self._frame_times,
+        }
+        if not comp.Render(render_kwargs):
+            return result
+
+        try:
+            # Give Fusion a moment to report the render started
+            started = False
+            while True:
+                rendering = comp.IsRendering()
+                started = started or rendering
+                elapsed = time.time() - start
+                if not rendering and (started or elapsed > 2.0):
+                    break
+
+                self._update_last_frame(elapsed)
+
+                cancel = self._cancel_event.is_set()
+                if self._idle_callback is not None and self._idle_callback():
+                    cancel = True
+                if self._timeout is not None and elapsed > self._timeout:
+                    self.log.warning(
+                        f"Render timed out after {self._timeout} seconds"
+                    )
+                    cancel = True
+                if cancel:
+                    result["cancelled"] = True
+                    comp.AbortRender()
+                    break
+
+                time.sleep(self._poll_interval)
+        except BaseException:
+            # Don't leave Fusion rendering when interrupted
+            if comp.IsRendering():
+                comp.AbortRender()
+            raise
+
+        # Wait for the abort to finish before restoring the comp state
+        while comp.IsRendering():
+            time.sleep(self._poll_interval)
+
+        elapsed = time.time() - start
+        self._update_last_frame(elapsed)
+        if (
+            self._last_frame is None
+            and not result["cancelled"]
+            and self._is_stale_frame_rendered()
+        ):
+            self._record_frames(
+                self._frame_end,
+                elapsed,
+                comp.GetAttrs().get("COMPN_LastFrameTime"),
+            )
+
+        last_frame = self._last_frame
+        result["last_frame"] = last_frame
+        result["seconds"] = elapsed
+        result["startup"] = self._startup
+        # A render which failed, or was aborted in Fusion itself, stops
+        # before the last frame
+        result["success"] = not result["cancelled"] and (
+            last_frame is not None and last_frame >= self._frame_end
+        )
+        return result
+
+    def _is_stale_frame_rendered(self):
+        """Return whether the only frame equals the stale frame and exists.
+
+        The last rendered frame doesn't change when a render of a single
+        frame renders the same frame as the previous render.
+        """
+        return (
+            self._frame_start == self._frame_end
+            and self._stale_frame is not None
+            and int(self._stale_frame) == self._frame_end
+            and self._frame_exists_callback is not None
+            and bool(self._frame_exists_callback(self._frame_end))
+        )
+
+    def _update_last_frame(self, elapsed):
+        """Record the frames finished since the last poll."""
+        attrs = self._comp.GetAttrs()
+        frame = attrs.get("COMPN_LastFrameRendered")
+        if frame is None:
+            return
+        frame = int(frame)
+        if self._stale_frame is not None:
+            if frame == int(self._stale_frame):
+                return
+            self._stale_frame = None
+        if not self._frame_start <= frame <= self._frame_end:
+            return
+        if self._last_frame is not None and frame <= self._last_frame:
+            return
+        self._record_frames(frame, elapsed, attrs.get("COMPN_LastFrameTime"))
+
+    def _record_frames(self, frame, elapsed, frame_time=None):
+        """Record the frames up to `frame` as finished and report them.
+
+        Args:
+            frame (int): The last finished frame.
+            elapsed (float): Seconds since the render started.
+            frame_time (Optional[float]): Render seconds of the last
+                finished frame reported by Fusion.
+
+        """
+        first_frame = (
+            self._frame_start if self._last_frame is None
+            else self._last_frame + 1
+        )
+        frames = range(first_frame, frame + 1)
+        seconds = (elapsed - self._last_elapsed) / len(frames)
+        if len(frames) == 1 and frame_time:
+            seconds = min(float(frame_time), elapsed - self._last_elapsed)
+        elif self._last_frame is None:
+            # The time of the first frames can't be told apart from the
+            # startup time, so no time is recorded for them
+            seconds = None
+        if self._last_frame is None:
+            self._startup = elapsed - (seconds or 0.0) * len(frames)
+        if seconds is not None:
+            for finished_frame in frames:
+                self._frame_times[finished_frame] = seconds
+        self._last_frame = frame
+        self._last_elapsed = elapsed
+
+        if self._progress_callback is not None:
+            total = self._frame_end - self._frame_start + 1
+            done = min(frame - self._frame_start + 1, total)
+            self._progress_callback(frame, done, total, elapsed)
+
+
+def get_frame_times_summary(frame_times, threshold=3.5):
+    """Return statistics and slow outliers of render times per frame.
+
+    A frame is slow when its modified z-score, based on the median absolute
+    deviation of all frames, exceeds the threshold and it took at least one
+    and a half times the median render time. No frame is slow when the
+    median render time is zero.
+
+    Args:
+        frame_times (dict[int, float]): Render seconds per frame.
+        threshold (float): Modified z-score above which a frame is slow.
+
+    Returns:
+        dict: The amount of "frames", "total", "mean", "median" and "max"
+            seconds, the "max_frame" and the "slow_frames".
+
+    """
+    if not frame_times:
+        return {
+            "frames": 0,
+            "total": 0.0,
+            "mean": 0.0,
+            "median": 0.0,
+            "max": 0.0,
+            "max_frame": None,
+            "slow_frames": [],
+        }
+
+    times = list(frame_times.values())
+    median = statistics.median(times)
+    deviation = statistics.median(abs(seconds - median) for seconds in times)
+    slow_frames = []
+    for frame, seconds in sorted(frame_times.items()):
+        if median <= 0:
+            break
+        if seconds < median * 1.5:
+            continue
+        if deviation:
+            score = 0.6745 * (seconds - median) / deviation
+        else:
+            score = float("inf")
+        if score > threshold:
+            slow_frames.append(frame)
+
+    max_frame = max(frame_times, key=frame_times.get)
+    return {
+        "frames": len(times),
+        "total": sum(times),
+        "mean": statistics.mean(times),
+        "median": median,
+        "max": frame_times[max_frame],
+        "max_frame": max_frame,
+        "slow_frames": slow_frames,
+    }
@@ -0,0 +1,152 @@
+"""Local command server for the long-lived AYON menu process.
+
+Each Fusion menu action used to launch a fresh `fusionscript` process that
+had to import `ayon_core`, `qtpy` and `ayon_fusion.api` before anything
+could be shown. Instead the AYON menu process keeps running for the whole
+Fusion session and listens on a local socket for lightweight commands sent
+by `deploy/MenuScripts/send_command.py`.
+
+The port and a random token of the running server are stored as Fusion app
+data so the Lua menu actions (through `send_command.py`) can find it. The
+token is required for every command to avoid other local processes from
+triggering actions.
+
+Protocol: the client sends a single line of JSON
+    {"token": "<token>", "command": "<name>"}
+and the server replies with a single line of JSON
+    {"success": true|false, "message": "<message>"}
+
+"""
+import os
+import sys
+import json
+import uuid
+
+from qtpy import QtCore, QtNetwork
+
+from ayon_core.lib import Logger
+
+# Fusion app data keys used to register the running server. These are
+# duplicated in `deploy/MenuScripts/send_command.py` which can't import
+# from `ayon_fusion` to stay fast, so keep them in sync.
+WORKER_PORT_KEY = "AYON.Worker.Port"
+WORKER_TOKEN_KEY = "AYON.Worker.Token"
+WORKER_PID_KEY = "AYON.Worker.Pid"
+
+log = Logger.get_logger(__name__)
+
+
+def _get_fusion():
+    return getattr(sys.modules["__main__"], "fusion", None)
+
+
+class MenuCommandServer(QtCore.QObject):
+    """Run named menu commands on request of a local socket client.
+
+    Commands are executed in the Qt main thread because most of them show
+    Qt tools.
+
+    Args:
+        commands (dict[str, Callable]): Callbacks per command name.
+        parent (Optional[QtCore.QObject]): Qt parent.
+
+    """
+
+    def __init__(self, commands, parent=None):
+        super(MenuCommandServer, self).__init__(parent=parent)
+        self._commands = dict(commands)
+        self._token = uuid.uuid4().hex
+        self._server = QtNetwork.QTcpServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+
+    def start(self):
+        """Start listening and register the server in the Fusion session.
+
+        Returns:
+            bool: Whether the server is listening.
+
+        """
+        if not self._server.listen(QtNetwork.QHostAddress.LocalHost, 0):
+            log.warning(
+                "Unable to start AYON menu command server: "
+                f"{self._server.errorString()}"
+            )
+            return False
+
+        port = self._server.serverPort()
+        fusion = _get_fusion()
+        if fusion is not None:
+            fusion.SetData(WORKER_PORT_KEY, port)
+            fusion.SetData(WORKER_TOKEN_KEY, self._token)
+            fusion.SetData(WORKER_PID_KEY, os.getpid())
+
+        log.debug(f"AYON menu command server listening on port {port}")
+        return True
+
+    def stop(self):
+        """Stop listening and unregister from the Fusion session."""
+        if not self._server.isListening():
+            return
+
+        fusion = _get_fusion()
+        if fusion is not None:
+            # Only unregister if no other process took over in the meantime
+            try:
+                if fusion.GetData(WORKER_PID_KEY) == os.getpid():
+                    fusion.SetData(WORKER_PORT_KEY, None)
+                    fusion.SetData(WORKER_TOKEN_KEY, None)
+                    fusion.SetData(WORKER_PID_KEY, None)
+            except Exception:
+                # Fusion may already be gone when shutting down
+                pass
+        self._server.close()
+
+    def run_command(self, command):
+        """Run a command by name.
+
+        Returns:
+            tuple[bool, str]: Whether it succeeded and a message.
+
+        """
+        callback = self._commands.get(command)
+        if callback is None:
+            return False, f"Unknown command: {command}"
+
+        try:
+            callback()
+        except Exception as exc:
+            log.error(f"Menu command '{command}' failed.", exc_info=True)
+            return False, str(exc)
+        return True, ""
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.readyRead.connect(
+                lambda s=socket: self._on_ready_read(s)
+            )
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _on_ready_read(self, socket):
+        if not socket.canReadLine():
+            # Wait until the full request line has arrived
+            return
+
+        line = bytes(socket.readLine()).decode("utf-8")
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = {}
+
+        if not isinstance(request, dict):
+            request = {}
+
+        if request.get("token") != self._token:
+            success, message = False, "Invalid token"
+        else:
+            success, message = self.run_command(request.get("command"))
+
+        response = json.dumps({"success": success, "message": message})
+        socket.write((response + "\n").encode("utf-8"))
+        socket.flush()
+        socket.disconnectFromHost()
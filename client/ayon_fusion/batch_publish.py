@@ -0,0 +1,196 @@
+"""Publish many Fusion workfiles concurrently in separate Fusion processes.
+
+Each workfile is published by launching the Fusion application for the
+workfile's context with the `farm_publish` launch type, which runs
+`deploy/MenuScripts/publish_workfile.py` inside Fusion. That script loads
+the comp, publishes it with `FusionHost.current_comp` pinned to it, writes a
+per-comp log and result file and closes Fusion again.
+
+Use through the addon's command line:
+    ayon addon fusion publish-workfiles --app fusion/19 --project MyProject
+        --folder /shots/sh010 --task comp --workers 4 a.comp b.comp
+"""
+import os
+import json
+import time
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from ayon_core.lib import Logger
+
+from ayon_fusion import FUSION_ADDON_ROOT
+from ayon_fusion.api.lib import lua_quote
+
+log = Logger.get_logger(__name__)
+
+PUBLISH_SCRIPT_PATH = os.path.join(
+    FUSION_ADDON_ROOT, "deploy", "MenuScripts", "publish_workfile.py"
+)
+JOB_DATA_KEY = "AYON.Batch.Job"
+
+
+def _get_job_name(index, workfile):
+    name = os.path.splitext(os.path.basename(workfile))[0]
+    return f"{index:04d}_{name}"
+
+
+def _launch_publish_process(app_name, job, extra_args):
+    """Launch Fusion for the job's context to publish its workfile."""
+    from ayon_applications import ApplicationManager, LaunchTypes
+
+    fusion_job = {
+        "workfile": job["workfile"].replace("\\", "/"),
+        "log_path": job["log_path"].replace("\\", "/"),
+        "result_path": job["result_path"].replace("\\", "/"),
+    }
+    script_path = PUBLISH_SCRIPT_PATH.replace("\\", "/")
+    execute = "fusion:SetData({}, {}); fusion:RunScript({})".format(
+        lua_quote(JOB_DATA_KEY),
+        lua_quote(json.dumps(fusion_job)),
+        lua_quote(script_path),
+    )
+
+    application_manager = ApplicationManager()
+    return application_manager.launch(
+        app_name,
+        project_name=job["project_name"],
+        folder_path=job["folder_path"],
+        task_name=job["task_name"],
+        launch_type=LaunchTypes.farm_publish,
+        start_last_workfile=False,
+        app_args=list(extra_args) + ["/execute", execute],
+    )
+
+
+def _run_job(app_name, job, retries, timeout, extra_args):
+    """Publish a single workfile, retrying on failure.
+
+    Returns:
+        dict: The job with its publish result.
+
+    """
+    result = {}
+    attempts = 0
+    start = time.time()
+    while attempts <= retries:
+        attempts += 1
+        if os.path.exists(job["result_path"]):
+            os.remove(job["result_path"])
+
+        log.info(f"Publishing {job['workfile']} (attempt {attempts})")
+        try:
+            process = _launch_publish_process(app_name, job, extra_args)
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            result = {
+                "success": False,
+                "errors": [f"Timed out after {timeout} seconds"],
+            }
+            continue
+        except Exception as exc:
+            result = {"success": False, "errors": [str(exc)]}
+            continue
+
+        try:
+            with open(job["result_path"], "r") as stream:
+                result = json.load(stream)
+        except (OSError, ValueError):
+            result = {
+                "success": False,
+                "errors": [
+                    "Fusion exited without publish result "
+                    f"(exit code {process.returncode})"
+                ],
+            }
+
+        if result.get("success"):
+            break
+
+    output = dict(job)
+    output.update(result)
+    output["attempts"] = attempts
+    output["duration"] = time.time() - start
+    level = "info" if output.get("success") else "error"
+    getattr(log, level)(
+        "Publish of {} {} after {} attempt(s), see log: {}".format(
+            job["workfile"],
+            "succeeded" if output.get("success") else "failed",
+            attempts,
+            job["log_path"],
+        )
+    )
+    return output
+
+
+def publish_workfiles(
+    jobs,
+    app_name,
+    workers=2,
+    retries=1,
+    timeout=None,
+    log_dir=None,
+    extra_args=None,
+):
+    """Publish workfiles concurrently in separate Fusion processes.
+
+    Args:
+        jobs (list[dict]): Jobs with "workfile", "project_name",
+            "folder_path" and "task_name" keys.
+        app_name (str): Full application name to launch, e.g. 'fusion/19'.
+        workers (int): Amount of Fusion processes to run at the same time.
+        retries (int): Amount of retries for a failed publish.
+        timeout (Optional[float]): Seconds after which a Fusion process
+            is killed and its publish considered failed.
+        log_dir (Optional[str]): Directory for per-comp logs and results.
+        extra_args (Optional[list[str]]): Extra Fusion launch arguments.
+
+    Returns:
+        list[dict]: Jobs with their publish results, in order of `jobs`.
+
+    """
+    if log_dir is None:
+        log_dir = tempfile.mkdtemp(prefix="ayon_fusion_batch_publish_")
+    os.makedirs(log_dir, exist_ok=True)
+
+    prepared_jobs = []
+    for index, job in enumerate(jobs):
+        job = dict(job)
+        job["workfile"] = os.path.abspath(job["workfile"])
+        job_name = _get_job_name(index, job["workfile"])
+        job["log_path"] = os.path.join(log_dir, f"{job_name}.log")
+        job["result_path"] = os.path.join(log_dir, f"{job_name}.json")
+        prepared_jobs.append(job)
+
+    log.info(
+        f"Publishing {len(prepared_jobs)} workfiles with {workers} "
+        f"Fusion processes. Logs: {log_dir}"
+    )
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = [
+            executor.submit(
+                _run_job, app_name, job, retries, timeout, extra_args or []
+            )
+            for job in prepared_jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def format_summary(results):
+    """Return human readable summary of `publish_workfiles` results."""
+    succeeded = [r for r in results if r.get("success")]
+    lines = [
+        f"Published {len(succeeded)}/{len(results)} workfiles:"
+    ]
+    for result in results:
+        state = "OK    " if result.get("success") else "FAILED"
+        lines.append(
+            f"  {state} {result['workfile']} "
+            f"({result['attempts']} attempt(s), {result['duration']:.1f}s)"
+        )
+        for error in result.get("errors", []):
+            # Only show last line of tracebacks, full error is in the log
+            error_lines = error.strip().splitlines() or [""]
+            lines.append(f"         {error_lines[-1]}")
+    return "\n".join(lines)
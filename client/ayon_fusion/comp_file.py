@@ -0,0 +1,418 @@
+"""Read and patch Fusion `.comp` files as text without Fusion.
+
+A `.comp` file is a Lua table, e.g.:
+
+    Composition {
+        Tools = ordered() {
+            Loader1 = Loader {
+                Clips = {
+                    Clip {
+                        ID = "Clip1",
+                        Filename = "C:\\\\renders\\\\plate.1001.exr",
+                        ...
+                    }
+                },
+                CustomData = {
+                    avalon = {
+                        representation = "...",
+                        ...
+                    }
+                },
+            },
+        }
+    }
+
+This module only implements the minimal scanning needed to find tools,
+nested tables and string values so they can be replaced in place while the
+rest of the file is kept byte for byte.
+
+This module only uses the Python standard library.
+"""
+import os
+import re
+import difflib
+import tempfile
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_LONG_BRACKET_RE = re.compile(r"\[(=*)\[")
+_STRING_ESCAPES = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+    "\\": "\\",
+    '"': '"',
+    "'": "'",
+    "\n": "\n",
+}
+
+
+class CompFileError(ValueError):
+    """Raised when the `.comp` file content can't be parsed."""
+
+
+class StringValue:
+    """A string literal in the comp file."""
+
+    def __init__(self, key, value, start, end):
+        self.key = key
+        self.value = value
+        # Span of the literal in the text including quotes
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"StringValue({self.key!r}, {self.value!r})"
+
+
+class Table:
+    """A table (`{ ... }`) in the comp file with optional key and type.
+
+    For `Loader1 = Loader { ... }` the key is "Loader1" and the type is
+    "Loader". For `Clip { ... }` the key is None and the type is "Clip".
+    """
+
+    def __init__(self, text, key, type_name, start, end):
+        self.text = text
+        self.key = key
+        self.type_name = type_name
+        # Span of the table content, `start` is the index of the opening
+        # brace and `end` the index after the closing brace.
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"Table({self.key!r}, {self.type_name!r})"
+
+    def iter_children(self):
+        """Yield direct child tables and string values."""
+        yield from _iter_entries(self.text, self.start + 1, self.end - 1)
+
+    def get_table(self, key):
+        """Return direct child table by key."""
+        for child in self.iter_children():
+            if isinstance(child, Table) and child.key == key:
+                return child
+        return None
+
+    def get_tables(self, type_name=None):
+        """Return direct child tables, optionally filtered by type."""
+        return [
+            child for child in self.iter_children()
+            if isinstance(child, Table)
+            and (type_name is None or child.type_name == type_name)
+        ]
+
+    def get_string(self, key):
+        """Return direct child string value by key."""
+        for child in self.iter_children():
+            if isinstance(child, StringValue) and child.key == key:
+                return child
+        return None
+
+    def get_path(self, *keys):
+        """Return nested table by keys, e.g. ("CustomData", "avalon")."""
+        table = self
+        for key in keys:
+            table = table.get_table(key)
+            if table is None:
+                return None
+        return table
+
+
+def decode_lua_string(literal):
+    """Decode Lua string literal including its quotes."""
+    match = _LONG_BRACKET_RE.match(literal)
+    if match:
+        level = len(match.group(1))
+        return literal[level + 2:-(level + 2)]
+
+    content = literal[1:-1]
+    output = []
+    index = 0
+    while index < len(content):
+        char = content[index]
+        if char != "\\":
+            output.append(char)
+            index += 1
+            continue
+
+        index += 1
+        escape = content[index:index + 1]
+        if escape.isdigit():
+            digits = re.match(r"\d{1,3}", content[index:]).group(0)
+            output.append(chr(int(digits)))
+            index += len(digits)
+            continue
+        output.append(_STRING_ESCAPES.get(escape, escape))
+        index += 1
+    return "".join(output)
+
+
+def encode_lua_string(value):
+    """Encode value as double quoted Lua string literal like Fusion does."""
+    value = (
+        value
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+    return f'"{value}"'
+
+
+def _skip_string(text, index):
+    """Return index after the string literal starting at `index`."""
+    char = text[index]
+    if char == "[":
+        match = _LONG_BRACKET_RE.match(text, index)
+        closing = "]{}]".format(match.group(1))
+        end = text.find(closing, match.end())
+        if end == -1:
+            raise CompFileError(f"Unterminated long string at {index}")
+        return end + len(closing)
+
+    quote = char
+    index += 1
+    while index < len(text):
+        char = text[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == quote:
+            return index + 1
+        index += 1
+    raise CompFileError("Unterminated string")
+
+
+def _skip_comment(text, index):
+    """Return index after the comment starting at `index`."""
+    match = _LONG_BRACKET_RE.match(text, index + 2)
+    if match:
+        return _skip_string(text, index + 2)
+    end = text.find("\n", index)
+    return len(text) if end == -1 else end + 1
+
+
+def find_closing_brace(text, open_index):
+    """Return index of the brace closing the one at `open_index`."""
+    depth = 0
+    index = open_index
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char == '"' or char == "'":
+            index = _skip_string(text, index)
+            continue
+        if char == "[" and _LONG_BRACKET_RE.match(text, index):
+            index = _skip_string(text, index)
+            continue
+        if char == "-" and text.startswith("--", index):
+            index = _skip_comment(text, index)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+    raise CompFileError(f"Unmatched brace at {open_index}")
+
+
+def _iter_entries(text, start, end):
+    """Yield tables and string values directly inside span."""
+    index = start
+    key = None
+    type_name = None
+    while index < end:
+        char = text[index]
+        if char.isspace() or char == ",":
+            if char == ",":
+                key = type_name = None
+            index += 1
+            continue
+
+        if char == "-" and text.startswith("--", index):
+            index = _skip_comment(text, index)
+            continue
+
+        if char == '"' or char == "'" or (
+            char == "[" and _LONG_BRACKET_RE.match(text, index)
+        ):
+            string_end = _skip_string(text, index)
+            literal = text[index:string_end]
+            yield StringValue(key, decode_lua_string(literal),
+                              index, string_end)
+            key = type_name = None
+            index = string_end
+            continue
+
+        if char == "[":
+            # Key like `["Some.Key"] = `
+            close = text.find("]", index)
+            key_literal = text[index + 1:close].strip()
+            if key_literal[:1] in {'"', "'"}:
+                key = decode_lua_string(key_literal)
+            else:
+                key = key_literal
+            index = close + 1
+            continue
+
+        if char == "=":
+            index += 1
+            continue
+
+        if char == "{":
+            close = find_closing_brace(text, index)
+            yield Table(text, key, type_name, index, close + 1)
+            key = type_name = None
+            index = close + 1
+            continue
+
+        match = _IDENTIFIER_RE.match(text, index)
+        if match:
+            word = match.group(0)
+            index = match.end()
+            rest = text[index:index + 32].lstrip()
+            if rest.startswith("=") and not rest.startswith("=="):
+                key = word
+                type_name = None
+            elif word == "ordered" and text.startswith("()", index):
+                # Fusion's `ordered() { ... }` tables
+                index += 2
+            else:
+                type_name = word
+            continue
+
+        # Numbers, booleans and other values we don't need
+        index += 1
+
+
+def get_root_table(text):
+    """Return the root `Composition { ... }` table of the comp file."""
+    for entry in _iter_entries(text, 0, len(text)):
+        if isinstance(entry, Table):
+            return entry
+    raise CompFileError("No composition table found")
+
+
+def iter_tools(text):
+    """Yield tool tables of the composition.
+
+    Tools inside groups and macros are yielded too.
+    """
+    root = get_root_table(text)
+    queue = [root.get_table("Tools")]
+    while queue:
+        tools = queue.pop(0)
+        if tools is None:
+            continue
+        for tool in tools.get_tables():
+            yield tool
+            # Tools of groups and macros
+            queue.append(tool.get_table("Tools"))
+
+
+def get_tool_data(tool, key):
+    """Return string values in tool's `CustomData` under `key`.
+
+    This reads data stored by Fusion's `tool.SetData(f"{key}.name", value)`.
+
+    Returns:
+        dict[str, StringValue]: String values by name.
+
+    """
+    table = tool.get_path("CustomData", key)
+    if table is None:
+        return {}
+    return {
+        child.key: child
+        for child in table.iter_children()
+        if isinstance(child, StringValue) and child.key
+    }
+
+
+def apply_replacements(text, replacements):
+    """Replace spans in text.
+
+    Args:
+        text (str): The text.
+        replacements (list[tuple[int, int, str]]): Start and end index of
+            spans to replace with new text. Spans may not overlap.
+
+    Returns:
+        str: Text with replaced spans.
+
+    """
+    output = []
+    index = 0
+    for start, end, value in sorted(replacements):
+        if start < index:
+            raise ValueError("Replacement spans overlap")
+        output.append(text[index:start])
+        output.append(value)
+        index = end
+    output.append(text[index:])
+    return "".join(output)
+
+
+def iter_comp_files(paths):
+    """Yield comp file paths, searching directories recursively.
+
+    Directories are walked lazily so large project trees can be processed
+    while they are still being searched.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield os.path.abspath(path)
+            continue
+        for root, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if os.path.splitext(filename)[1].lower() == ".comp":
+                    yield os.path.abspath(os.path.join(root, filename))
+
+
+def find_comp_files(paths):
+    """Return comp file paths, searching directories recursively."""
+    return list(iter_comp_files(paths))
+
+
+def read_comp_file(path):
+    # Keep line endings as is, so we only change what we replace
+    with open(path, "r", encoding="utf-8", newline="") as stream:
+        return stream.read()
+
+
+def write_comp_file(path, text):
+    """Write comp file atomically by replacing it with a temporary file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".{}.".format(os.path.basename(path)),
+        suffix=".tmp",
+        dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as stream:
+            stream.write(text)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def get_diff(path, old_text, new_text):
+    """Return unified diff between old and new comp file text."""
+    return "".join(difflib.unified_diff(
+        old_text.splitlines(keepends=True),
+        new_text.splitlines(keepends=True),
+        fromfile=path,
+        tofile=path,
+    ))
@@ -1,28 +1,71 @@
 import os
 import sys
+import contextlib
+import importlib.util
 
-from ayon_core.lib import Logger
-from ayon_core.pipeline import (
-    install_host,
-    registered_host,
-)
 
+def get_launch_tracer():
+    """Return launch tracer without importing `ayon_fusion` package.
+
+    The tracer module is loaded directly from file so the import of the
+    `ayon_fusion` package itself can be traced too. It is registered as
+    `ayon_fusion.tracing` so the addon reuses it, and with it the same
+    tracer, instead of loading a second copy.
+    """
+    module_name = "ayon_fusion.tracing"
+    module = sys.modules.get(module_name)
+    if module is None:
+        fusion_root = os.environ.get("AYON_FUSION_ROOT")
+        path = os.path.join(fusion_root or "", "tracing.py")
+        if not fusion_root or not os.path.exists(path):
+            return None
+
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            sys.modules.pop(module_name, None)
+            raise
+    return module.get_launch_tracer(process_name="Fusion AYON menu")
+
+
+def main(env, command=None):
+    tracer = get_launch_tracer()
+    if tracer is not None:
+        tracer.instant("launch_menu.py started", category="menu")
 
-def main(env):
     # This script working directory starts in Fusion application folder.
     # However the contents of that folder can conflict with Qt library dlls
     # so we make sure to move out of it to avoid DLL Load Failed errors.
     os.chdir("..")
-    from ayon_fusion.api import FusionHost
-    from ayon_fusion.api import menu
+
+    with _span(tracer, "import ayon_core"):
+        from ayon_core.lib import Logger
+        from ayon_core.pipeline import (
+            install_host,
+            registered_host,
+        )
+
+    with _span(tracer, "import ayon_fusion.api"):
+        from ayon_fusion.api import FusionHost
+        from ayon_fusion.api import menu
 
     # activate resolve from pype
-    install_host(FusionHost())
+    with _span(tracer, "install_host", category="menu"):
+        install_host(FusionHost())
 
     log = Logger.get_logger(__name__)
     log.info(f"Registered host: {registered_host()}")
 
-    menu.launch_ayon_menu()
+    if tracer is not None:
+        tracer.instant("Launching AYON menu", category="menu")
+        # Write the trace now because launching the menu blocks until the
+        # menu process is shut down
+        tracer.flush()
+
+    menu.launch_ayon_menu(command=command)
 
     # Initiate a QTimer to check if Fusion is still alive every X interval
     # If Fusion is not found - kill itself
@@ -30,6 +73,12 @@ def main(env):
     #            Fusion closes down
 
 
+def _span(tracer, name, category="import"):
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, category=category)
+
+
 if __name__ == "__main__":
     result = main(os.environ)
     sys.exit(not bool(result))
@@ -0,0 +1,114 @@
+# Publish a single workfile in a Fusion process launched by the batch publish
+# command (see `ayon_fusion.batch_publish`). The job description is passed by
+# the launcher through the Fusion app data key `AYON.Batch.Job` as JSON with:
+#   - workfile: Path to the .comp file to publish.
+#   - log_path: Path to write the publish log to.
+#   - result_path: Path to write the JSON publish result to.
+# Fusion is closed once the publish finished.
+import os
+import sys
+import json
+import logging
+import traceback
+
+JOB_DATA_KEY = "AYON.Batch.Job"
+
+
+def get_fusion():
+    return getattr(sys.modules["__main__"], "fusion", None)
+
+
+def publish_workfile(fusion, workfile, log_path):
+    """Publish all active instances in the workfile.
+
+    Returns:
+        dict: Publish result with "success", "errors" and "instances".
+
+    """
+    import pyblish.api
+    import pyblish.util
+
+    from ayon_core.pipeline import install_host
+    from ayon_core.pipeline.create import CreateContext
+    from ayon_fusion.api import FusionHost
+
+    host = FusionHost()
+    install_host(host)
+
+    # Installing the host resets the root logger handlers so only now we
+    # can add the file handler for this workfile
+    handler = logging.FileHandler(log_path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+    ))
+    logging.getLogger().addHandler(handler)
+    log = logging.getLogger("publish_workfile")
+
+    log.info(f"Loading workfile: {workfile}")
+    comp = fusion.LoadComp(workfile, True)
+    if not comp:
+        raise RuntimeError(f"Failed to load workfile: {workfile}")
+
+    errors = []
+    try:
+        with host.current_comp(comp):
+            create_context = CreateContext(host, headless=True)
+            context = pyblish.api.Context()
+            context.data["create_context"] = create_context
+
+            for result in pyblish.util.publish_iter(
+                context, create_context.publish_plugins
+            ):
+                error = result["error"]
+                if error is None:
+                    continue
+                plugin_name = result["plugin"].__name__
+                instance = result["instance"]
+                label = f"{plugin_name} ({instance})" if instance else (
+                    plugin_name
+                )
+                log.error(f"{label}: {error}")
+                errors.append(f"{label}: {error}")
+
+            instances = [
+                instance.data.get("name", instance.name)
+                for instance in context
+                if instance.data.get("publish", True)
+            ]
+    finally:
+        comp.Close()
+
+    return {
+        "success": not errors,
+        "errors": errors,
+        "instances": instances,
+    }
+
+
+def main():
+    fusion = get_fusion()
+    job = json.loads(fusion.GetData(JOB_DATA_KEY))
+
+    # This script working directory starts in Fusion application folder.
+    # However the contents of that folder can conflict with Qt library dlls
+    # so we make sure to move out of it to avoid DLL Load Failed errors.
+    os.chdir("..")
+
+    result = {"success": False, "errors": [], "instances": []}
+    try:
+        result.update(
+            publish_workfile(fusion, job["workfile"], job["log_path"])
+        )
+    except Exception:
+        result["errors"].append(traceback.format_exc())
+    finally:
+        result_path = job["result_path"]
+        tmp_path = f"{result_path}.tmp"
+        with open(tmp_path, "w") as stream:
+            json.dump(result, stream, indent=4)
+        os.replace(tmp_path, result_path)
+        fusion.Quit()
+
+
+if __name__ == "__main__":
+    main()
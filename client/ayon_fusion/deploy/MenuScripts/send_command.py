@@ -0,0 +1,96 @@
+# Send a menu command to the AYON menu process running for this Fusion
+# session. This script is run by the AYON menu actions in `menu.fu` and must
+# stay lightweight: it only uses the standard library so that triggering an
+# action on an already running AYON menu process is near-instant.
+#
+# The Lua action runs this script with `runpy.run_path` and passes the
+# command to run as the `AYON_MENU_COMMAND` global, so each action carries
+# its own command. When no AYON menu process is running yet, or it doesn't
+# respond, this falls back to starting one with `launch_menu.py`.
+import os
+import sys
+import json
+import socket
+
+
+# Keep these in sync with `ayon_fusion.api.worker`
+WORKER_PORT_KEY = "AYON.Worker.Port"
+WORKER_TOKEN_KEY = "AYON.Worker.Token"
+
+CONNECT_TIMEOUT = 1.0
+RESPONSE_TIMEOUT = 10.0
+
+
+def get_fusion():
+    return getattr(sys.modules["__main__"], "fusion", None)
+
+
+def send_command(fusion, command):
+    """Send command to running AYON menu process.
+
+    Returns:
+        bool: Whether the command was handed to a running AYON menu process.
+
+    """
+    port = fusion.GetData(WORKER_PORT_KEY)
+    token = fusion.GetData(WORKER_TOKEN_KEY)
+    if not port or not token:
+        return False
+
+    request = json.dumps({"token": token, "command": command}) + "\n"
+    try:
+        conn = socket.create_connection(
+            ("127.0.0.1", int(port)), timeout=CONNECT_TIMEOUT
+        )
+    except OSError:
+        # Registered process is not running anymore
+        return False
+
+    with conn:
+        try:
+            conn.settimeout(RESPONSE_TIMEOUT)
+            conn.sendall(request.encode("utf-8"))
+            response = conn.makefile("rb").readline()
+        except socket.timeout:
+            # The command was delivered but is taking a while to run
+            return True
+        except OSError:
+            return False
+
+    try:
+        response = json.loads(response.decode("utf-8"))
+    except ValueError:
+        return False
+
+    if not response.get("success"):
+        message = response.get("message")
+        print(f"[AYON] Menu command '{command}' failed: {message}")
+        # A wrong token means another process owns the port now
+        return message != "Invalid token"
+    return True
+
+
+def get_script_dir(fusion):
+    try:
+        return os.path.dirname(os.path.abspath(__file__))
+    except NameError:
+        return fusion.MapPath("AYON:../MenuScripts")
+
+
+def main(command=None):
+    fusion = get_fusion()
+    command = command or "menu"
+
+    if send_command(fusion, command):
+        return
+
+    # No AYON menu process is running yet, start one and let it run the
+    # command once it has started
+    sys.path.insert(0, get_script_dir(fusion))
+    import launch_menu
+
+    launch_menu.main(os.environ, command=command)
+
+
+if __name__ == "__main__":
+    main(globals().get("AYON_MENU_COMMAND"))
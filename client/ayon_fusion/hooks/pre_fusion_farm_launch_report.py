@@ -0,0 +1,44 @@
+import time
+
+from ayon_applications import PreLaunchHook, LaunchTypes
+from ayon_fusion.launch_cache import store_cached_farm_env
+
+
+class FusionFarmLaunchReport(PreLaunchHook):
+    """Cache the resolved farm launch environment and report startup time.
+
+    This runs as the last Fusion pre-launch hook. The environment resolved
+    by `FusionPrelaunch` and `FusionCopyPrefsPrelaunch` is stored so next
+    farm launches with the same settings and Fusion version can reuse it.
+    """
+
+    app_groups = {"fusion"}
+    order = 100
+    launch_types = {LaunchTypes.farm_render,
+                    # This seems to be incorrectly configured for
+                    # ayon_applications addon, see `ayon_applications/#2`
+                    LaunchTypes.farm_publish}
+
+    def execute(self):
+        farm_env = self.data.get("fusion_farm_env")
+        if not farm_env:
+            return
+
+        if not farm_env["cached"]:
+            try:
+                store_cached_farm_env(
+                    farm_env["key"],
+                    farm_env["env"],
+                    farm_env["path_append"]
+                )
+            except OSError as exc:
+                self.log.warning(
+                    f"Unable to cache Fusion farm launch environment: {exc}"
+                )
+
+        duration = time.time() - farm_env["start"]
+        cache_state = "hit" if farm_env["cached"] else "miss"
+        self.log.info(
+            f"Fusion farm launch prepared in {duration:.3f}s "
+            f"(environment cache {cache_state})"
+        )
@@ -1,13 +1,16 @@
 import os
-from ayon_applications import PreLaunchHook
+from ayon_applications import PreLaunchHook, LaunchTypes
 from ayon_fusion import FUSION_ADDON_ROOT
+from ayon_fusion.tracing import traced_hook
 
 
 class FusionLaunchMenuHook(PreLaunchHook):
     """Launch AYON menu on start of Fusion"""
     app_groups = ["fusion"]
     order = 9
+    launch_types = {LaunchTypes.local}
 
+    @traced_hook
     def execute(self):
         # Prelaunch hook is optional
         settings = self.data["project_settings"]["fusion"]
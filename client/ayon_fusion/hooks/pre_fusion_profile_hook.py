@@ -1,6 +1,12 @@
 import os
+import json
+import time
 import shutil
+import hashlib
+import tempfile
 import platform
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Literal
 from pathlib import Path
 from ayon_fusion import (
@@ -8,12 +14,66 @@ from ayon_fusion import (
     FUSION_VERSIONS_DICT,
     get_fusion_version,
 )
+from ayon_fusion.tracing import get_launch_tracer, traced_hook
 from ayon_applications import (
     PreLaunchHook,
     LaunchTypes,
     ApplicationLaunchFailed,
 )
 
+PROFILE_FILE_EXTENSIONS = {
+    ".prefs",
+    ".def",
+    ".blocklist",
+    ".fu",
+    ".toolbars",
+}
+PROFILE_MANIFEST_NAME = ".ayon_profile_manifest.json"
+PROFILE_MANIFEST_VERSION = 1
+
+
+def _hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return sha256 hex digest of file contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a temporary file next to `path` and move it in place."""
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
+    )
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(data)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _atomic_copy_file(src: Path, dst: Path) -> None:
+    """Copy `src` to a temporary file next to `dst` and move it in place.
+
+    This way Fusion never reads a partially copied preferences file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{dst.name}.", suffix=".tmp", dir=str(dst.parent)
+    )
+    os.close(fd)
+    try:
+        # convert Path to str to be compatible with Python 3.6+
+        shutil.copy2(str(src), tmp_path)
+        os.replace(tmp_path, str(dst))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 class FusionCopyPrefsPrelaunch(PreLaunchHook):
     """
@@ -93,19 +153,27 @@ class FusionCopyPrefsPrelaunch(PreLaunchHook):
     def copy_fusion_profile(
         self, copy_from: Path, copy_to: Path, force_sync: bool
     ) -> None:
-        """On the first Fusion launch copy the contents of Fusion profile
-        directory to the working predefined location. If the Openpype profile
-        folder exists, skip copying, unless re-sync is checked.
+        """Sync the contents of Fusion profile directory to the working
+        predefined location.
+
+        A manifest of the synced source files (size, mtime and hash) is
+        stored in the destination folder so that on later launches only
+        changed files are copied. Source files are only re-hashed when their
+        size or mtime differ from the manifest. Kept local changes are
+        recorded with the stat of the destination file so they aren't
+        hashed again until either file changes.
+
+        Without `force_sync` files that were modified in the destination
+        profile since the last sync (or which differ on a first sync into an
+        existing folder) are kept as is, so artist changes made in the AYON
+        profile are preserved. With `force_sync` the destination is always
+        brought in line with the source profile.
+
         If the prefs were not copied on the first launch,
         clean Fusion profile will be created in fu_profile_dir.
         """
-        if copy_to.exists() and not force_sync:
-            self.log.info(
-                "Destination Fusion preferences folder already exists: "
-                f"{copy_to} "
-            )
-            return
-        self.log.info("Starting copying Fusion preferences")
+        start_time = time.perf_counter()
+        self.log.info("Starting sync of Fusion preferences")
         self.log.debug(f"force_sync option is set to {force_sync}")
         try:
             copy_to.mkdir(exist_ok=True, parents=True)
@@ -115,20 +183,166 @@ class FusionCopyPrefsPrelaunch(PreLaunchHook):
         if not copy_from.exists():
             self.log.warning(f"Fusion preferences not found in {copy_from}")
             return
-        for file in copy_from.iterdir():
-            if file.suffix in (
-                ".prefs",
-                ".def",
-                ".blocklist",
-                ".fu",
-                ".toolbars",
-            ):
-                # convert Path to str to be compatible with Python 3.6+
-                shutil.copy(str(file), str(copy_to))
+
+        manifest_path = copy_to / PROFILE_MANIFEST_NAME
+        manifest = self._read_profile_manifest(manifest_path, copy_from)
+        previous_files = manifest["files"]
+
+        source_files = [
+            path for path in copy_from.iterdir()
+            if path.suffix in PROFILE_FILE_EXTENSIONS and path.is_file()
+        ]
+        tracer = get_launch_tracer(self.launch_context.env)
+        max_workers = min(8, len(source_files) or 1)
+        with tracer.span(
+            "Sync Fusion profile", category="copy", files=len(source_files)
+        ), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda path: self._sync_profile_file(
+                    path,
+                    copy_to / path.name,
+                    previous_files.get(path.name),
+                    force_sync
+                ),
+                source_files
+            ))
+
+        counts = collections.Counter()
+        files = {}
+        for path, (status, entry) in zip(source_files, results):
+            counts[status] += 1
+            if entry is not None:
+                files[path.name] = entry
+
+        manifest["files"] = files
+        try:
+            _atomic_write_bytes(
+                manifest_path,
+                json.dumps(manifest, indent=4, sort_keys=True).encode("utf-8")
+            )
+        except OSError as exc:
+            self.log.warning(f"Unable to write profile manifest: {exc}")
+
+        duration = time.perf_counter() - start_time
         self.log.info(
-            f"Successfully copied preferences: {copy_from} to {copy_to}"
+            f"Synced Fusion preferences {copy_from} to {copy_to} "
+            f"in {duration:.3f}s: {counts['copied']} copied, "
+            f"{counts['unchanged']} unchanged, "
+            f"{counts['kept']} kept local changes, "
+            f"{counts['failed']} failed"
         )
 
+    def _read_profile_manifest(self, manifest_path: Path, copy_from: Path):
+        manifest = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, "r") as stream:
+                    manifest = json.load(stream)
+            except (OSError, ValueError):
+                self.log.debug(
+                    f"Ignoring invalid profile manifest: {manifest_path}"
+                )
+                manifest = {}
+
+        # Start over if the manifest is of a different source profile
+        if (
+            manifest.get("version") != PROFILE_MANIFEST_VERSION
+            or manifest.get("source") != str(copy_from)
+        ):
+            manifest = {}
+
+        return {
+            "version": PROFILE_MANIFEST_VERSION,
+            "source": str(copy_from),
+            "files": manifest.get("files", {}),
+        }
+
+    def _sync_profile_file(
+        self,
+        src: Path,
+        dst: Path,
+        previous: Optional[dict],
+        force_sync: bool,
+    ):
+        """Sync a single profile file.
+
+        Returns:
+            tuple[str, Optional[dict]]: The sync status, one of "copied",
+                "unchanged", "kept" or "failed", and the manifest entry.
+
+        """
+        try:
+            src_stat = src.stat()
+            dst_stat = dst.stat() if dst.exists() else None
+
+            # Fast path: source and the locally modified destination did
+            # not change since the last sync
+            if (
+                previous
+                and previous.get("kept")
+                and not force_sync
+                and dst_stat is not None
+                and previous["size"] == src_stat.st_size
+                and previous["mtime_ns"] == src_stat.st_mtime_ns
+                and previous.get("dst_size") == dst_stat.st_size
+                and previous.get("dst_mtime_ns") == dst_stat.st_mtime_ns
+            ):
+                return "kept", previous
+
+            # Fast path: source did not change since last sync and the
+            # destination still has the size we copied
+            if (
+                previous
+                and not previous.get("kept")
+                and dst_stat is not None
+                and previous["size"] == src_stat.st_size
+                and previous["mtime_ns"] == src_stat.st_mtime_ns
+                and previous["size"] == dst_stat.st_size
+                and (
+                    not force_sync
+                    or previous.get("dst_mtime_ns") == dst_stat.st_mtime_ns
+                )
+            ):
+                return "unchanged", previous
+
+            src_hash = _hash_file(src)
+            entry = {
+                "size": src_stat.st_size,
+                "mtime_ns": src_stat.st_mtime_ns,
+                "hash": src_hash,
+            }
+
+            if dst_stat is not None:
+                dst_hash = _hash_file(dst)
+                if dst_hash == src_hash:
+                    entry["dst_mtime_ns"] = dst_stat.st_mtime_ns
+                    return "unchanged", entry
+
+                # Destination was changed locally, or we have no record of
+                # the file because it was synced before manifests existed
+                locally_modified = (
+                    previous is None or previous["hash"] != dst_hash
+                )
+                if locally_modified and not force_sync:
+                    self.log.debug(f"Keeping locally modified file: {dst}")
+                    # Record the destination stat so the file isn't hashed
+                    # again on the next launch while it stays unchanged
+                    entry["kept"] = True
+                    entry["dst_size"] = dst_stat.st_size
+                    entry["dst_mtime_ns"] = dst_stat.st_mtime_ns
+                    return "kept", entry
+
+            tracer = get_launch_tracer(self.launch_context.env)
+            with tracer.span(f"Copy {src.name}", category="copy"):
+                _atomic_copy_file(src, dst)
+            entry["dst_mtime_ns"] = dst.stat().st_mtime_ns
+            return "copied", entry
+
+        except OSError as exc:
+            self.log.warning(f"Failed to sync {src} to {dst}: {exc}")
+            return "failed", previous
+
+    @traced_hook
     def execute(self):
         (
             copy_status,
@@ -149,6 +363,23 @@ class FusionCopyPrefsPrelaunch(PreLaunchHook):
             )
 
         _, profile_version = FUSION_VERSIONS_DICT[app_version]
+
+        # Farm launches are headless and don't need the local profile, only
+        # the master prefs. The environment may even be fully pre-resolved
+        # from an earlier farm launch by `FusionPrelaunch`.
+        farm_env = self.data.get("fusion_farm_env")
+        if farm_env is not None:
+            if farm_env["cached"]:
+                return
+
+            self.log.info("Skipping Fusion profile setup for farm launch.")
+            self._set_master_prefs_variable(profile_version)
+            master_prefs_variable = f"FUSION{profile_version}_MasterPrefs"
+            master_prefs = self.launch_context.env.get(master_prefs_variable)
+            if master_prefs is not None:
+                farm_env["env"][master_prefs_variable] = master_prefs
+            return
+
         if fu_profile_dir is not None:
             fu_profile = self.get_fusion_profile_name(profile_version)
 
@@ -1,4 +1,5 @@
 import os
+import time
 from ayon_applications import (
     PreLaunchHook,
     LaunchTypes,
@@ -10,6 +11,11 @@ from ayon_fusion import (
     FUSION_FALLBACK_VERSION,
     get_fusion_version,
 )
+from ayon_fusion.tracing import traced_hook
+from ayon_fusion.launch_cache import (
+    get_farm_env_cache_key,
+    get_cached_farm_env,
+)
 
 
 class FusionPrelaunch(PreLaunchHook):
@@ -20,6 +26,10 @@ class FusionPrelaunch(PreLaunchHook):
     Python3 versions that are supported by Fusion:
     Fusion 9, 16, 17 : Python 3.6
     Fusion 18        : Python 3.6 - 3.10
+
+    For farm launches the resolved environment is cached per settings hash
+    and Fusion version, and reused on next farm launches. See
+    `ayon_fusion.launch_cache`.
     """
 
     app_groups = {"fusion"}
@@ -30,6 +40,7 @@ class FusionPrelaunch(PreLaunchHook):
                     # ayon_applications addon, see `ayon_applications/#2`
                     LaunchTypes.farm_publish}
 
+    @traced_hook
     def execute(self):
         # making sure python 3 is installed at provided path
         # Py 3.3-3.10 for Fusion 18+ or Py 3.6 for Fu 16-17
@@ -44,7 +55,22 @@ class FusionPrelaunch(PreLaunchHook):
             )
             app_version = FUSION_FALLBACK_VERSION
 
-        py3_var, _ = FUSION_VERSIONS_DICT[app_version]
+        py3_var, profile_version = FUSION_VERSIONS_DICT[app_version]
+
+        farm_env = None
+        if self.launch_context.launch_type in {
+            LaunchTypes.farm_render,
+            LaunchTypes.farm_publish,
+        }:
+            farm_env = self._get_farm_env(
+                app_version,
+                env_keys=[py3_var, f"FUSION{profile_version}_MasterPrefs"]
+            )
+            self.data["fusion_farm_env"] = farm_env
+            if farm_env["cached"]:
+                self._apply_farm_env(farm_env, py3_var)
+                return
+
         fusion_python3_home = self.launch_context.env.get(py3_var, "")
 
         for path in fusion_python3_home.split(os.pathsep):
@@ -77,3 +103,48 @@ class FusionPrelaunch(PreLaunchHook):
 
         self.log.info(f"Setting AYON_FUSION_ROOT: {FUSION_ADDON_ROOT}")
         self.launch_context.env["AYON_FUSION_ROOT"] = FUSION_ADDON_ROOT
+
+        if farm_env is not None:
+            farm_env["env"].update({
+                py3_var: py3_dir,
+                "AYON_FUSION_ROOT": FUSION_ADDON_ROOT,
+            })
+            if app_version >= 18:
+                farm_env["path_append"].append(py3_dir)
+
+    def _get_farm_env(self, app_version, env_keys):
+        """Return farm launch environment data, from cache if available."""
+        key = get_farm_env_cache_key(
+            self.data["project_settings"]["fusion"],
+            app_version,
+            self.launch_context.env,
+            env_keys
+        )
+        farm_env = {
+            "key": key,
+            "start": time.time(),
+            "cached": False,
+            "env": {},
+            "path_append": [],
+        }
+        cached = get_cached_farm_env(key)
+        if cached is not None:
+            farm_env.update({
+                "cached": True,
+                "env": cached["env"],
+                "path_append": cached["path_append"],
+            })
+        return farm_env
+
+    def _apply_farm_env(self, farm_env, py3_var):
+        """Apply cached pre-resolved environment of a farm launch."""
+        self.log.info("Using cached Fusion farm launch environment.")
+        env = self.launch_context.env
+        for key, value in farm_env["env"].items():
+            self.log.debug(f"Setting {key}: {value}")
+            env[key] = value
+
+        for path in farm_env["path_append"]:
+            env["PATH"] += os.pathsep + path
+
+        self.data["fusion_python3_home"] = farm_env["env"].get(py3_var)
@@ -1,9 +1,16 @@
 import os
+import glob
+import json
 import subprocess
 import platform
 import uuid
 
+from ayon_core.lib import get_launcher_local_dir
 from ayon_applications import PreLaunchHook, LaunchTypes
+from ayon_fusion.tracing import get_launch_tracer, traced_hook
+
+
+PYSIDE_PROBE_CACHE_FILENAME = "fusion_pyside_probe_cache.json"
 
 
 class InstallPySideToFusion(PreLaunchHook):
@@ -19,20 +26,24 @@ class InstallPySideToFusion(PreLaunchHook):
     order = 2
     launch_types = {LaunchTypes.local}
 
+    @traced_hook
     def execute(self):
         # Prelaunch hook is not crucial
         try:
             settings = self.data["project_settings"]["fusion"]
-            if not settings["hooks"]["InstallPySideToFusion"]["enabled"]:
+            hook_settings = settings["hooks"]["InstallPySideToFusion"]
+            if not hook_settings["enabled"]:
                 return
-            self.inner_execute()
+            self.inner_execute(
+                force_recheck=hook_settings.get("force_recheck", False)
+            )
         except Exception:
             self.log.warning(
                 "Processing of {} crashed.".format(self.__class__.__name__),
                 exc_info=True
             )
 
-    def inner_execute(self):
+    def inner_execute(self, force_recheck=False):
         self.log.debug("Check for PySide2 installation.")
 
         fusion_python3_home = self.data.get("fusion_python3_home")
@@ -60,17 +71,19 @@ class InstallPySideToFusion(PreLaunchHook):
             return
 
         # Check if PySide2 is installed and skip if yes
-        if self._is_pyside_installed(python_executable):
+        if self._is_pyside_installed_cached(python_executable, force_recheck):
             self.log.debug("Fusion has already installed PySide2.")
             return
 
         self.log.debug("Installing PySide2.")
         # Install PySide2 in fusion's python
-        if self._windows_require_permissions(
-                os.path.dirname(python_executable)):
-            result = self._install_pyside_windows(python_executable)
-        else:
-            result = self._install_pyside(python_executable)
+        tracer = get_launch_tracer(self.launch_context.env)
+        with tracer.span("Install PySide2", category="subprocess"):
+            if self._windows_require_permissions(
+                    os.path.dirname(python_executable)):
+                result = self._install_pyside_windows(python_executable)
+            else:
+                result = self._install_pyside(python_executable)
 
         if result:
             self.log.info("Successfully installed PySide2 module to fusion.")
@@ -152,6 +165,77 @@ class InstallPySideToFusion(PreLaunchHook):
         except subprocess.SubprocessError:
             pass
 
+    def _is_pyside_installed_cached(self, python_executable, force_recheck):
+        """Check if PySide2 is installed using a persistent probe cache.
+
+        Probing spawns a Fusion python subprocess which is slow, so a
+        successful probe is cached per python executable. The cache is
+        invalidated when the executable or its site-packages change.
+        """
+        cache_path = os.path.join(
+            get_launcher_local_dir(), PYSIDE_PROBE_CACHE_FILENAME
+        )
+        cache = {}
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r") as stream:
+                    cache = json.load(stream)
+            except (OSError, ValueError):
+                cache = {}
+
+        cache_key = os.path.normcase(os.path.abspath(python_executable))
+        fingerprint = self._get_python_fingerprint(python_executable)
+        if not force_recheck and cache.get(cache_key) == fingerprint:
+            self.log.debug(
+                f"Using cached PySide2 probe result for {python_executable}"
+            )
+            return True
+
+        tracer = get_launch_tracer(self.launch_context.env)
+        with tracer.span("Probe PySide2", category="subprocess"):
+            is_installed = self._is_pyside_installed(python_executable)
+
+        if not is_installed:
+            cache.pop(cache_key, None)
+            return False
+
+        cache[cache_key] = fingerprint
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "w") as stream:
+                json.dump(cache, stream, indent=4)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            self.log.debug(f"Unable to write PySide2 probe cache: {exc}")
+        return True
+
+    def _get_python_fingerprint(self, python_executable):
+        """Return state of python executable and its site-packages.
+
+        Returns:
+            dict: Modification times of executable and site-packages folders.
+
+        """
+        python_home = os.path.dirname(python_executable)
+        site_packages_patterns = [
+            os.path.join(python_home, "Lib", "site-packages"),
+            os.path.join(python_home, "lib", "python3*", "site-packages"),
+            os.path.join(
+                python_home, os.pardir, "lib", "python3*", "site-packages"
+            ),
+        ]
+        site_packages = {}
+        for pattern in site_packages_patterns:
+            for path in glob.glob(pattern):
+                path = os.path.normpath(path)
+                site_packages[path] = os.stat(path).st_mtime_ns
+
+        return {
+            "mtime_ns": os.stat(python_executable).st_mtime_ns,
+            "site_packages": site_packages,
+        }
+
     def _is_pyside_installed(self, python_executable):
         """Check if PySide2 module is in fusion's pip list."""
         args = [python_executable, "-c", "from qtpy import QtWidgets"]
@@ -0,0 +1,119 @@
+"""Cache of the Fusion launch environment resolved for farm launches.
+
+Farm nodes start many Fusion tasks with the same settings. The pre-launch
+hooks resolve the same values (Python home, master prefs) for each of them,
+so for farm launches the resolved values are cached per settings hash,
+Fusion version and addon version and root, and reused on the next launch.
+"""
+import os
+import json
+import time
+import uuid
+import hashlib
+
+from ayon_core.lib import get_launcher_local_dir
+
+from ayon_fusion import FUSION_ADDON_ROOT, __version__
+
+FARM_ENV_CACHE_FILENAME = "fusion_farm_env_cache.json"
+FARM_ENV_CACHE_VERSION = 1
+FARM_ENV_CACHE_MAX_ENTRIES = 32
+
+
+def get_farm_env_cache_key(fusion_settings, app_version, env, env_keys):
+    """Return hash identifying the inputs of the resolved environment.
+
+    The addon version and root are part of the key, as the resolved
+    environment contains paths inside the addon.
+
+    Args:
+        fusion_settings (dict): Fusion project settings.
+        app_version (int): Fusion major version.
+        env (dict): Launch environment.
+        env_keys (Iterable[str]): Environment keys used as inputs to
+            resolve the launch environment.
+
+    Returns:
+        str: The cache key.
+
+    """
+    data = {
+        "version": FARM_ENV_CACHE_VERSION,
+        "app_version": app_version,
+        "addon_version": __version__,
+        "addon_root": FUSION_ADDON_ROOT,
+        "settings": fusion_settings,
+        "env": {key: env.get(key) for key in sorted(env_keys)},
+    }
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_cache_path():
+    return os.path.join(get_launcher_local_dir(), FARM_ENV_CACHE_FILENAME)
+
+
+def _read_cache():
+    try:
+        with open(_get_cache_path(), "r") as stream:
+            cache = json.load(stream)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def get_cached_farm_env(key):
+    """Return cached resolved environment for key.
+
+    Returns:
+        Optional[dict]: Cached values with "env" (values to set) and
+            "path_append" (paths to append to PATH) keys.
+
+    """
+    entry = _read_cache().get(key)
+    if not entry:
+        return None
+
+    # Make sure the cached Python home is still valid on this machine
+    for path in entry.get("path_append", []):
+        if not os.path.isdir(path):
+            return None
+    return entry
+
+
+def store_cached_farm_env(key, env, path_append):
+    """Store resolved environment for key.
+
+    Args:
+        key (str): Cache key from `get_farm_env_cache_key`.
+        env (dict[str, str]): Environment values to set.
+        path_append (list[str]): Paths to append to PATH.
+
+    """
+    cache = _read_cache()
+    cache[key] = {
+        "env": env,
+        "path_append": path_append,
+        "timestamp": time.time(),
+    }
+
+    # Keep only the most recently stored entries
+    if len(cache) > FARM_ENV_CACHE_MAX_ENTRIES:
+        keys = sorted(
+            cache, key=lambda k: cache[k].get("timestamp", 0), reverse=True
+        )
+        cache = {k: cache[k] for k in keys[:FARM_ENV_CACHE_MAX_ENTRIES]}
+
+    cache_path = _get_cache_path()
+    tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as stream:
+            json.dump(cache, stream, indent=4)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
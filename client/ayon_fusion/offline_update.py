@@ -0,0 +1,348 @@
+"""Update loaded containers to their latest version without Fusion.
+
+Containers imprinted by `ayon_fusion.api.imprint_container` store their
+representation id in the tool's `avalon` custom data. For Loader containers
+this tool updates the Loader clip filename and the imprinted representation
+id directly in the `.comp` file text, so many comps can be updated in
+parallel without a Fusion license. Like in Fusion, the new path uses the
+PathMaps of the comp that contain it.
+
+Only updates which don't change the amount of frames or the start frame are
+applied, because Fusion itself adjusts the Loader trims and global in for
+those (see `FusionLoadSequence.update`). Such containers are reported to be
+updated through the Scene Inventory in Fusion instead.
+"""
+import os
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+from ayon_fusion import comp_file
+from ayon_fusion.relink import get_path_maps, reverse_map_path
+
+LOADER_TOOL_TYPE = "Loader"
+
+
+def scan_comp_containers(path):
+    """Return containers in comp file.
+
+    Returns:
+        dict: Result with "path", "containers" and "error" keys.
+
+    """
+    result = {"path": path, "containers": [], "error": None}
+    try:
+        text = comp_file.read_comp_file(path)
+        for tool in comp_file.iter_tools(text):
+            data = comp_file.get_tool_data(tool, "avalon")
+            representation = data.get("representation")
+            if representation is None:
+                continue
+            container = {
+                "tool": tool.key,
+                "tool_type": tool.type_name,
+                "loader": data["loader"].value if "loader" in data else None,
+                "representation": representation.value,
+                "project_name": (
+                    data["project_name"].value
+                    if "project_name" in data else None
+                ),
+                "filename": None,
+            }
+            filename = _get_loader_filename(tool)
+            if filename is not None:
+                container["filename"] = filename.value
+            result["containers"].append(container)
+    except (OSError, comp_file.CompFileError) as exc:
+        result["error"] = str(exc)
+    return result
+
+
+def _get_loader_filename(tool):
+    """Return filename string value of the first clip of a Loader tool."""
+    if tool.type_name != LOADER_TOOL_TYPE:
+        return None
+    clips = tool.get_table("Clips")
+    if clips is None:
+        return None
+    clip_tables = clips.get_tables("Clip")
+    if not clip_tables:
+        return None
+    return clip_tables[0].get_string("Filename")
+
+
+def patch_comp_containers(path, updates, dry_run=False):
+    """Patch Loader containers in comp file to new representations.
+
+    Args:
+        path (str): Path to comp file.
+        updates (dict[str, dict]): New representation "id" and "path" by
+            the current representation id.
+        dry_run (bool): When enabled only the diff is computed.
+
+    Returns:
+        dict: Result with "path", "updated" (tool names), "diff" and
+            "error" keys.
+
+    """
+    result = {"path": path, "updated": [], "diff": "", "error": None}
+    try:
+        text = comp_file.read_comp_file(path)
+        path_maps = {
+            name: value.value for name, value in get_path_maps(text).items()
+        }
+        replacements = []
+        for tool in comp_file.iter_tools(text):
+            if tool.type_name != LOADER_TOOL_TYPE:
+                continue
+            data = comp_file.get_tool_data(tool, "avalon")
+            representation = data.get("representation")
+            filename = _get_loader_filename(tool)
+            if representation is None or filename is None:
+                continue
+
+            update = updates.get(representation.value)
+            if not update:
+                continue
+
+            replacements.append((
+                representation.start,
+                representation.end,
+                comp_file.encode_lua_string(update["id"])
+            ))
+            # Use the comp's PathMaps like `FusionLoadSequence.update`
+            replacements.append((
+                filename.start,
+                filename.end,
+                comp_file.encode_lua_string(
+                    reverse_map_path(update["path"], path_maps, path)
+                )
+            ))
+            result["updated"].append(tool.key)
+
+        if not replacements:
+            return result
+
+        new_text = comp_file.apply_replacements(text, replacements)
+        result["diff"] = comp_file.get_diff(path, text, new_text)
+        if not dry_run:
+            comp_file.write_comp_file(path, new_text)
+    except (OSError, comp_file.CompFileError) as exc:
+        result["error"] = str(exc)
+    return result
+
+
+def get_latest_representation_updates(project_name, representation_ids):
+    """Resolve latest version representations for representation ids.
+
+    Returns:
+        tuple[dict[str, dict], dict[str, str]]: Updates with new
+            representation "id", "path" and "version" by current
+            representation id, and reasons by representation id for
+            representations that can't be updated offline.
+
+    """
+    import ayon_api
+    from ayon_core.pipeline import Anatomy
+    from ayon_core.pipeline.load import get_representation_path_with_anatomy
+
+    updates = {}
+    skipped = {}
+    if not representation_ids:
+        return updates, skipped
+
+    repre_entities = {
+        repre["id"]: repre
+        for repre in ayon_api.get_representations(
+            project_name, representation_ids=set(representation_ids)
+        )
+    }
+    for repre_id in representation_ids:
+        if repre_id not in repre_entities:
+            skipped[repre_id] = "Representation not found"
+
+    version_ids = {repre["versionId"] for repre in repre_entities.values()}
+    versions = {
+        version["id"]: version
+        for version in ayon_api.get_versions(
+            project_name, version_ids=version_ids
+        )
+    }
+    product_ids = {version["productId"] for version in versions.values()}
+    last_versions = ayon_api.get_last_versions(
+        project_name, product_ids=product_ids
+    )
+
+    # Query representations of the latest versions
+    last_version_ids = {version["id"] for version in last_versions.values()}
+    repres_by_version = collections.defaultdict(dict)
+    for repre in ayon_api.get_representations(
+        project_name, version_ids=last_version_ids
+    ):
+        repres_by_version[repre["versionId"]][repre["name"]] = repre
+
+    anatomy = Anatomy(project_name)
+    for repre_id, repre in repre_entities.items():
+        version = versions.get(repre["versionId"])
+        if version is None:
+            skipped[repre_id] = "Version not found"
+            continue
+
+        last_version = last_versions.get(version["productId"])
+        if last_version is None or last_version["id"] == version["id"]:
+            continue
+
+        new_repre = repres_by_version[last_version["id"]].get(repre["name"])
+        if new_repre is None:
+            skipped[repre_id] = (
+                f"Representation '{repre['name']}' not found in "
+                f"latest version {last_version['version']}"
+            )
+            continue
+
+        # Fusion itself changes the Loader trims and global in when the
+        # frame count or start frame differs, so those can't be done offline
+        if len(new_repre["files"]) != len(repre["files"]):
+            skipped[repre_id] = "Frame count differs from latest version"
+            continue
+        if _get_start_frame(version) != _get_start_frame(last_version):
+            skipped[repre_id] = "Start frame differs from latest version"
+            continue
+
+        path = get_representation_path_with_anatomy(new_repre, anatomy)
+        updates[repre_id] = {
+            "id": new_repre["id"],
+            "path": os.path.normpath(str(path)),
+            "version": last_version["version"],
+        }
+    return updates, skipped
+
+
+def _get_start_frame(version_entity):
+    attributes = version_entity["attrib"]
+    start = attributes.get("frameStartHandle")
+    if start is not None:
+        return start
+    start = attributes.get("frameStart") or 0
+    return start - (attributes.get("handleStart") or 0)
+
+
+def update_comp_files(paths, project_name=None, dry_run=False, workers=None):
+    """Update Loader containers in comp files to their latest versions.
+
+    Args:
+        paths (list[str]): Comp file paths.
+        project_name (Optional[str]): Project name for containers that have
+            no project name imprinted.
+        dry_run (bool): Only compute the diffs, don't write the comp files.
+        workers (Optional[int]): Amount of processes to scan and patch the
+            comp files with.
+
+    Returns:
+        dict: Report with "files" patch results, "skipped" containers and
+            "errors" for files that failed to be read or written.
+
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        scan_results = list(executor.map(scan_comp_containers, paths))
+
+        # Collect the representation ids per project
+        repre_ids_by_project = collections.defaultdict(set)
+        skipped = []
+        for scan_result in scan_results:
+            for container in scan_result["containers"]:
+                if container["tool_type"] != LOADER_TOOL_TYPE:
+                    skipped.append({
+                        "path": scan_result["path"],
+                        "tool": container["tool"],
+                        "reason": (
+                            f"{container['tool_type']} containers are only "
+                            "updated in Fusion"
+                        ),
+                    })
+                    continue
+                container_project = container["project_name"] or project_name
+                if not container_project:
+                    skipped.append({
+                        "path": scan_result["path"],
+                        "tool": container["tool"],
+                        "reason": "No project name",
+                    })
+                    continue
+                repre_ids_by_project[container_project].add(
+                    container["representation"]
+                )
+
+        updates = {}
+        skip_reasons = {}
+        for container_project, repre_ids in repre_ids_by_project.items():
+            project_updates, project_skipped = (
+                get_latest_representation_updates(
+                    container_project, repre_ids
+                )
+            )
+            updates.update(project_updates)
+            skip_reasons.update(project_skipped)
+
+        for scan_result in scan_results:
+            for container in scan_result["containers"]:
+                reason = skip_reasons.get(container["representation"])
+                if reason:
+                    skipped.append({
+                        "path": scan_result["path"],
+                        "tool": container["tool"],
+                        "reason": reason,
+                    })
+
+        # Only patch files that have containers to update
+        paths_to_patch = [
+            scan_result["path"]
+            for scan_result in scan_results
+            if any(
+                container["representation"] in updates
+                for container in scan_result["containers"]
+            )
+        ]
+        patch_results = list(executor.map(
+            patch_comp_containers,
+            paths_to_patch,
+            [updates] * len(paths_to_patch),
+            [dry_run] * len(paths_to_patch),
+        ))
+
+    errors = [
+        {"path": result["path"], "error": result["error"]}
+        for result in scan_results + patch_results
+        if result["error"]
+    ]
+    return {
+        "files": patch_results,
+        "skipped": skipped,
+        "errors": errors,
+    }
+
+
+def format_summary(report, dry_run=False):
+    """Return human readable summary of `update_comp_files` report."""
+    updated_files = [result for result in report["files"] if result["updated"]]
+    lines = [
+        "{} {} containers in {} comp files".format(
+            "Would update" if dry_run else "Updated",
+            sum(len(result["updated"]) for result in updated_files),
+            len(updated_files),
+        )
+    ]
+    for result in updated_files:
+        lines.append(
+            "  {}: {}".format(result["path"], ", ".join(result["updated"]))
+        )
+    if report["skipped"]:
+        lines.append(f"Skipped {len(report['skipped'])} containers:")
+        for item in report["skipped"]:
+            lines.append(
+                f"  {item['path']}: {item['tool']} - {item['reason']}"
+            )
+    if report["errors"]:
+        lines.append(f"Failed {len(report['errors'])} comp files:")
+        for item in report["errors"]:
+            lines.append(f"  {item['path']}: {item['error']}")
+    return "\n".join(lines)
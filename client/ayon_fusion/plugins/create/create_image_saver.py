@@ -56,6 +56,7 @@ class CreateImageSaver(GenericCreateSaver):
             self._get_reviewable_bool(),
             self._get_frame_int(),
             self._get_image_format_enum(),
+            *self._get_exr_options_defs(),
         ]
         return attr_defs
 
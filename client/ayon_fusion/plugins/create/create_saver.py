@@ -1,3 +1,4 @@
+import os
 import inspect
 
 from ayon_core.lib import (
@@ -6,8 +7,12 @@ from ayon_core.lib import (
     EnumDef
 )
 
-from ayon_fusion.api.plugin import GenericCreateSaver
-from ayon_fusion.api.lib import get_current_comp
+from ayon_fusion.api.plugin import (
+    GenericCreateSaver,
+    REVIEW_SAVER_DATA_KEY,
+    get_review_tools,
+)
+from ayon_fusion.api.lib import get_frame_path
 
 
 class CreateSaver(GenericCreateSaver):
@@ -25,6 +30,11 @@ class CreateSaver(GenericCreateSaver):
 
     default_frame_range_option = "current_context"
 
+    # Format of the low resolution review Saver rendered with the Saver,
+    # "none" to not create a review Saver
+    review_saver_format = "none"
+    review_saver_scale = 0.5
+
     def get_detail_description(self):
         return inspect.cleandoc(
             """Fusion Saver to generate image sequence.
@@ -46,6 +56,11 @@ class CreateSaver(GenericCreateSaver):
             - png
             - tif
             - jpg
+
+            Optionally a low resolution review Saver (jpg, png or mov) is
+            linked to the Saver. It renders in the same render as the Saver
+            and its output is used for review instead of the full
+            resolution frames.
             """
         )
 
@@ -83,6 +98,8 @@ class CreateSaver(GenericCreateSaver):
             self._get_reviewable_bool(),
             self._get_frame_range_enum(),
             self._get_image_format_enum(),
+            *self._get_exr_options_defs(),
+            *self._get_review_saver_attribute_defs(),
             *self._get_custom_frame_range_attribute_defs()
         ]
         return attr_defs
@@ -93,9 +110,112 @@ class CreateSaver(GenericCreateSaver):
             self._get_reviewable_bool(),
             self._get_frame_range_enum(),
             self._get_image_format_enum(),
+            *self._get_exr_options_defs(),
+            *self._get_review_saver_attribute_defs(),
             *self._get_custom_frame_range_attribute_defs(instance)
         ]
 
+    def remove_instances(self, instances):
+        for instance in instances:
+            tool = instance.transient_data["tool"]
+            if tool:
+                for review_tool in get_review_tools(tool):
+                    if review_tool:
+                        review_tool.Delete()
+        super().remove_instances(instances)
+
+    def _update_tool_with_data(self, tool, data):
+        super()._update_tool_with_data(tool, data)
+        if "productName" in data:
+            self._update_review_saver(tool, data)
+
+    def _update_review_saver(self, saver, data):
+        """Create, update or remove the review Saver linked to the Saver.
+
+        The review Saver is connected through a Scale tool to the output of
+        the Saver, so it renders in the same render as the Saver. It is kept
+        passthrough so manual and farm renders don't write review media,
+        the local render enables it with the Saver.
+        """
+        creator_attributes = data.get("creator_attributes", {})
+        review_format = creator_attributes.get("review_saver", "none")
+        scale = creator_attributes.get(
+            "review_saver_scale", self.review_saver_scale
+        )
+        review_saver, scale_tool = get_review_tools(saver)
+
+        if review_format == "none":
+            for review_tool in (review_saver, scale_tool):
+                if review_tool:
+                    review_tool.Delete()
+            saver.SetData(REVIEW_SAVER_DATA_KEY, None)
+            return
+
+        comp = saver.Composition
+        if scale_tool is None:
+            scale_tool = comp.AddTool("Scale", -32768, -32768)
+        if review_saver is None:
+            review_saver = comp.AddTool("Saver", -32768, -32768)
+        scale_tool.ConnectInput("Input", saver)
+        review_saver.ConnectInput("Input", scale_tool)
+        scale_tool["XSize"] = scale
+
+        # Render into a `review` subfolder next to the Saver's output
+        path = comp.MapPath(saver["Clip"][comp.TIME_UNDEFINED])
+        head, padding, _ = get_frame_path(os.path.basename(path))
+        name = "{}_review".format(head.rstrip("._"))
+        if review_format == "mov":
+            filename = f"{name}.mov"
+        else:
+            filename = "{}.{}.{}".format(name, "0" * padding, review_format)
+        review_path = os.path.join(os.path.dirname(path), "review", filename)
+        review_saver["Clip"] = comp.ReverseMapPath(
+            os.path.normpath(review_path)
+        )
+        review_saver["CreateDir"] = 1
+        review_saver.SetAttrs({"TOOLB_PassThrough": True})
+
+        # Rename the tools with the Saver
+        product_name = data["productName"]
+        for tool, tool_name in (
+            (review_saver, f"{product_name}_review"),
+            (scale_tool, f"{product_name}_reviewScale"),
+        ):
+            if tool.Name != tool_name:
+                tool.SetAttrs({"TOOLS_Name": tool_name})
+
+        saver.SetData(f"{REVIEW_SAVER_DATA_KEY}.saver", review_saver.Name)
+        saver.SetData(f"{REVIEW_SAVER_DATA_KEY}.scale", scale_tool.Name)
+        review_saver.SetData(f"{REVIEW_SAVER_DATA_KEY}.source", saver.Name)
+
+    def _get_review_saver_attribute_defs(self):
+        return [
+            EnumDef(
+                "review_saver",
+                items={
+                    "none": "None",
+                    "jpg": "jpg",
+                    "png": "png",
+                    "mov": "mov",
+                },
+                default=self.review_saver_format,
+                label="Review Saver",
+                tooltip=(
+                    "Render low resolution review media with a linked "
+                    "Saver in the same render, instead of creating the "
+                    "review from the full resolution frames."
+                ),
+            ),
+            NumberDef(
+                "review_saver_scale",
+                label="Review Saver scale",
+                default=self.review_saver_scale,
+                minimum=0.1,
+                maximum=1.0,
+                decimals=2,
+            ),
+        ]
+
     def _get_frame_range_enum(self):
         frame_range_options = {
             "current_task": "Current context",
@@ -111,8 +231,7 @@ class CreateSaver(GenericCreateSaver):
             default=self.default_frame_range_option
         )
 
-    @staticmethod
-    def _get_custom_frame_range_attribute_defs(instance=None) -> list:
+    def _get_custom_frame_range_attribute_defs(self, instance=None) -> list:
 
         # If an instance is provided and 'custom_range' is not the frame
         # range source, then we will disable the custom frame range attributes
@@ -124,7 +243,7 @@ class CreateSaver(GenericCreateSaver):
 
         # Define custom frame range defaults based on current comp
         # timeline settings (if a comp is currently open)
-        comp = get_current_comp()
+        comp = self.create_context.host.get_current_comp()
         if comp is not None:
             attrs = comp.GetAttrs()
             frame_defaults = {
@@ -1,6 +1,3 @@
-from ayon_fusion.api import (
-    get_current_comp
-)
 from ayon_core.pipeline import (
     AutoCreator,
     CreatedInstance,
@@ -21,7 +18,7 @@ class FusionWorkfileCreator(AutoCreator):
     data_key = "openpype_workfile"
 
     def collect_instances(self):
-        comp = get_current_comp()
+        comp = self.create_context.host.get_current_comp()
         data = comp.GetData(self.data_key)
         if not data:
             return
@@ -54,7 +51,7 @@ class FusionWorkfileCreator(AutoCreator):
             comp.SetData(self.data_key, data)
 
     def create(self, options=None):
-        comp = get_current_comp()
+        comp = self.create_context.host.get_current_comp()
         if not comp:
             self.log.error("Unable to find current comp")
             return
@@ -1,5 +1,18 @@
+import time
+
 from ayon_core.pipeline import InventoryAction
 
+SELECT_TOOLS_SCRIPT = """
+local flow = comp.CurrentFrame.FlowView
+flow:Select()
+for _, name in ipairs({%s}) do
+    local tool = comp:FindTool(name)
+    if tool then
+        flow:Select(tool)
+    end
+end
+"""
+
 
 class FusionSelectContainers(InventoryAction):
 
@@ -12,16 +25,19 @@ class FusionSelectContainers(InventoryAction):
             get_current_comp,
             comp_lock_and_undo_chunk
         )
+        from ayon_fusion.api.lib import execute_lua, lua_quote
 
-        tools = [i["_tool"] for i in containers]
+        start = time.perf_counter()
+        tool_names = [i["objectName"] for i in containers]
 
         comp = get_current_comp()
-        flow = comp.CurrentFrame.FlowView
-
         with comp_lock_and_undo_chunk(comp, self.label):
-            # Clear selection
-            flow.Select()
-
-            # Select tool
-            for tool in tools:
-                flow.Select(tool)
+            # Clear selection and select the tools in one remote call
+            execute_lua(comp, SELECT_TOOLS_SCRIPT % ", ".join(
+                lua_quote(name) for name in tool_names
+            ))
+
+        self.log.debug(
+            f"Selected {len(tool_names)} tools in "
+            f"{time.perf_counter() - start:.3f}s"
+        )
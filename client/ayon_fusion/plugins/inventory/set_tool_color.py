@@ -1,3 +1,5 @@
+import time
+
 from qtpy import QtGui, QtWidgets
 
 from ayon_core.pipeline import InventoryAction
@@ -6,6 +8,17 @@ from ayon_fusion.api import (
     get_current_comp,
     comp_lock_and_undo_chunk
 )
+from ayon_fusion.api.lib import execute_lua, lua_quote
+
+SET_TILE_COLOR_SCRIPT = """
+local color = {R = %s, G = %s, B = %s}
+for _, name in ipairs({%s}) do
+    local tool = comp:FindTool(name)
+    if tool then
+        tool.TileColor = color
+    end
+end
+"""
 
 
 class FusionSetToolColor(InventoryAction):
@@ -37,17 +50,27 @@ class FusionSetToolColor(InventoryAction):
         if not picked_color:
             return
 
-        with comp_lock_and_undo_chunk(comp):
-            for container in containers:
-                # Convert color to RGB 0-1 floats
-                rgb_f = picked_color.getRgbF()
-                rgb_f_table = {"R": rgb_f[0], "G": rgb_f[1], "B": rgb_f[2]}
+        # Convert color to RGB 0-1 floats
+        rgb_f = picked_color.getRgbF()
 
-                # Update tool
-                tool = container["_tool"]
-                tool.TileColor = rgb_f_table
-
-                result.append(container)
+        # Update all tools in one remote call
+        start = time.perf_counter()
+        with comp_lock_and_undo_chunk(comp):
+            execute_lua(comp, SET_TILE_COLOR_SCRIPT % (
+                rgb_f[0],
+                rgb_f[1],
+                rgb_f[2],
+                ", ".join(
+                    lua_quote(container["objectName"])
+                    for container in containers
+                )
+            ))
+        result.extend(containers)
+
+        self.log.debug(
+            f"Set tool color of {len(containers)} tools in "
+            f"{time.perf_counter() - start:.3f}s"
+        )
 
         return result
 
@@ -6,31 +6,12 @@ from ayon_fusion.api import (
     get_current_comp,
     comp_lock_and_undo_chunk,
 )
+from ayon_fusion.api.lib import loader_shift, preserve_inputs
 from ayon_core.lib.transcoding import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
 
 comp = get_current_comp()
 
 
-@contextlib.contextmanager
-def preserve_inputs(tool, inputs):
-    """Preserve the tool's inputs after context"""
-
-    comp = tool.Comp()
-
-    values = {}
-    for name in inputs:
-        tool_input = getattr(tool, name)
-        value = tool_input[comp.TIME_UNDEFINED]
-        values[name] = value
-
-    try:
-        yield
-    finally:
-        for name, value in values.items():
-            tool_input = getattr(tool, name)
-            tool_input[comp.TIME_UNDEFINED] = value
-
-
 @contextlib.contextmanager
 def preserve_trim(loader, log=None):
     """Preserve the relative trim of the Loader tool.
@@ -72,60 +53,6 @@ def preserve_trim(loader, log=None):
         loader["ClipTimeEnd"][time] = length - trim_from_end
 
 
-def loader_shift(loader, frame, relative=True):
-    """Shift global in time by i preserving duration
-
-    This moves the loader by i frames preserving global duration. When relative
-    is False it will shift the global in to the start frame.
-
-    Args:
-        loader (tool): The fusion loader tool.
-        frame (int): The amount of frames to move.
-        relative (bool): When True the shift is relative, else the shift will
-            change the global in to frame.
-
-    Returns:
-        int: The resulting relative frame change (how much it moved)
-
-    """
-    comp = loader.Comp()
-    time = comp.TIME_UNDEFINED
-
-    old_in = loader["GlobalIn"][time]
-    old_out = loader["GlobalOut"][time]
-
-    if relative:
-        shift = frame
-    else:
-        shift = frame - old_in
-
-    if not shift:
-        return 0
-
-    # Shifting global in will try to automatically compensate for the change
-    # in the "ClipTimeStart" and "HoldFirstFrame" inputs, so we preserve those
-    # input values to "just shift" the clip
-    with preserve_inputs(
-        loader,
-        inputs=[
-            "ClipTimeStart",
-            "ClipTimeEnd",
-            "HoldFirstFrame",
-            "HoldLastFrame",
-        ],
-    ):
-        # GlobalIn cannot be set past GlobalOut or vice versa
-        # so we must apply them in the order of the shift.
-        if shift > 0:
-            loader["GlobalOut"][time] = old_out + shift
-            loader["GlobalIn"][time] = old_in + shift
-        else:
-            loader["GlobalIn"][time] = old_in + shift
-            loader["GlobalOut"][time] = old_out + shift
-
-    return int(shift)
-
-
 class FusionLoadSequence(load.LoaderPlugin):
     """Load image sequence into Fusion"""
 
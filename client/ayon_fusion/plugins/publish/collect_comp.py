@@ -1,7 +1,6 @@
 import pyblish.api
 
-from ayon_core.pipeline import PublishError
-from ayon_fusion.api import get_current_comp
+from ayon_core.pipeline import PublishError, registered_host
 
 
 class CollectCurrentCompFusion(pyblish.api.ContextPlugin):
@@ -14,7 +13,9 @@ class CollectCurrentCompFusion(pyblish.api.ContextPlugin):
     def process(self, context):
         """Collect all image sequence tools"""
 
-        current_comp = get_current_comp()
+        # Use the host so a comp pinned with `FusionHost.current_comp` is
+        # collected, e.g. by the batch publish of workfiles
+        current_comp = registered_host().get_current_comp()
         if not current_comp:
             raise PublishError("Must have active Fusion composition")
 
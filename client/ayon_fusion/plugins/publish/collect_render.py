@@ -5,6 +5,11 @@ import pyblish.api
 from ayon_core.pipeline import publish
 from ayon_core.pipeline.publish import RenderInstance
 from ayon_fusion.api.lib import get_frame_path, get_tool_resolution
+from ayon_fusion.api.plugin import (
+    FusionColormanagedPluginMixin,
+    get_review_tools,
+    get_review_saver_representation,
+)
 
 
 @attr.s
@@ -19,11 +24,12 @@ class FusionRenderInstance(RenderInstance):
     publish_attributes = attr.ib(default={})
     frameStartHandle = attr.ib(default=None)
     frameEndHandle = attr.ib(default=None)
+    reviewSaver = attr.ib(default=None)
 
 
 class CollectFusionRender(
     publish.AbstractCollectRender,
-    publish.ColormanagedPyblishPluginMixin
+    FusionColormanagedPluginMixin
 ):
 
     order = pyblish.api.CollectorOrder + 0.09
@@ -116,6 +122,8 @@ class CollectFusionRender(
             # Add render target specific data
             if render_target in {"local", "frames"}:
                 instance.projectEntity = project_entity
+                if instance.review:
+                    instance.reviewSaver, _ = get_review_tools(tool)
 
             if render_target == "farm":
                 fam = "render.farm"
@@ -201,18 +209,22 @@ class CollectFusionRender(
             "stagingDir": staging_dir,
         }
 
-        self.set_representation_colorspace(
-            representation=repre,
-            context=instance.context,
-        )
-
-        # review representation
-        if instance.data.get("review", False):
-            repre["tags"] = ["review"]
+        self.set_representation_colorspace_cached(repre, instance)
 
         # add the repre to the instance
         if "representations" not in instance.data:
             instance.data["representations"] = []
         instance.data["representations"].append(repre)
 
+        # review representation, from the review Saver output if rendered
+        if instance.data.get("review", False):
+            review_repre = get_review_saver_representation(instance)
+            if review_repre:
+                self.set_representation_colorspace_cached(
+                    review_repre, instance
+                )
+                instance.data["representations"].append(review_repre)
+            else:
+                repre["tags"] = ["review"]
+
         return instance
@@ -1,59 +1,49 @@
 import os
+import json
+import time
 import logging
+import tempfile
 import contextlib
 import collections
 import pyblish.api
+from qtpy import QtWidgets
 
-from ayon_core.pipeline import publish
 from ayon_fusion.api import comp_lock_and_undo_chunk
-from ayon_fusion.api.lib import get_frame_path, maintained_comp_range
+from ayon_fusion.api.lib import (
+    get_frame_path,
+    maintained_comp_range,
+    enabled_savers,
+    REQF_Quiet,
+)
+from ayon_fusion.api.render import (
+    get_frame_ranges,
+    get_frame_times_summary,
+    get_precomp_dependencies,
+    get_render_levels,
+    get_saver_frame_paths,
+    get_saver_output_path,
+    link_frame,
+    unlink_shared_frames,
+    redirected_savers,
+    RenderJournal,
+    StreamingFrameCopier,
+    RenderDriver,
+)
+from ayon_fusion.api.graph_hash import (
+    get_saver_frame_hashes,
+    get_held_frame_spans,
+)
+from ayon_fusion.api.plugin import (
+    FusionColormanagedPluginMixin,
+    get_review_saver_representation,
+)
 
 log = logging.getLogger(__name__)
 
-# Fusion render flag to avoid Render Completed dialog to pop up after render
-# This also suppresses the render failed dialog.
-# See: https://www.steakunderwater.com/wesuckless/viewtopic.php?p=53312
-REQF_Quiet = 524288
-
-
-@contextlib.contextmanager
-def enabled_savers(comp, savers):
-    """Enable only the `savers` in Comp during the context.
-
-    Any Saver tool in the passed composition that is not in the savers list
-    will be set to passthrough during the context.
-
-    Args:
-        comp (object): Fusion composition object.
-        savers (list): List of Saver tool objects.
-
-    """
-    passthrough_key = "TOOLB_PassThrough"
-    original_states = {}
-    enabled_saver_names = {saver.Name for saver in savers}
-
-    all_savers = comp.GetToolList(False, "Saver").values()
-    savers_by_name = {saver.Name: saver for saver in all_savers}
-
-    try:
-        for saver in all_savers:
-            original_state = saver.GetAttrs()[passthrough_key]
-            original_states[saver.Name] = original_state
-
-            # The passthrough state we want to set (passthrough != enabled)
-            state = saver.Name not in enabled_saver_names
-            if state != original_state:
-                saver.SetAttrs({passthrough_key: state})
-        yield
-    finally:
-        for saver_name, original_state in original_states.items():
-            saver = savers_by_name[saver_name]
-            saver.SetAttrs({"TOOLB_PassThrough": original_state})
-
 
 class FusionRenderLocal(
     pyblish.api.InstancePlugin,
-    publish.ColormanagedPyblishPluginMixin
+    FusionColormanagedPluginMixin
 ):
     """Render the current Fusion composition locally."""
 
@@ -67,6 +57,18 @@ class FusionRenderLocal(
 
     # Settings
     suppress_dialogs = True
+    render_timeout = 0
+    render_to_scratch = False
+    scratch_dir = ""
+    copy_workers = 4
+    resume_renders = False
+    skip_unchanged_frames = False
+    render_held_frames_once = False
+    render_precomps_first = False
+    slow_frame_threshold = 3.5
+
+    # Seconds between writing the render journals during the render
+    journal_save_interval = 2.0
 
     def process(self, instance):
 
@@ -117,6 +119,11 @@ class FusionRenderLocal(
             render_instance.data[self.is_rendered_key] = False
 
         savers_to_render = [inst.data["tool"] for inst in render_instances]
+        # Render the linked review Savers in the same render
+        savers_to_render.extend(
+            inst.data["reviewSaver"] for inst in render_instances
+            if inst.data.get("review") and inst.data.get("reviewSaver")
+        )
         current_comp = instance.context.data["currentComp"]
         frame_start, frame_end = frame_range
 
@@ -126,25 +133,490 @@ class FusionRenderLocal(
         saver_names = ", ".join(saver.Name for saver in savers_to_render)
         self.log.info(f"Rendering tools: {saver_names}")
 
-        with comp_lock_and_undo_chunk(current_comp):
-            with maintained_comp_range(current_comp):
-                with enabled_savers(current_comp, savers_to_render):
-                    render_kwargs = {
-                        "Start": frame_start,
-                        "End": frame_end,
-                        "Wait": True
-                    }
-                    if self.suppress_dialogs:
-                        render_kwargs["RenderFlags"] = REQF_Quiet
-
-                    result = current_comp.Render(render_kwargs)
+        render_levels = [savers_to_render]
+        if self.render_precomps_first:
+            dependencies, savers_by_name = get_precomp_dependencies(
+                current_comp, savers_to_render
+            )
+            precomp_names = sorted(
+                set(savers_by_name)
+                - {saver.Name for saver in savers_to_render}
+            )
+            if precomp_names:
+                self.log.info(
+                    "Rendering precomp Savers read by the rendered Savers: "
+                    + ", ".join(precomp_names)
+                )
+            render_levels = [
+                [savers_by_name[name] for name in level]
+                for level in get_render_levels(dependencies)
+            ]
+
+        result = True
+        frame_times = {}
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(comp_lock_and_undo_chunk(current_comp))
+            stack.enter_context(maintained_comp_range(current_comp))
+            for index, level_savers in enumerate(render_levels):
+                if len(render_levels) > 1:
+                    level_names = ", ".join(
+                        saver.Name for saver in level_savers
+                    )
+                    self.log.info(
+                        f"Rendering precomp level {index + 1}/"
+                        f"{len(render_levels)}: {level_names}"
+                    )
+                result = self._render_savers(
+                    current_comp, level_savers, frame_start, frame_end,
+                    frame_times
+                )
+                if not result:
+                    break
 
         # Store the render state for all the rendered instances
         for render_instance in render_instances:
             render_instance.data[self.is_rendered_key] = bool(result)
 
+        if frame_times:
+            self._report_frame_times(render_instances, frame_times)
+
+        return result
+
+    def _render_savers(
+        self, comp, savers, frame_start, frame_end, frame_times
+    ):
+        """Render the frame range of the Savers.
+
+        The render times of the Savers are added to `frame_times`, see
+        `_render_pass`.
+
+        Returns:
+            bool: Whether the render succeeded.
+
+        """
+        journals = {}
+        frame_links = []
+        render_passes = [(frame_start, frame_end, savers)]
+        if (
+            self.resume_renders
+            or self.skip_unchanged_frames
+            or self.render_held_frames_once
+        ):
+            journals, render_passes, frame_links = self._get_render_plan(
+                savers, frame_start, frame_end
+            )
+            if not render_passes:
+                self.log.info("No frames to render, skipping render")
+
+        rendered_savers = {
+            saver.Name: saver
+            for _, _, pass_savers in render_passes
+            for saver in pass_savers
+        }
+
+        result = True
+        with contextlib.ExitStack() as stack:
+            copier = None
+            if self.render_to_scratch and rendered_savers:
+                scratch_root = self.scratch_dir or os.path.join(
+                    tempfile.gettempdir(), "ayon_fusion_render"
+                )
+                self.log.info(f"Rendering to local scratch: {scratch_root}")
+                outputs = stack.enter_context(redirected_savers(
+                    comp, list(rendered_savers.values()), scratch_root
+                ))
+                copier = StreamingFrameCopier(
+                    outputs, workers=self.copy_workers
+                )
+                copier.start()
+
+            # The pass being rendered and the last frame it finished
+            current_pass = None
+            last_frame = None
+            try:
+                for pass_start, pass_end, pass_savers in render_passes:
+                    current_pass = (pass_start, pass_savers)
+                    last_frame = None
+                    result, last_frame = self._render_pass(
+                        comp, pass_start, pass_end, pass_savers, journals,
+                        frame_times
+                    )
+                    if not result:
+                        break
+                    current_pass = None
+            finally:
+                if copier is not None:
+                    result = self._finish_copy(copier) and result
+                if result and frame_links:
+                    result = self._link_held_frames(frame_links)
+                # Record the frames rendered until now, also on failure so
+                # a next render continues from there. Of a failed pass only
+                # the frames Fusion finished are recorded, frames rendered
+                # at the same time may be written partially.
+                frame_ends = {}
+                if current_pass is not None:
+                    pass_start, pass_savers = current_pass
+                    if last_frame is None:
+                        last_frame = pass_start - 1
+                    frame_ends = {
+                        saver.Name: last_frame for saver in pass_savers
+                    }
+                for saver_name, journal in journals.items():
+                    journal.record_frames(
+                        frame_end=frame_ends.get(saver_name)
+                    )
+                    journal.save()
+
         return result
 
+    def _get_render_plan(self, savers, frame_start, frame_end):
+        """Return the render journals, passes to render and frames to link.
+
+        With `skip_unchanged_frames` only frames which are not in the
+        Saver's render journal or of which the upstream graph changed are
+        rendered. With only `resume_renders` the journal is used the same
+        way, except a journal of a finished render is not reused.
+        With `render_held_frames_once` only the first frame of each span of
+        identical frames is rendered, the other frames are linked to it.
+
+        Savers missing the same frames are rendered together, once per
+        missing frame range. Savers without frames to render are not
+        rendered. Savers rendering a movie are always rendered for the full
+        frame range.
+
+        Returns:
+            tuple[dict[str, RenderJournal], list[tuple], list[tuple]]:
+                Journal per Saver name, the start frame, end frame and
+                Savers per pass and the source and destination path of
+                frames to link after the render.
+
+        """
+        journals = {}
+        frame_links = []
+        savers_by_ranges = collections.defaultdict(list)
+        for saver in savers:
+            frame_paths = get_saver_frame_paths(saver, frame_start, frame_end)
+            frame_hashes = None
+            if frame_paths is not None:
+                frame_hashes = get_saver_frame_hashes(
+                    saver, frame_start, frame_end
+                )
+            if frame_hashes is None:
+                savers_by_ranges[((frame_start, frame_end),)].append(saver)
+                continue
+
+            missing = sorted(frame_paths)
+            if self.resume_renders or self.skip_unchanged_frames:
+                journal = RenderJournal.for_saver(
+                    saver, frame_paths, frame_hashes
+                )
+                journals[saver.Name] = journal
+                invalidated = journal.load(
+                    reuse_finished=self.skip_unchanged_frames
+                )
+                if invalidated:
+                    self.log.info(
+                        f"Invalidated {invalidated} journaled frames of "
+                        f"{saver.Name}, their upstream graph or files "
+                        "changed"
+                    )
+                missing = journal.get_missing_frames()
+                rendered = len(frame_paths) - len(missing)
+                if rendered and missing:
+                    self.log.info(
+                        f"Reusing {rendered} unchanged frames of "
+                        f"{saver.Name}, {len(missing)} frames to render"
+                    )
+
+            if self.render_held_frames_once:
+                missing, links = self._get_held_frame_links(
+                    frame_paths, frame_hashes, missing
+                )
+                if links:
+                    self.log.info(
+                        f"Rendering held frames of {saver.Name} once, "
+                        f"{len(links)} frames are linked instead"
+                    )
+                frame_links.extend(links)
+
+            if not missing:
+                self.log.info(f"Skipping {saver.Name}, no frames to render")
+                continue
+            ranges = tuple(get_frame_ranges(missing))
+            savers_by_ranges[ranges].append(saver)
+
+        render_passes = [
+            (start, end, ranges_savers)
+            for ranges, ranges_savers in savers_by_ranges.items()
+            for start, end in ranges
+        ]
+        render_passes.sort(key=lambda render_pass: render_pass[:2])
+        return journals, render_passes, frame_links
+
+    @staticmethod
+    def _get_held_frame_links(frame_paths, frame_hashes, missing):
+        """Return missing frames to render and the held frames to link.
+
+        Of each span of identical frames only the first frame is rendered,
+        the missing other frames of the span are linked to it.
+
+        Returns:
+            tuple[list[int], list[tuple[str, str]]]: Frames to render and
+                the source and destination path of each frame to link.
+
+        """
+        missing = set(missing)
+        links = []
+        for span_start, span_end in get_held_frame_spans(frame_hashes):
+            for frame in range(span_start + 1, span_end + 1):
+                if frame in missing:
+                    missing.remove(frame)
+                    links.append(
+                        (frame_paths[span_start], frame_paths[frame])
+                    )
+        return sorted(missing), links
+
+    def _link_held_frames(self, frame_links):
+        """Link the held frames to the rendered first frame of their span.
+
+        Returns:
+            bool: Whether all frames were linked.
+
+        """
+        hardlinked = 0
+        for src, dst in frame_links:
+            try:
+                hardlinked += link_frame(src, dst)
+            except OSError as exc:
+                self.log.error(f"Failed to link held frame {dst}: {exc}")
+                return False
+        self.log.info(
+            f"Skipped rendering {len(frame_links)} held frames, "
+            f"{hardlinked} hardlinked and "
+            f"{len(frame_links) - hardlinked} copied"
+        )
+        return True
+
+    def _render_pass(
+        self, comp, frame_start, frame_end, savers, journals, frame_times
+    ):
+        """Render the frame range of only the Savers.
+
+        The render seconds per frame and the startup seconds of the render
+        are added to `frame_times` per Saver name, with the names of the
+        other Savers rendered in the same render, which share the time. In
+        the publisher UI the render can be cancelled from a progress dialog.
+
+        Returns:
+            tuple[bool, Optional[int]]: Whether the render succeeded and
+                the last frame Fusion finished rendering.
+
+        """
+        saver_names = ", ".join(saver.Name for saver in savers)
+        self.log.info(
+            f"Rendering frames {frame_start}-{frame_end} of: {saver_names}"
+        )
+        pass_journals = [
+            journals[saver.Name] for saver in savers
+            if saver.Name in journals
+        ]
+        last_save = time.time()
+        dialog = self._create_progress_dialog(
+            f"Rendering frames {frame_start}-{frame_end}",
+            frame_end - frame_start + 1
+        )
+
+        def on_idle():
+            self._process_ui_events()
+            return dialog is not None and dialog.wasCanceled()
+
+        def on_progress(frame, done, total, elapsed):
+            nonlocal last_save
+            self._log_progress(frame, done, total, elapsed)
+            if dialog is not None:
+                dialog.setValue(done)
+            if not pass_journals:
+                return
+            for journal in pass_journals:
+                journal.record_frames(frame_end=frame)
+            if time.time() - last_save >= self.journal_save_interval:
+                for journal in pass_journals:
+                    journal.save()
+                last_save = time.time()
+
+        # Fusion may write into the existing file of a frame, so remove
+        # frames sharing their file with held frames or published versions
+        for saver in savers:
+            frame_paths = get_saver_frame_paths(saver, frame_start, frame_end)
+            if frame_paths is None:
+                unlink_shared_frames([get_saver_output_path(saver)])
+            else:
+                unlink_shared_frames(frame_paths.values())
+
+        driver = RenderDriver(
+            comp,
+            frame_start,
+            frame_end,
+            render_flags=REQF_Quiet if self.suppress_dialogs else None,
+            progress_callback=on_progress,
+            idle_callback=on_idle,
+            timeout=self.render_timeout or None,
+            frame_exists_callback=lambda frame: all(
+                self._is_frame_written(saver, frame) for saver in savers
+            ),
+        )
+        try:
+            with enabled_savers(comp, savers):
+                render_result = driver.render()
+        finally:
+            if dialog is not None:
+                dialog.close()
+                dialog.deleteLater()
+        pass_saver_names = {saver.Name for saver in savers}
+        for saver in savers:
+            saver_times = frame_times.setdefault(saver.Name, {
+                "frames": {},
+                "startup": 0.0,
+                "rendered_with": set(),
+            })
+            saver_times["frames"].update(render_result["frame_times"])
+            saver_times["startup"] += render_result["startup"] or 0.0
+            saver_times["rendered_with"].update(
+                pass_saver_names - {saver.Name}
+            )
+        if render_result["cancelled"]:
+            self.log.warning("Render was cancelled")
+        return render_result["success"], render_result["last_frame"]
+
+    def _report_frame_times(self, instances, frame_times):
+        """Store, log and write the render time per frame of each instance.
+
+        The render times of the instance's Saver and their summary are
+        stored in the instance data and written as JSON next to its output.
+        The times are those of the renders of the Saver, which it shares
+        with the Savers listed as rendered with it. Slow outlier frames are
+        logged as warnings.
+        """
+        for instance in instances:
+            saver_times = frame_times.get(instance.data["tool"].Name)
+            if not saver_times or not saver_times["frames"]:
+                continue
+            times = saver_times["frames"]
+            summary = get_frame_times_summary(
+                times, threshold=self.slow_frame_threshold
+            )
+            self.log.info(
+                "Rendered {} frames of {} in {:.1f}s after {:.1f}s startup, "
+                "mean {:.2f}s, median {:.2f}s, slowest {:.2f}s at "
+                "frame {}".format(
+                    summary["frames"],
+                    instance.data["name"],
+                    summary["total"],
+                    saver_times["startup"],
+                    summary["mean"],
+                    summary["median"],
+                    summary["max"],
+                    summary["max_frame"],
+                )
+            )
+            for frame in summary["slow_frames"]:
+                ratio = float("inf")
+                if summary["median"]:
+                    ratio = times[frame] / summary["median"]
+                self.log.warning(
+                    "Slow frame {} of {}: {:.2f}s, {:.1f}x the median".format(
+                        frame,
+                        instance.data["name"],
+                        times[frame],
+                        ratio,
+                    )
+                )
+
+            data = {
+                "summary": summary,
+                "startup": saver_times["startup"],
+                "rendered_with": sorted(saver_times["rendered_with"]),
+                "frames": {
+                    str(frame): seconds
+                    for frame, seconds in sorted(times.items())
+                },
+            }
+            instance.data["fusionRenderFrameTimes"] = data
+            path = instance.data["expectedFiles"][0]
+            head, _, _ = get_frame_path(os.path.basename(path))
+            sidecar_path = os.path.join(
+                os.path.dirname(path),
+                "{}.frame_times.json".format(head.rstrip("._")),
+            )
+            try:
+                with open(sidecar_path, "w") as stream:
+                    json.dump(data, stream, indent=4)
+            except OSError as exc:
+                self.log.warning(
+                    f"Failed to write frame times {sidecar_path}: {exc}"
+                )
+
+    def _log_progress(self, frame, done, total, elapsed):
+        remaining = elapsed / done * (total - done) if done else 0
+        self.log.info(
+            f"Rendered frame {frame} ({done}/{total}), "
+            f"elapsed {elapsed:.1f}s, remaining {remaining:.1f}s"
+        )
+
+    @staticmethod
+    def _is_frame_written(saver, frame):
+        """Return whether the Saver's output of the frame exists."""
+        frame_paths = get_saver_frame_paths(saver, frame, frame)
+        if frame_paths is None:
+            return os.path.exists(get_saver_output_path(saver))
+        return os.path.exists(frame_paths[frame])
+
+    @staticmethod
+    def _create_progress_dialog(label, total):
+        """Return dialog to cancel the render, None without UI."""
+        if QtWidgets.QApplication.instance() is None:
+            return None
+        dialog = QtWidgets.QProgressDialog(label, "Cancel render", 0, total)
+        dialog.setWindowTitle("Render Local")
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.setValue(0)
+        dialog.show()
+        return dialog
+
+    @staticmethod
+    def _process_ui_events():
+        """Keep the publisher UI responsive while rendering."""
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.processEvents()
+
+    def _finish_copy(self, copier):
+        """Wait for the scratch frames to be copied to the output paths.
+
+        Returns:
+            bool: Whether all frames were copied and verified.
+
+        """
+        report = copier.finish()
+        for error in report["errors"]:
+            self.log.error(f"Failed to copy rendered frame: {error}")
+        self.log.info(
+            "Copied {} frames ({:.1f} MB) from scratch in {:.1f}s, "
+            "{} recopied after verification".format(
+                report["files"],
+                report["bytes"] / (1024 * 1024),
+                report["seconds"],
+                report["recopied"],
+            )
+        )
+        if report["errors"]:
+            # Keep the scratch frames so they can be recovered
+            return False
+        copier.cleanup()
+        return True
+
     def _add_representation(self, instance):
         """Add representation to instance"""
 
@@ -169,20 +641,24 @@ class FusionRenderLocal(
             "stagingDir": staging_dir,
         }
 
-        self.set_representation_colorspace(
-            representation=repre,
-            context=instance.context,
-        )
-
-        # review representation
-        if instance.data.get("review", False):
-            repre["tags"] = ["review"]
+        self.set_representation_colorspace_cached(repre, instance)
 
         # add the repre to the instance
         if "representations" not in instance.data:
             instance.data["representations"] = []
         instance.data["representations"].append(repre)
 
+        # review representation, from the review Saver output if rendered
+        if instance.data.get("review", False):
+            review_repre = get_review_saver_representation(instance)
+            if review_repre:
+                self.set_representation_colorspace_cached(
+                    review_repre, instance
+                )
+                instance.data["representations"].append(review_repre)
+            else:
+                repre["tags"] = ["review"]
+
         return instance
 
     def get_render_instances_by_frame_range(self, context):
@@ -0,0 +1,179 @@
+import os
+import copy
+
+import clique
+import pyblish.api
+
+from ayon_core.pipeline import OptionalPyblishPluginMixin
+from ayon_core.pipeline.publish import get_publish_template_name
+
+
+def get_existing_parent(path):
+    """Return the nearest existing parent folder of a path."""
+    path = os.path.dirname(os.path.abspath(path))
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    return path
+
+
+def is_same_filesystem(src, dst):
+    """Return whether `dst` would be on the same filesystem as `src`."""
+    parent = get_existing_parent(dst)
+    if parent is None:
+        return False
+    return os.stat(src).st_dev == os.stat(parent).st_dev
+
+
+class PrepareFramesHardlinks(
+    pyblish.api.InstancePlugin, OptionalPyblishPluginMixin
+):
+    """Publish existing frames as hardlinks instead of copying them.
+
+    For instances publishing existing frames the integrator copies every
+    frame from the render folder to the publish folder. When both are on
+    the same filesystem the frames are instead added to the instance's
+    "hardlinks" transfers, which override the integrator's copy of the same
+    destination path. Frames on another filesystem are copied as before.
+    """
+
+    order = pyblish.api.IntegratorOrder - 0.05
+    label = "Prepare Frames Hardlinks"
+    hosts = ["fusion"]
+    families = ["render.frames"]
+    settings_category = "fusion"
+    optional = True
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        context = instance.context
+        anatomy = context.data["anatomy"]
+        anatomy_data = instance.data["anatomyData"]
+        task_info = anatomy_data.get("task") or {}
+        template_name = get_publish_template_name(
+            project_name=context.data["projectName"],
+            host_name=context.data["hostName"],
+            product_type=instance.data["productType"],
+            task_name=task_info.get("name"),
+            task_type=task_info.get("type"),
+            project_settings=context.data["project_settings"],
+            logger=self.log,
+        )
+        path_template = anatomy.get_template_item(
+            "publish", template_name, "path"
+        )
+        frame_padding = anatomy.templates_obj.frame_padding
+
+        hardlinks = []
+        linked_bytes = 0
+        copied_files = 0
+        for repre in instance.data.get("representations", []):
+            if "delete" in repre.get("tags", []):
+                continue
+            files = repre["files"]
+            if not isinstance(files, (list, tuple)):
+                continue
+
+            collections, _ = clique.assemble(files)
+            if len(collections) != 1:
+                continue
+            collection = collections[0]
+
+            template_data = copy.deepcopy(anatomy_data)
+            template_data["representation"] = repre["name"]
+            template_data["ext"] = repre["ext"]
+            template_data["root"] = anatomy.roots
+
+            # Frame numbers are offset like in the integrator when the
+            # representation's frame start differs from the files
+            frame_offset = 0
+            if repre.get("frameStart") is not None:
+                frame_offset = int(repre["frameStart"]) - min(
+                    collection.indexes
+                )
+
+            for index, filename in zip(
+                sorted(collection.indexes), collection
+            ):
+                src = os.path.join(repre["stagingDir"], filename)
+                template_data["frame"] = str(index + frame_offset).zfill(
+                    frame_padding
+                )
+                dst = os.path.normpath(
+                    path_template.format_strict(template_data)
+                )
+                if not is_same_filesystem(src, dst):
+                    copied_files += 1
+                    continue
+                hardlinks.append((src, dst))
+                linked_bytes += os.path.getsize(src)
+
+        if not hardlinks:
+            self.log.debug(
+                "No frames on the same filesystem as the publish folder."
+            )
+            return
+
+        instance.data.setdefault("hardlinks", []).extend(hardlinks)
+        instance.data["fusionFramesHardlinks"] = {
+            "hardlinks": hardlinks,
+            "bytes": linked_bytes,
+        }
+        self.log.info(
+            "Publishing {} frames as hardlinks, avoiding {:.1f} MB of "
+            "copies. {} frames on other filesystems are copied.".format(
+                len(hardlinks), linked_bytes / (1024 * 1024), copied_files
+            )
+        )
+
+
+class ReportFramesHardlinks(pyblish.api.InstancePlugin):
+    """Report frames published as hardlinks by `PrepareFramesHardlinks`.
+
+    Hardlinks to destinations the integrator did not publish to are
+    removed again, in that case the integrator copied the frames.
+    """
+
+    order = pyblish.api.IntegratorOrder + 0.05
+    label = "Report Frames Hardlinks"
+    hosts = ["fusion"]
+    families = ["render.frames"]
+
+    def process(self, instance):
+        data = instance.data.get("fusionFramesHardlinks")
+        if not data:
+            return
+
+        published_files = set()
+        for repre_data in instance.data.get(
+            "published_representations", {}
+        ).values():
+            published_files.update(
+                os.path.normpath(path)
+                for path in repre_data.get("published_files", [])
+            )
+
+        linked = 0
+        linked_bytes = 0
+        for src, dst in data["hardlinks"]:
+            if dst not in published_files:
+                self.log.warning(
+                    f"Removing hardlink not published by integrator: {dst}"
+                )
+                if os.path.exists(dst):
+                    os.remove(dst)
+                continue
+            if os.path.exists(dst) and os.path.samefile(src, dst):
+                linked += 1
+                linked_bytes += os.path.getsize(dst)
+
+        self.log.info(
+            "Published {}/{} frames as hardlinks, {:.1f} MB not "
+            "copied.".format(
+                linked, len(data["hardlinks"]), linked_bytes / (1024 * 1024)
+            )
+        )
@@ -0,0 +1,442 @@
+"""Relink file paths in `.comp` files to new roots without Fusion.
+
+When project roots move, e.g. between sites, the paths of Loader clips,
+Saver clips, FBX `ImportFile` and USD/Alembic `Filename` inputs of every
+workfile need to point to the new location. This rewrites those paths in
+the `.comp` file text in a process pool.
+
+Paths using a Fusion PathMap (e.g. `Comp:\\renders\\file.exr`) are kept as
+is. The absolute paths of the PathMaps defined in the comp preferences are
+relinked instead, so the relative forms keep working.
+"""
+import os
+import re
+import glob
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from ayon_fusion import comp_file
+
+# Input names of tools which hold a file path as string value
+PATH_INPUT_NAMES = {"ImportFile", "Filename"}
+
+# A PathMap prefix like `Comp:` or `Temp:`, single letters are drives
+_PATH_MAP_RE = re.compile(r"^([A-Za-z][A-Za-z0-9_.]+:)(.*)$")
+_WINDOWS_PATH_RE = re.compile(r"^([A-Za-z]:|\\\\|//)")
+_FRAME_NUMBER_RE = re.compile(r"(\d+)(\.[^.\\/]+)$")
+
+
+def iter_tool_paths(tool):
+    """Yield file path string values of a tool.
+
+    Yields:
+        tuple[str, comp_file.StringValue]: Kind of path ("loader", "saver"
+            or "input") and its string value.
+
+    """
+    if tool.type_name == "Loader":
+        clips = tool.get_table("Clips")
+        if clips is not None:
+            for clip in clips.get_tables("Clip"):
+                filename = clip.get_string("Filename")
+                if filename is not None:
+                    yield "loader", filename
+
+    inputs = tool.get_table("Inputs")
+    if inputs is None:
+        return
+
+    for tool_input in inputs.get_tables("Input"):
+        if tool_input.key == "Clip" and tool.type_name == "Saver":
+            clip = tool_input.get_table("Value")
+            filename = clip.get_string("Filename") if clip else None
+            if filename is not None:
+                yield "saver", filename
+
+        elif tool_input.key in PATH_INPUT_NAMES:
+            value = tool_input.get_string("Value")
+            if value is not None:
+                yield "input", value
+
+
+def iter_comp_paths(text):
+    """Yield file path string values of all tools in the comp.
+
+    Yields:
+        tuple[str, str, comp_file.StringValue]: Tool name, kind of path
+            and its string value. Saver outputs listed in the composition's
+            `OutputClips` are yielded with tool name None.
+
+    """
+    for tool in comp_file.iter_tools(text):
+        for kind, value in iter_tool_paths(tool):
+            yield tool.key, kind, value
+
+    output_clips = comp_file.get_root_table(text).get_table("OutputClips")
+    if output_clips is not None:
+        for child in output_clips.iter_children():
+            if isinstance(child, comp_file.StringValue):
+                yield None, "saver", child
+
+
+def get_path_maps(text):
+    """Return PathMaps defined in the comp preferences.
+
+    Returns:
+        dict[str, comp_file.StringValue]: Path values by PathMap name,
+            e.g. "Comp:".
+
+    """
+    root = comp_file.get_root_table(text)
+    path_map = root.get_path("Prefs", "Comp", "Paths", "Map")
+    if path_map is None:
+        return {}
+    return {
+        child.key: child
+        for child in path_map.iter_children()
+        if isinstance(child, comp_file.StringValue) and child.key
+    }
+
+
+def is_path_map_path(path):
+    """Return whether path is relative to a Fusion PathMap."""
+    return bool(_PATH_MAP_RE.match(path))
+
+
+def _normalize(path):
+    path = path.replace("\\", "/").rstrip("/")
+    if _WINDOWS_PATH_RE.match(path):
+        path = path.lower()
+    return path
+
+
+def remap_path(path, mappings):
+    """Return path relinked to the destination of the matching mapping.
+
+    Args:
+        path (str): Absolute path.
+        mappings (list[tuple[str, str]]): Source and destination roots.
+
+    Returns:
+        Optional[str]: New path or None if no mapping matches.
+
+    """
+    normalized = _normalize(path)
+    # Longest source root wins, for nested roots
+    for source, destination in sorted(
+        mappings, key=lambda item: len(item[0]), reverse=True
+    ):
+        source = _normalize(source)
+        if not source:
+            continue
+        if normalized != source and not normalized.startswith(source + "/"):
+            continue
+
+        remainder = path.replace("\\", "/")[len(source):].lstrip("/")
+        destination = destination.replace("\\", "/").rstrip("/")
+        new_path = f"{destination}/{remainder}" if remainder else destination
+        # Keep trailing separator, e.g. of PathMap values
+        if path[-1:] in ("/", "\\") and not remainder:
+            new_path += "/"
+        if _WINDOWS_PATH_RE.match(destination):
+            new_path = new_path.replace("/", "\\")
+        return new_path
+    return None
+
+
+def resolve_path(path, path_maps, comp_path):
+    """Return absolute path with PathMaps expanded.
+
+    Args:
+        path (str): Path which may use a PathMap.
+        path_maps (dict[str, str]): PathMap values by PathMap name.
+        comp_path (str): Path of the comp, used for the `Comp:` PathMap.
+
+    Returns:
+        Optional[str]: The absolute path or None if a PathMap is not
+            defined in the comp.
+
+    """
+    for _ in range(10):
+        match = _PATH_MAP_RE.match(path)
+        if not match:
+            return path
+        name, remainder = match.groups()
+        if name in path_maps:
+            base = path_maps[name]
+        elif name.lower() == "comp:":
+            base = os.path.dirname(comp_path)
+        else:
+            return None
+        path = os.path.join(base, remainder.lstrip("\\/"))
+    return None
+
+
+def reverse_map_path(path, path_maps, comp_path):
+    """Return absolute path relative to the PathMap containing it.
+
+    Like Fusion's `comp.ReverseMapPath` the PathMap with the longest
+    matching path is used. Only the PathMaps defined in the comp and the
+    `Comp:` PathMap are known without Fusion.
+
+    Args:
+        path (str): Absolute path.
+        path_maps (dict[str, str]): PathMap values by PathMap name.
+        comp_path (str): Path of the comp, used for the `Comp:` PathMap.
+
+    Returns:
+        str: The path using a PathMap, or the path itself if no PathMap
+            contains it.
+
+    """
+    names = list(path_maps)
+    if not any(name.lower() == "comp:" for name in names):
+        names.append("Comp:")
+
+    normalized = _normalize(path)
+    best_name = best_base = None
+    for name in names:
+        if ";" in path_maps.get(name, ""):
+            # PathMaps with multiple paths are search paths
+            continue
+        base = resolve_path(name, path_maps, comp_path)
+        base = _normalize(base) if base else ""
+        if not base or not normalized.startswith(base + "/"):
+            continue
+        if best_base is None or len(base) > len(best_base):
+            best_name, best_base = name, base
+
+    if best_name is None:
+        return path
+    remainder = path.replace("\\", "/")[len(best_base):].lstrip("/")
+    if "\\" in path:
+        remainder = remainder.replace("/", "\\")
+    return f"{best_name}{remainder}"
+
+
+def _sequence_exists(path):
+    if os.path.exists(path):
+        return True
+    match = _FRAME_NUMBER_RE.search(os.path.basename(path))
+    if not match:
+        return False
+    # Fusion stores the first frame, check for any frame of the sequence
+    prefix = os.path.basename(path)[:match.start(1)]
+    pattern = "{}{}{}".format(
+        glob.escape(prefix), "[0-9]" * len(match.group(1)), match.group(2)
+    )
+    return bool(glob.glob(os.path.join(glob.escape(
+        os.path.dirname(path)), pattern
+    )))
+
+
+def verify_comp_paths(path, text):
+    """Return file paths of the comp which can't be resolved.
+
+    Loader and input paths must exist, for Saver paths only the output
+    directory must exist.
+
+    Returns:
+        list[dict]: Unresolved paths with "tool", "path" and "reason".
+
+    """
+    path_maps = {
+        name: value.value for name, value in get_path_maps(text).items()
+    }
+    unresolved = []
+    for tool_name, kind, value in iter_comp_paths(text):
+        resolved = resolve_path(value.value.replace("\\", os.sep),
+                                path_maps, path)
+        reason = None
+        if resolved is None:
+            reason = "PathMap not defined in comp"
+        elif kind == "saver":
+            if not os.path.isdir(os.path.dirname(resolved)):
+                reason = "Output directory does not exist"
+        elif not _sequence_exists(resolved):
+            reason = "File does not exist"
+
+        if reason:
+            unresolved.append({
+                "tool": tool_name,
+                "path": value.value,
+                "reason": reason,
+            })
+    return unresolved
+
+
+def relink_comp_file(path, mappings, dry_run=False, verify=True):
+    """Relink paths in comp file.
+
+    Args:
+        path (str): Path to comp file.
+        mappings (list[tuple[str, str]]): Source and destination roots.
+        dry_run (bool): When enabled only the diff is computed.
+        verify (bool): Report paths which can't be resolved after relink.
+
+    Returns:
+        dict: Result with "path", "relinked" (list of tool name, old and
+            new path), "unresolved", "diff" and "error" keys.
+
+    """
+    result = {
+        "path": path,
+        "relinked": [],
+        "unresolved": [],
+        "diff": "",
+        "error": None,
+    }
+    try:
+        text = comp_file.read_comp_file(path)
+        items = [
+            (tool_name, value)
+            for tool_name, _kind, value in iter_comp_paths(text)
+        ]
+        items.extend(
+            (name, value) for name, value in get_path_maps(text).items()
+        )
+
+        replacements = []
+        for name, value in items:
+            if is_path_map_path(value.value):
+                continue
+            new_path = remap_path(value.value, mappings)
+            if new_path is None or new_path == value.value:
+                continue
+            replacements.append((
+                value.start,
+                value.end,
+                comp_file.encode_lua_string(new_path)
+            ))
+            result["relinked"].append((name, value.value, new_path))
+
+        new_text = text
+        if replacements:
+            new_text = comp_file.apply_replacements(text, replacements)
+            result["diff"] = comp_file.get_diff(path, text, new_text)
+            if not dry_run:
+                comp_file.write_comp_file(path, new_text)
+
+        if verify:
+            result["unresolved"] = verify_comp_paths(path, new_text)
+    except (OSError, comp_file.CompFileError) as exc:
+        result["error"] = str(exc)
+    return result
+
+
+def relink_comp_files(
+    paths, mappings, dry_run=False, verify=True, workers=None
+):
+    """Relink paths in comp files in a process pool.
+
+    Paths are consumed lazily and only a limited amount of files is queued
+    at a time, so `paths` can be a generator walking a large project tree.
+
+    Args:
+        paths (Iterable[str]): Comp file paths.
+        mappings (list[tuple[str, str]]): Source and destination roots.
+        dry_run (bool): Only compute the diffs, don't write the comp files.
+        verify (bool): Report paths which can't be resolved after relink.
+        workers (Optional[int]): Amount of processes to use.
+
+    Yields:
+        dict: Result of `relink_comp_file` per comp file, in order of
+            completion.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 4
+    paths = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(
+                    relink_comp_file, path, mappings, dry_run, verify
+                ))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def get_anatomy_root_mappings(
+    project_name, source_site=None, destination_site=None, platform=None
+):
+    """Return source and destination roots of project anatomy.
+
+    Roots of the source site for all platforms are mapped to the root with
+    the same name of the destination site for the target platform.
+
+    Args:
+        project_name (str): Project name.
+        source_site (Optional[str]): Site name of the current paths.
+        destination_site (Optional[str]): Site name of the new paths.
+        platform (Optional[str]): Platform of the new paths, e.g. "windows".
+            Defaults to the current platform.
+
+    Returns:
+        list[tuple[str, str]]: Source and destination roots.
+
+    """
+    import platform as _platform
+    from ayon_core.pipeline import Anatomy
+
+    platform = (platform or _platform.system()).lower()
+    source_roots = Anatomy(project_name, site_name=source_site).roots
+    destination_roots = Anatomy(project_name, site_name=destination_site).roots
+
+    mappings = []
+    for root_name, source_root in source_roots.items():
+        destination_root = destination_roots.get(root_name)
+        if destination_root is None:
+            continue
+        destination = _get_root_platform_value(destination_root, platform)
+        if not destination:
+            continue
+        for source in _get_root_values(source_root):
+            if _normalize(source) != _normalize(destination):
+                mappings.append((source, destination))
+    return mappings
+
+
+def _get_root_values(root):
+    raw_data = root.raw_data
+    if isinstance(raw_data, dict):
+        return [value for value in raw_data.values() if value]
+    return [raw_data] if raw_data else []
+
+
+def _get_root_platform_value(root, platform):
+    raw_data = root.raw_data
+    if isinstance(raw_data, dict):
+        return raw_data.get(platform)
+    return raw_data
+
+
+def format_result(result):
+    """Return human readable lines of a `relink_comp_file` result."""
+    lines = []
+    if result["error"]:
+        lines.append(f"FAILED {result['path']}: {result['error']}")
+        return lines
+
+    lines.append(
+        "{} {} ({} relinked, {} unresolved)".format(
+            "RELINK" if result["relinked"] else "OK    ",
+            result["path"],
+            len(result["relinked"]),
+            len(result["unresolved"]),
+        )
+    )
+    for item in result["unresolved"]:
+        lines.append(
+            f"    {item['tool'] or 'OutputClips'}: {item['path']} "
+            f"- {item['reason']}"
+        )
+    return lines
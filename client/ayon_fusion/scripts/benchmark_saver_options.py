@@ -0,0 +1,192 @@
+"""Benchmark write time and size per frame of Saver EXR options.
+
+Renders a few frames of a Saver with each EXR compression and depth option
+into a temporary folder next to the Saver's output, so the numbers reflect
+the storage the renders are written to. Run it in Fusion's Python console
+with a Saver selected:
+
+    from ayon_fusion.scripts import benchmark_saver_options
+    benchmark_saver_options.main()
+"""
+import os
+import time
+import shutil
+import tempfile
+import itertools
+
+from ayon_fusion.api import get_current_comp
+from ayon_fusion.api.lib import (
+    enabled_savers,
+    maintained_comp_range,
+    REQF_Quiet,
+)
+from ayon_fusion.api.plugin import (
+    SAVER_FORMAT_OPTIONS,
+    EXR_COMPRESSION_VALUES,
+    EXR_DEPTH_VALUES,
+    set_saver_format_options,
+)
+
+
+def get_default_options():
+    """Return all combinations of EXR compression and depth options."""
+    compressions = [key for key in EXR_COMPRESSION_VALUES if key != "default"]
+    depths = [key for key in EXR_DEPTH_VALUES if key != "default"]
+    return [
+        {"exr_compression": compression, "exr_depth": depth}
+        for compression, depth in itertools.product(compressions, depths)
+    ]
+
+
+def _render(comp, frame_start, frame_end):
+    return comp.Render({
+        "Start": frame_start,
+        "End": frame_end,
+        "Wait": True,
+        "RenderFlags": REQF_Quiet,
+    })
+
+
+def _get_folder_size(path):
+    sizes = [
+        entry.stat().st_size for entry in os.scandir(path) if entry.is_file()
+    ]
+    return sum(sizes), len(sizes)
+
+
+def benchmark_saver_options(
+    saver,
+    frame_start,
+    frame_end,
+    options_list=None,
+    output_dir=None,
+    keep_files=False,
+):
+    """Render frames of a Saver with each option and measure the output.
+
+    The upstream tools are rendered once before the benchmark, so with
+    Fusion's cache the measured time is mostly the encoding and writing of
+    the frames.
+
+    Args:
+        saver (Tool): The Saver to benchmark.
+        frame_start (int): First frame to render.
+        frame_end (int): Last frame to render.
+        options_list (Optional[list[dict]]): Options to benchmark, defaults
+            to all EXR compression and depth combinations.
+        output_dir (Optional[str]): Folder to create the temporary folder
+            of the benchmark renders in. Defaults to the folder of the
+            Saver's output.
+        keep_files (bool): Keep the rendered benchmark files, otherwise
+            only the temporary folder is removed.
+
+    Returns:
+        list[dict]: Result per option with "options", "success", "frames",
+            "seconds", "bytes", "seconds_per_frame", "bytes_per_frame" and
+            the "path" of the rendered files.
+
+    """
+    comp = saver.Composition
+    if options_list is None:
+        options_list = get_default_options()
+
+    original_clip = saver["Clip"][comp.TIME_UNDEFINED]
+    if output_dir is None:
+        output_dir = os.path.dirname(comp.MapPath(original_clip))
+    os.makedirs(output_dir, exist_ok=True)
+    benchmark_dir = tempfile.mkdtemp(
+        prefix="_saver_benchmark_", dir=output_dir
+    )
+
+    input_names = [
+        input_name
+        for input_name, _values in SAVER_FORMAT_OPTIONS["exr"].values()
+    ]
+    original_inputs = {
+        input_name: saver.GetInput(input_name) for input_name in input_names
+    }
+
+    results = []
+    try:
+        with maintained_comp_range(comp), enabled_savers(comp, [saver]):
+            # Warm up Fusion's cache of the upstream tools
+            warmup_dir = os.path.join(benchmark_dir, "warmup")
+            os.makedirs(warmup_dir)
+            saver["Clip"] = os.path.join(warmup_dir, "benchmark.0000.exr")
+            _render(comp, frame_start, frame_end)
+
+            for options in options_list:
+                label = "_".join(str(value) for value in options.values())
+                option_dir = os.path.join(benchmark_dir, label)
+                os.makedirs(option_dir, exist_ok=True)
+                saver["Clip"] = os.path.join(option_dir, "benchmark.0000.exr")
+                set_saver_format_options(saver, "exr", options)
+
+                start = time.perf_counter()
+                success = _render(comp, frame_start, frame_end)
+                seconds = time.perf_counter() - start
+
+                size, frames = _get_folder_size(option_dir)
+                results.append({
+                    "options": options,
+                    "success": bool(success),
+                    "frames": frames,
+                    "seconds": seconds,
+                    "bytes": size,
+                    "seconds_per_frame": seconds / frames if frames else 0,
+                    "bytes_per_frame": size / frames if frames else 0,
+                    "path": option_dir,
+                })
+    finally:
+        saver["Clip"] = original_clip
+        for input_name, value in original_inputs.items():
+            if value is not None:
+                saver.SetInput(input_name, value)
+        if not keep_files:
+            shutil.rmtree(benchmark_dir, ignore_errors=True)
+
+    return results
+
+
+def format_results(results):
+    """Return benchmark results as text table, fastest first."""
+    lines = [
+        "{:<24} {:>10} {:>12} {:>10}".format(
+            "Options", "s/frame", "MB/frame", "MB/s"
+        )
+    ]
+    for result in sorted(
+        results, key=lambda item: item["seconds_per_frame"]
+    ):
+        label = " ".join(str(value) for value in result["options"].values())
+        if not result["success"] or not result["frames"]:
+            lines.append(f"{label:<24} {'failed':>10}")
+            continue
+        megabytes = result["bytes_per_frame"] / (1024 * 1024)
+        throughput = (
+            result["bytes"] / (1024 * 1024) / result["seconds"]
+            if result["seconds"] else 0
+        )
+        lines.append(
+            "{:<24} {:>10.3f} {:>12.2f} {:>10.1f}".format(
+                label, result["seconds_per_frame"], megabytes, throughput
+            )
+        )
+    return "\n".join(lines)
+
+
+def main(frames=10):
+    """Benchmark the selected Saver for the first frames of render range."""
+    comp = get_current_comp()
+    savers = list(comp.GetToolList(True, "Saver").values())
+    if not savers:
+        print("Select a Saver to benchmark.")
+        return
+
+    attrs = comp.GetAttrs()
+    frame_start = int(attrs["COMPN_RenderStart"])
+    frame_end = min(int(attrs["COMPN_RenderEnd"]), frame_start + frames - 1)
+
+    results = benchmark_saver_options(savers[0], frame_start, frame_end)
+    print(format_results(results))
+    return results
@@ -2,21 +2,87 @@ from ayon_fusion.api import (
     comp_lock_and_undo_chunk,
     get_current_comp
 )
+from ayon_fusion.api.lib import execute_lua, lua_quote, lua_list
 
+CONNECTIONS_DATA_KEY = "AYON.DuplicateWithInputs.Connections"
 
-def is_connected(input):
-    """Return whether an input has incoming connection"""
-    return input.GetAttrs()["INPB_Connected"]
+# Collect the names and connected inputs of the selected tools in a single
+# remote call instead of querying each input of each tool from Python
+COLLECT_CONNECTIONS_SCRIPT = """
+local result = {tools = {}, connections = {}}
+for index, tool in ipairs(comp:GetToolList(true)) do
+    result.tools[index] = tool.Name
+    for _, input in pairs(tool:GetInputList()) do
+        local output = input:GetConnectedOutput()
+        if output then
+            table.insert(result.connections, {
+                tool = index,
+                input = input:GetAttrs().INPS_ID,
+                source = output:GetTool().Name,
+                output = output:GetAttrs().OUTS_ID,
+            })
+        end
+    end
+end
+comp:SetData(%s, result)
+"""
+
+RESTORE_CONNECTIONS_SCRIPT = """
+local tools = comp:GetToolList(true)
+local connections = {%s}
+for _, connection in ipairs(connections) do
+    local tool = tools[connection[1]]
+    local source = comp:FindTool(connection[3])
+    if tool and source then
+        tool[connection[2]]:ConnectTo(source[connection[4]])
+    end
+end
+"""
+
+
+def get_external_connections(data):
+    """Return connections of the selected tools from unselected tools.
+
+    Connections between the selected tools are kept by Fusion on paste.
+
+    Args:
+        data (dict): Selected tool names and connections collected by
+            `COLLECT_CONNECTIONS_SCRIPT`.
+
+    Returns:
+        list[tuple[int, str, str, str]]: Index of tool in selection, input
+            id, source tool name and source output id.
+
+    """
+    selected = set(lua_list(data.get("tools")))
+    connections = []
+    for connection in lua_list(data.get("connections")):
+        if connection["source"] in selected:
+            continue
+        connections.append((
+            int(connection["tool"]),
+            connection["input"],
+            connection["source"],
+            connection["output"],
+        ))
+    return connections
 
 
 def duplicate_with_input_connections():
     """Duplicate selected tools with incoming connections."""
 
     comp = get_current_comp()
-    original_tools = comp.GetToolList(True).values()
-    if not original_tools:
+    data = execute_lua(
+        comp,
+        COLLECT_CONNECTIONS_SCRIPT % lua_quote(CONNECTIONS_DATA_KEY),
+        result_key=CONNECTIONS_DATA_KEY
+    )
+    if not data or not data.get("tools"):
         return  # nothing selected
 
+    tool_count = len(lua_list(data["tools"]))
+    connections = get_external_connections(data)
+
     with comp_lock_and_undo_chunk(
             comp, "Duplicate With Input Connections"):
 
@@ -24,22 +90,21 @@ def duplicate_with_input_connections():
         comp.Copy()
         comp.SetActiveTool()
         comp.Paste()
-        duplicate_tools = comp.GetToolList(True).values()
-
-        # Copy connections
-        for original, new in zip(original_tools, duplicate_tools):
-
-            original_inputs = original.GetInputList().values()
-            new_inputs = new.GetInputList().values()
-            assert len(original_inputs) == len(new_inputs)
-
-            for original_input, new_input in zip(original_inputs, new_inputs):
-
-                if is_connected(original_input):
 
-                    if is_connected(new_input):
-                        # Already connected if it is between the copied tools
-                        continue
+        duplicate_tools = comp.GetToolList(True)
+        assert len(duplicate_tools) == tool_count, (
+            "Must have pasted all selected tools"
+        )
+        if not connections:
+            return
 
-                    new_input.ConnectTo(original_input.GetConnectedOutput())
-                    assert is_connected(new_input), "Must be connected now"
+        # Connect the duplicates to the inputs of the originals
+        execute_lua(comp, RESTORE_CONNECTIONS_SCRIPT % ", ".join(
+            "{{{}, {}, {}, {}}}".format(
+                index,
+                lua_quote(input_id),
+                lua_quote(source),
+                lua_quote(output_id),
+            )
+            for index, input_id, source, output_id in connections
+        ))
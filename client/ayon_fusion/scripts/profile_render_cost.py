@@ -0,0 +1,280 @@
+"""Attribute the render time of Savers to the tools upstream of them.
+
+Renders a few sample frames of each Saver while setting subtrees of its
+upstream graph to passthrough. The render time a subtree saves is its
+cost, and a tool's own cost is its subtree's cost minus the cost of its
+input subtrees. Only subtrees costing a significant part of the render are
+split further, so cheap parts of the graph take a single render. The Saver
+renders into a temporary folder, so its output is left untouched, and all
+passthrough states are restored afterwards. Run it in Fusion's Python
+console:
+
+    from ayon_fusion.scripts import profile_render_cost
+    profile_render_cost.main()
+"""
+import os
+import json
+import time
+import shutil
+import tempfile
+import contextlib
+
+from ayon_fusion.api import comp_lock_and_undo_chunk, get_current_comp
+from ayon_fusion.api.lib import (
+    enabled_savers,
+    get_connected_input_tools,
+    iter_upstream,
+    maintained_comp_range,
+    passthrough_tools,
+    REQF_Quiet,
+)
+from ayon_fusion.api.render import redirected_savers
+from ayon_fusion.scripts.suggest_disk_caches import get_sample_frames
+
+
+def _render(comp, frames):
+    """Return render time per frame of the frames, None on failure."""
+    start = time.perf_counter()
+    for frame in frames:
+        if not comp.Render({
+            "Start": frame,
+            "End": frame,
+            "Wait": True,
+            "RenderFlags": REQF_Quiet,
+        }):
+            return None
+    return (time.perf_counter() - start) / len(frames)
+
+
+class SaverProfiler:
+    """Attribute the render time of a Saver to its upstream tools.
+
+    Args:
+        saver (Tool): The Saver to profile.
+        frames (list[int]): Sample frames to render.
+        min_fraction (float): Subtrees costing less than this fraction of
+            the Saver's render time are not split further.
+
+    """
+
+    def __init__(self, saver, frames, min_fraction=0.05):
+        self.saver = saver
+        self.comp = saver.Composition
+        self.frames = frames
+        self.min_fraction = min_fraction
+        self.base = None
+        self.renders = 0
+        # Self cost per tool name, of unsplit subtrees including upstream
+        self.costs = {}
+        self.subtrees = {}
+        self._subtree_costs = {}
+
+    def _render(self):
+        self.renders += 1
+        return _render(self.comp, self.frames)
+
+    def _get_subtree_cost(self, tool):
+        """Return the render time saved by setting a subtree passthrough."""
+        if tool.Name in self._subtree_costs:
+            return self._subtree_costs[tool.Name]
+        tools = [tool]
+        tools.extend(iter_upstream(tool))
+        with passthrough_tools(tools):
+            seconds = self._render()
+        cost = None if seconds is None else max(self.base - seconds, 0.0)
+        self._subtree_costs[tool.Name] = cost
+        return cost
+
+    def _attribute(self, tool, cost):
+        """Attribute the cost of a subtree to its tools."""
+        if tool.Name in self.costs:
+            return
+        inputs = {
+            input_tool.Name: input_tool
+            for input_tool in get_connected_input_tools(tool)
+        }
+        significant = (
+            cost is None or cost >= self.base * self.min_fraction
+        )
+        if not inputs or not significant:
+            self.costs[tool.Name] = cost or 0.0
+            self.subtrees[tool.Name] = bool(inputs)
+            return
+
+        input_costs = {
+            name: self._get_subtree_cost(input_tool)
+            for name, input_tool in inputs.items()
+        }
+        for name, input_tool in inputs.items():
+            self._attribute(input_tool, input_costs[name])
+
+        if cost is None or None in input_costs.values():
+            # The render failed with a subtree set to passthrough, so only
+            # set the tool itself to passthrough instead
+            with passthrough_tools([tool]):
+                seconds = self._render()
+            self.costs[tool.Name] = (
+                0.0 if seconds is None else max(self.base - seconds, 0.0)
+            )
+        else:
+            self.costs[tool.Name] = max(
+                cost - sum(input_costs.values()), 0.0
+            )
+        self.subtrees[tool.Name] = False
+
+    def profile(self):
+        """Profile the Saver, restoring all passthrough states.
+
+        The Saver renders into a temporary folder which is removed after.
+
+        Returns:
+            dict: Profile with the Saver's render time per frame as "base",
+                the "costs" per tool, the tools of which the cost includes
+                their upstream tools as "subtrees" and the amount of
+                "renders".
+
+        """
+        comp = self.comp
+        scratch_root = tempfile.mkdtemp(prefix="ayon_fusion_profile_")
+        try:
+            with contextlib.ExitStack() as stack:
+                stack.enter_context(maintained_comp_range(comp))
+                stack.enter_context(enabled_savers(comp, [self.saver]))
+                stack.enter_context(
+                    redirected_savers(comp, [self.saver], scratch_root)
+                )
+                # Render once to load the media before measuring
+                _render(comp, self.frames[:1])
+                self.base = self._render()
+                if self.base is None:
+                    raise RuntimeError(f"Failed to render {self.saver.Name}")
+                self._attribute(self.saver, self.base)
+        finally:
+            shutil.rmtree(scratch_root, ignore_errors=True)
+
+        return {
+            "base": self.base,
+            "costs": self.costs,
+            "subtrees": sorted(
+                name for name, is_subtree in self.subtrees.items()
+                if is_subtree
+            ),
+            "renders": self.renders,
+        }
+
+
+def profile_render_cost(savers, frames, min_fraction=0.05):
+    """Profile the Savers and rank their upstream tools by render time.
+
+    Args:
+        savers (list[Tool]): The Savers to profile.
+        frames (list[int]): Sample frames to render.
+        min_fraction (float): Subtrees costing less than this fraction of
+            a Saver's render time are not split further.
+
+    Returns:
+        dict: The sample "frames", the profile per Saver name as "savers"
+            and the "ranking" of tools over all Savers, most expensive
+            first.
+
+    """
+    comp = savers[0].Composition
+    profiles = {}
+    with comp_lock_and_undo_chunk(comp, "Profile render", keep_undo=False):
+        for saver in savers:
+            profiles[saver.Name] = SaverProfiler(
+                saver, frames, min_fraction=min_fraction
+            ).profile()
+
+    total = sum(profile["base"] for profile in profiles.values())
+    tool_costs = {}
+    for profile in profiles.values():
+        for name, cost in profile["costs"].items():
+            tool_costs[name] = tool_costs.get(name, 0.0) + cost
+    ranking = [
+        {
+            "tool": name,
+            "seconds_per_frame": cost,
+            "fraction": cost / total if total else 0.0,
+            "includes_upstream": any(
+                name in profile["subtrees"] for profile in profiles.values()
+            ),
+        }
+        for name, cost in sorted(
+            tool_costs.items(), key=lambda item: item[1], reverse=True
+        )
+    ]
+    return {"frames": frames, "savers": profiles, "ranking": ranking}
+
+
+def format_report(report, limit=20):
+    """Return the ranking of a profile report as text table."""
+    lines = [
+        "{:<32} {:>10} {:>8}".format("Tool", "s/frame", "%"),
+    ]
+    for item in report["ranking"][:limit]:
+        name = item["tool"]
+        if item["includes_upstream"]:
+            name = f"{name} (+upstream)"
+        lines.append(
+            "{:<32} {:>10.3f} {:>7.1f}%".format(
+                name, item["seconds_per_frame"], item["fraction"] * 100
+            )
+        )
+    renders = sum(
+        profile["renders"] for profile in report["savers"].values()
+    )
+    lines.append(
+        f"{renders} renders of frames "
+        + ", ".join(str(frame) for frame in report["frames"])
+    )
+    return "\n".join(lines)
+
+
+def main(samples=3, min_fraction=0.05, json_path=None):
+    """Profile the selected, or else all enabled, Savers of the comp.
+
+    Args:
+        samples (int): Amount of sample frames over the render range.
+        min_fraction (float): Subtrees costing less than this fraction of
+            a Saver's render time are not split further.
+        json_path (Optional[str]): Path to write the report to, defaults
+            to a file next to the comp.
+
+    Returns:
+        dict: The report.
+
+    """
+    comp = get_current_comp()
+    savers = list(comp.GetToolList(True, "Saver").values())
+    if not savers:
+        savers = [
+            saver for saver in comp.GetToolList(False, "Saver").values()
+            if not saver.GetAttrs()["TOOLB_PassThrough"]
+        ]
+    if not savers:
+        print("No Savers to profile.")
+        return None
+
+    attrs = comp.GetAttrs()
+    frames = get_sample_frames(
+        int(attrs["COMPN_RenderStart"]), int(attrs["COMPN_RenderEnd"]),
+        samples
+    )
+    report = profile_render_cost(savers, frames, min_fraction=min_fraction)
+    print(format_report(report))
+
+    if json_path is None:
+        comp_path = attrs["COMPS_FileName"]
+        if comp_path:
+            json_path = "{}_render_profile.json".format(
+                os.path.splitext(comp_path)[0]
+            )
+        else:
+            json_path = os.path.join(
+                tempfile.gettempdir(), "render_profile.json"
+            )
+    with open(json_path, "w") as stream:
+        json.dump(report, stream, indent=4)
+    print(f"Wrote render profile: {json_path}")
+    return report
@@ -0,0 +1,326 @@
+"""Suggest precomps for expensive branches shared by multiple Savers.
+
+Savers rendered in separate renders, e.g. as separate farm jobs or in
+separate frame range batches, each evaluate the upstream branches they
+share. This finds the shared branches, measures their render time on a few
+sample frames and reports the render time a Saver/Loader precomp of the
+branch would save. Run it in Fusion's Python console:
+
+    from ayon_fusion.scripts import suggest_disk_caches
+    suggestions = suggest_disk_caches.main()
+
+    # Insert a precomp for the first reported suggestion
+    suggest_disk_caches.insert_precomps(suggestions, [0])
+
+The precomp Savers stay enabled. Publish with "Render precomps first" to
+render them before the Savers reading them, and with "Skip unchanged
+frames" to only render their frames again when the branch changed.
+"""
+import os
+import time
+import collections
+
+from ayon_fusion.api import comp_lock_and_undo_chunk, get_current_comp
+from ayon_fusion.api.lib import (
+    enabled_savers,
+    iter_upstream,
+    loader_shift,
+    maintained_comp_range,
+    REQF_Quiet,
+)
+from ayon_fusion.api.render import get_saver_output_path
+
+# Tools which only read media, caching them to disk saves nothing
+SOURCE_TOOL_IDS = {"Loader", "MediaIn"}
+
+
+def get_shared_branches(savers):
+    """Return the most downstream tools shared by multiple Savers.
+
+    Of the tools upstream of the same Savers only the most downstream
+    ones are returned, as their branch includes the others. Branches only
+    reading media are skipped.
+
+    Args:
+        savers (list[Tool]): Savers to find the shared branches of.
+
+    Returns:
+        list[dict]: Per branch its "tool", the "savers" names using it and
+            the names of the "tools" in the branch.
+
+    """
+    tools_by_name = {}
+    users = collections.defaultdict(set)
+    for saver in savers:
+        for tool in iter_upstream(saver):
+            tools_by_name[tool.Name] = tool
+            users[tool.Name].add(saver.Name)
+
+    shared = {
+        name: frozenset(saver_names)
+        for name, saver_names in users.items()
+        if len(saver_names) > 1 and tools_by_name[name].ID != "Saver"
+    }
+    upstream = {
+        name: {tool.Name for tool in iter_upstream(tools_by_name[name])}
+        for name in shared
+    }
+
+    by_users = collections.defaultdict(list)
+    for name, saver_names in shared.items():
+        by_users[saver_names].append(name)
+
+    branches = []
+    for saver_names, names in by_users.items():
+        for name in names:
+            # Skip tools upstream of another tool used by the same Savers
+            if any(name in upstream[other] for other in names):
+                continue
+            branch_tools = upstream[name] | {name}
+            if all(
+                tools_by_name[tool_name].ID in SOURCE_TOOL_IDS
+                for tool_name in branch_tools
+            ):
+                continue
+            branches.append({
+                "tool": tools_by_name[name],
+                "savers": sorted(saver_names),
+                "tools": sorted(branch_tools),
+            })
+    return branches
+
+
+def measure_branch_cost(comp, tool, frames):
+    """Return the render time per frame of a tool and its upstream branch.
+
+    The frames are rendered up to the tool with all Savers disabled, so
+    nothing is written. Results of tools cached by Fusion in an earlier
+    render can make the measured time lower.
+
+    Args:
+        comp (Composition): The comp of the tool.
+        tool (Tool): The most downstream tool of the branch.
+        frames (list[int]): Frames to render.
+
+    Returns:
+        Optional[float]: Seconds per frame, None when the render failed.
+
+    """
+    seconds = 0.0
+    with maintained_comp_range(comp), enabled_savers(comp, []):
+        for frame in frames:
+            start = time.perf_counter()
+            success = comp.Render({
+                "Start": frame,
+                "End": frame,
+                "Tool": tool,
+                "Wait": True,
+                "RenderFlags": REQF_Quiet,
+            })
+            seconds += time.perf_counter() - start
+            if not success:
+                return None
+    return seconds / len(frames)
+
+
+def get_sample_frames(frame_start, frame_end, samples):
+    """Return frames spread evenly over the frame range.
+
+    >>> get_sample_frames(1001, 1100, 3)
+    [1001, 1050, 1100]
+
+    """
+    if samples < 2 or frame_end <= frame_start:
+        return [frame_start]
+    step = (frame_end - frame_start) / (samples - 1)
+    return sorted({
+        int(round(frame_start + step * index)) for index in range(samples)
+    })
+
+
+def suggest_disk_caches(comp, savers, frame_start, frame_end, samples=3):
+    """Return shared branches with their cost and render time saved.
+
+    The render time saved assumes each Saver renders in a separate render,
+    which then evaluates the branch once per Saver instead of once. Reading
+    the precomp frames from disk is not taken into account.
+
+    Args:
+        comp (Composition): The comp of the Savers.
+        savers (list[Tool]): Savers to find the shared branches of.
+        frame_start (int): First frame the Savers render.
+        frame_end (int): Last frame the Savers render.
+        samples (int): Amount of frames to measure the cost on.
+
+    Returns:
+        list[dict]: The shared branches with their "seconds_per_frame" and
+            "seconds_saved", most time saved first.
+
+    """
+    frames = get_sample_frames(frame_start, frame_end, samples)
+    frame_count = frame_end - frame_start + 1
+    suggestions = []
+    for branch in get_shared_branches(savers):
+        cost = measure_branch_cost(comp, branch["tool"], frames)
+        if cost is None:
+            continue
+        branch["seconds_per_frame"] = cost
+        branch["seconds_saved"] = (
+            cost * frame_count * (len(branch["savers"]) - 1)
+        )
+        suggestions.append(branch)
+    suggestions.sort(key=lambda item: item["seconds_saved"], reverse=True)
+    return suggestions
+
+
+def format_suggestions(suggestions):
+    """Return suggestions as text table, most time saved first."""
+    lines = [
+        "{:<4} {:<24} {:>10} {:>12}  {}".format(
+            "#", "Tool", "s/frame", "Saved (s)", "Shared by"
+        )
+    ]
+    for index, suggestion in enumerate(suggestions):
+        lines.append(
+            "{:<4} {:<24} {:>10.3f} {:>12.1f}  {}".format(
+                index,
+                suggestion["tool"].Name,
+                suggestion["seconds_per_frame"],
+                suggestion["seconds_saved"],
+                ", ".join(suggestion["savers"]),
+            )
+        )
+    return "\n".join(lines)
+
+
+def insert_precomp(comp, tool, frame_start, frame_end, output_dir):
+    """Render a tool to disk and read it back with a Loader in its place.
+
+    A Saver writing the tool's output and a Loader reading the rendered
+    frames are added. The inputs connected to the tool are connected to the
+    Loader instead. The precomp Saver stays enabled, so renders of all
+    enabled Savers and publishes with "Render precomps first" render it
+    again and the Loader doesn't read stale frames when the branch changes.
+
+    Args:
+        comp (Composition): The comp of the tool.
+        tool (Tool): The tool to precomp.
+        frame_start (int): First frame to render.
+        frame_end (int): Last frame to render.
+        output_dir (str): Folder to render the precomp frames to.
+
+    Returns:
+        tuple[Tool, Tool]: The precomp Saver and Loader.
+
+    Raises:
+        RuntimeError: When the precomp render failed, the graph is then
+            left unchanged.
+
+    """
+    path = os.path.join(
+        output_dir, tool.Name, "{}.{}.exr".format(tool.Name, "0" * 4)
+    )
+    consumers = list(tool.Output.GetConnectedInputs().values())
+
+    with comp_lock_and_undo_chunk(comp, "Insert precomp"):
+        saver = comp.AddTool("Saver", -32768, -32768)
+        saver.SetAttrs({"TOOLS_Name": f"{tool.Name}_precomp"})
+        saver.ConnectInput("Input", tool)
+        saver["Clip"] = comp.ReverseMapPath(os.path.normpath(path))
+        saver["CreateDir"] = 1
+
+        with maintained_comp_range(comp), enabled_savers(comp, [saver]):
+            success = comp.Render({
+                "Start": frame_start,
+                "End": frame_end,
+                "Wait": True,
+                "RenderFlags": REQF_Quiet,
+            })
+        if not success:
+            saver.Delete()
+            raise RuntimeError(f"Failed to render precomp of {tool.Name}")
+
+        first_frame = os.path.join(
+            os.path.dirname(path),
+            "{}.{}.exr".format(tool.Name, str(frame_start).zfill(4)),
+        )
+        loader = comp.AddTool("Loader", -32768, -32768)
+        loader.SetAttrs({"TOOLS_Name": f"{tool.Name}_precompLoader"})
+        loader["Clip"] = comp.ReverseMapPath(first_frame)
+        loader_shift(loader, frame_start, relative=False)
+        for tool_input in consumers:
+            tool_input.ConnectTo(loader.Output)
+
+    return saver, loader
+
+
+def main(samples=3):
+    """Report shared branches of the enabled Savers of the current comp.
+
+    Args:
+        samples (int): Amount of frames to measure the cost on.
+
+    Returns:
+        list[dict]: The suggestions, in the reported order.
+
+    """
+    comp = get_current_comp()
+    savers = [
+        saver for saver in comp.GetToolList(False, "Saver").values()
+        if not saver.GetAttrs()["TOOLB_PassThrough"]
+    ]
+    frame_start, frame_end = _get_render_range(comp)
+
+    suggestions = suggest_disk_caches(
+        comp, savers, frame_start, frame_end, samples=samples
+    )
+    if not suggestions:
+        print("No branches are shared by multiple Savers.")
+        return suggestions
+    print(format_suggestions(suggestions))
+    return suggestions
+
+
+def insert_precomps(suggestions, indices):
+    """Insert precomps for suggestions returned by `main`.
+
+    The suggestions are not measured again, so the indices refer to the
+    reported table. The precomps are rendered for the comp's render range
+    next to the output of the first Saver sharing the branch.
+
+    Args:
+        suggestions (list[dict]): The suggestions returned by `main`.
+        indices (list[int]): Indices of the suggestions to insert a precomp
+            for.
+
+    Returns:
+        list[tuple[Tool, Tool]]: The inserted precomp Savers and Loaders.
+
+    """
+    precomps = []
+    for index in indices:
+        suggestion = suggestions[index]
+        tool = suggestion["tool"]
+        comp = tool.Comp()
+        frame_start, frame_end = _get_render_range(comp)
+        saver = comp.FindTool(suggestion["savers"][0])
+        output_dir = os.path.join(
+            os.path.dirname(get_saver_output_path(saver)), "precomp"
+        )
+        try:
+            precomps.append(insert_precomp(
+                comp, tool, frame_start, frame_end, output_dir
+            ))
+        except RuntimeError as exc:
+            print(exc)
+            continue
+        print(
+            f"Inserted precomp of {tool.Name}, it renders again with the "
+            "enabled Savers"
+        )
+    return precomps
+
+
+def _get_render_range(comp):
+    attrs = comp.GetAttrs()
+    return int(attrs["COMPN_RenderStart"]), int(attrs["COMPN_RenderEnd"])
@@ -0,0 +1,221 @@
+"""Trace the timeline of a Fusion launch.
+
+Tracing is enabled by setting `AYON_FUSION_TRACE=1` in the environment (e.g.
+through the Fusion application environment settings). The pre-launch hooks
+then record a span for each hook and for expensive phases like subprocesses
+and file copies. The trace id is passed on to the Fusion process using the
+`AYON_FUSION_TRACE_ID` environment variable so the AYON menu startup and its
+imports are recorded into the same timeline.
+
+Each launch is written as a Chrome trace JSON file into
+`AYON_FUSION_TRACE_DIR` (defaults to `{tempdir}/ayon_fusion_traces`) named
+`{trace_id}.json`, which can be opened in `chrome://tracing` or Perfetto.
+
+This module only uses the Python standard library so that it can be loaded
+in the Fusion process before any heavy imports happen.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import tempfile
+import threading
+import functools
+import contextlib
+
+TRACE_ENABLED_ENV = "AYON_FUSION_TRACE"
+TRACE_ID_ENV = "AYON_FUSION_TRACE_ID"
+TRACE_DIR_ENV = "AYON_FUSION_TRACE_DIR"
+
+
+def _is_truthy(value):
+    return str(value).lower() in {"1", "true", "yes", "on"}
+
+
+class NullLaunchTracer:
+    """Tracer that records nothing, used when tracing is disabled."""
+    trace_id = None
+
+    @contextlib.contextmanager
+    def span(self, name, category="launch", **args):
+        yield
+
+    def instant(self, name, category="launch", **args):
+        pass
+
+    def flush(self):
+        pass
+
+
+class LaunchTracer:
+    """Record timeline events of a single launch.
+
+    Events of all processes participating in the launch are appended to a
+    shared `{trace_id}.jsonl` file. On `flush` they are combined into the
+    Chrome trace `{trace_id}.json`.
+
+    Args:
+        trace_id (str): Identifier of the launch.
+        trace_dir (str): Directory to write the trace files to.
+        process_name (str): Label of the current process in the timeline.
+
+    """
+
+    def __init__(self, trace_id, trace_dir, process_name):
+        self.trace_id = trace_id
+        self.trace_dir = trace_dir
+        self.process_name = process_name
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._process_registered = False
+
+    @property
+    def events_path(self):
+        return os.path.join(self.trace_dir, f"{self.trace_id}.jsonl")
+
+    @property
+    def trace_path(self):
+        return os.path.join(self.trace_dir, f"{self.trace_id}.json")
+
+    @contextlib.contextmanager
+    def span(self, name, category="launch", **args):
+        """Record the duration of the context as a complete event."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            end = time.time()
+            self._add_event({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": int(start * 1e6),
+                "dur": int((end - start) * 1e6),
+                "args": args,
+            })
+
+    def instant(self, name, category="launch", **args):
+        """Record a single point in time."""
+        self._add_event({
+            "name": name,
+            "cat": category,
+            "ph": "i",
+            "s": "p",
+            "ts": int(time.time() * 1e6),
+            "args": args,
+        })
+
+    def flush(self):
+        """Write the Chrome trace JSON of all events recorded so far."""
+        with self._lock:
+            try:
+                with open(self.events_path, "r") as stream:
+                    lines = stream.readlines()
+            except OSError:
+                return
+
+            events = []
+            for line in lines:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    # Skip partially written line of another process
+                    continue
+            events.sort(key=lambda event: event.get("ts", 0))
+
+            data = {
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+                "otherData": {"trace_id": self.trace_id},
+            }
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=f".{self.trace_id}.", suffix=".tmp",
+                    dir=self.trace_dir
+                )
+                with os.fdopen(fd, "w") as stream:
+                    json.dump(data, stream)
+                os.replace(tmp_path, self.trace_path)
+            except OSError:
+                pass
+
+    def _add_event(self, event):
+        event["pid"] = self._pid
+        event["tid"] = threading.get_ident()
+        with self._lock:
+            try:
+                os.makedirs(self.trace_dir, exist_ok=True)
+                with open(self.events_path, "a") as stream:
+                    if not self._process_registered:
+                        stream.write(json.dumps({
+                            "name": "process_name",
+                            "ph": "M",
+                            "pid": self._pid,
+                            "args": {"name": self.process_name},
+                        }) + "\n")
+                        self._process_registered = True
+                    stream.write(json.dumps(event) + "\n")
+            except OSError:
+                pass
+
+
+_tracers = {}
+
+
+def get_launch_tracer(env=None, process_name=None):
+    """Return tracer for the launch described by `env`.
+
+    When tracing is enabled but no trace id is set yet in `env` a new one is
+    generated and stored in `env`, so that it propagates to the launched
+    Fusion process when `env` is the launch environment.
+
+    Args:
+        env (Optional[dict]): Environment, defaults to `os.environ`.
+        process_name (Optional[str]): Label of the process in the timeline.
+
+    Returns:
+        Union[LaunchTracer, NullLaunchTracer]: The tracer.
+
+    """
+    if env is None:
+        env = os.environ
+
+    enabled = env.get(TRACE_ENABLED_ENV) or os.environ.get(TRACE_ENABLED_ENV)
+    if not _is_truthy(enabled):
+        return NullLaunchTracer()
+
+    trace_id = env.get(TRACE_ID_ENV)
+    if not trace_id:
+        trace_id = "{}_{}".format(
+            time.strftime("%Y%m%d_%H%M%S"), uuid.uuid4().hex[:8]
+        )
+        env[TRACE_ID_ENV] = trace_id
+
+    tracer = _tracers.get(trace_id)
+    if tracer is None:
+        trace_dir = (
+            env.get(TRACE_DIR_ENV)
+            or os.environ.get(TRACE_DIR_ENV)
+            or os.path.join(tempfile.gettempdir(), "ayon_fusion_traces")
+        )
+        if process_name is None:
+            process_name = os.path.basename(sys.argv[0]) or "python"
+        tracer = LaunchTracer(trace_id, trace_dir, process_name)
+        _tracers[trace_id] = tracer
+    return tracer
+
+
+def traced_hook(func):
+    """Decorate `PreLaunchHook.execute` to record it as a span."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        tracer = get_launch_tracer(
+            self.launch_context.env, process_name="AYON launcher"
+        )
+        try:
+            with tracer.span(self.__class__.__name__, category="hook"):
+                return func(self, *args, **kwargs)
+        finally:
+            tracer.flush()
+    return wrapper
@@ -25,14 +25,23 @@ import os
 import sys
 import re
 import io
+import json
+import time
+import zlib
+import struct
 import shutil
+import hashlib
 import platform
 import argparse
 import logging
+import tempfile
 import collections
 import zipfile
 import subprocess
-from typing import Optional, Iterable, Pattern, Union, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Optional, Iterable, Pattern, Union, List, Tuple, Dict, Any
+)
 
 import package
 
@@ -49,6 +58,12 @@ DST_DIST_DIR: str = os.path.join("frontend", "dist")
 PRIVATE_ROOT: str = os.path.join(CURRENT_ROOT, "private")
 PUBLIC_ROOT: str = os.path.join(CURRENT_ROOT, "public")
 CLIENT_ROOT: str = os.path.join(CURRENT_ROOT, "client")
+BUILD_CACHE_ROOT: str = os.path.join(CURRENT_ROOT, ".build_cache")
+
+# Fixed zip entry metadata so archives are byte-reproducible
+ZIP_DATE_TIME: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE: int = 0o100644
+ZIP_COMPRESS_LEVEL: int = 6
 
 VERSION_PY_CONTENT = f'''# -*- coding: utf-8 -*-
 """Package declaring AYON addon '{ADDON_NAME}' version."""
@@ -137,6 +152,21 @@ def safe_copy_file(src_path: str, dst_path: str):
     shutil.copy2(src_path, dst_path)
 
 
+def _is_file_up_to_date(src_path: str, dst_path: str) -> bool:
+    """Destination has the same size and modification time as source.
+
+    Files copied with 'shutil.copy2' keep the source modification time.
+    """
+    if not os.path.exists(dst_path):
+        return False
+    src_stat = os.stat(src_path)
+    dst_stat = os.stat(dst_path)
+    return (
+        src_stat.st_size == dst_stat.st_size
+        and int(src_stat.st_mtime) == int(dst_stat.st_mtime)
+    )
+
+
 def _value_match_regexes(value: str, regexes: Iterable[Pattern]) -> bool:
     return any(
         regex.search(value)
@@ -257,15 +287,267 @@ def get_client_files_mapping() -> List[Tuple[str, str]]:
     ]
 
 
-def get_client_zip_content(log) -> io.BytesIO:
+def _hash_and_compress_file(src_path: str) -> Tuple[str, int, int, bytes]:
+    """Hash and raw-deflate file content.
+
+    Runs in a worker process of the build pool.
+
+    Returns:
+        tuple[str, int, int, bytes]: Sha256 of content, crc32, uncompressed
+            size and raw deflate compressed data.
+    """
+    with open(src_path, "rb") as stream:
+        data = stream.read()
+    compressor = zlib.compressobj(ZIP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return (
+        hashlib.sha256(data).hexdigest(),
+        zlib.crc32(data) & 0xFFFFFFFF,
+        len(data),
+        compressed,
+    )
+
+
+def _hash_file(src_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(src_path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_raw_zip_entries(
+    zip_path: str
+) -> Dict[str, Tuple[zipfile.ZipInfo, int]]:
+    """Map entry names of a zip file to their info and data offset."""
+    output: Dict[str, Tuple[zipfile.ZipInfo, int]] = {}
+    if not os.path.exists(zip_path):
+        return output
+
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zipf, \
+                open(zip_path, "rb") as stream:
+            for info in zipf.infolist():
+                if info.compress_type != zipfile.ZIP_DEFLATED:
+                    continue
+                stream.seek(info.header_offset)
+                header = stream.read(zipfile.sizeFileHeader)
+                # Filename and extra field lengths are the last two fields
+                *_, name_length, extra_length = struct.unpack(
+                    zipfile.structFileHeader, header
+                )
+                data_offset = (
+                    info.header_offset
+                    + zipfile.sizeFileHeader
+                    + name_length
+                    + extra_length
+                )
+                output[info.filename] = (info, data_offset)
+    except (OSError, zipfile.BadZipFile, struct.error):
+        return {}
+    return output
+
+
+class ReproducibleZipWriter:
+    """Write zip file entries from already deflated data.
+
+    All entries get the same timestamp and permissions so the same input
+    always produces the same archive bytes. Does not support zip64.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._central_dir: List[bytes] = []
+        date_time = ZIP_DATE_TIME
+        self._dos_time = (
+            date_time[3] << 11 | date_time[4] << 5 | date_time[5] // 2
+        )
+        self._dos_date = (
+            (date_time[0] - 1980) << 9 | date_time[1] << 5 | date_time[2]
+        )
+
+    def write_raw(
+        self,
+        arcname: str,
+        crc: int,
+        file_size: int,
+        compressed: bytes
+    ):
+        arcname = arcname.replace(os.path.sep, "/")
+        try:
+            filename = arcname.encode("ascii")
+            flag_bits = 0
+        except UnicodeEncodeError:
+            filename = arcname.encode("utf-8")
+            flag_bits = 0x800
+
+        offset = self._stream.tell()
+        if (
+            offset > zipfile.ZIP64_LIMIT
+            or file_size > zipfile.ZIP64_LIMIT
+            or len(compressed) > zipfile.ZIP64_LIMIT
+        ):
+            raise RuntimeError("Zip64 archives are not supported.")
+
+        header = struct.pack(
+            zipfile.structFileHeader,
+            zipfile.stringFileHeader,
+            20, 0,
+            flag_bits,
+            zipfile.ZIP_DEFLATED,
+            self._dos_time,
+            self._dos_date,
+            crc,
+            len(compressed),
+            file_size,
+            len(filename),
+            0
+        )
+        self._stream.write(header)
+        self._stream.write(filename)
+        self._stream.write(compressed)
+
+        central_dir = struct.pack(
+            zipfile.structCentralDir,
+            zipfile.stringCentralDir,
+            20, 3, 20, 0,
+            flag_bits,
+            zipfile.ZIP_DEFLATED,
+            self._dos_time,
+            self._dos_date,
+            crc,
+            len(compressed),
+            file_size,
+            len(filename),
+            0, 0, 0, 0,
+            ZIP_FILE_MODE << 16,
+            offset
+        )
+        self._central_dir.append(central_dir + filename)
+
+    def close(self):
+        start = self._stream.tell()
+        for record in self._central_dir:
+            self._stream.write(record)
+        size = self._stream.tell() - start
+        count = len(self._central_dir)
+        if count > 0xFFFF or start > zipfile.ZIP64_LIMIT:
+            raise RuntimeError("Zip64 archives are not supported.")
+        self._stream.write(struct.pack(
+            zipfile.structEndArchive,
+            zipfile.stringEndArchive,
+            0, 0,
+            count, count,
+            size, start,
+            0
+        ))
+
+
+def build_client_zip(log: logging.Logger) -> str:
+    """Build client code zip incrementally into the build cache.
+
+    Entries of files which content did not change since the previous build
+    are copied as already compressed data from the previous zip. Changed
+    files are compressed in a process pool. The zip is streamed to disk and
+    is byte-reproducible for the same client code.
+
+    Returns:
+        str: Path to the client zip.
+    """
+    start_time = time.perf_counter()
     log.info("Preparing client code zip")
-    files_mapping: List[Tuple[str, str]] = get_client_files_mapping()
-    stream = io.BytesIO()
-    with ZipFileLongPaths(stream, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for src_path, subpath in files_mapping:
-            zipf.write(src_path, subpath)
-    stream.seek(0)
-    return stream
+    os.makedirs(BUILD_CACHE_ROOT, exist_ok=True)
+    zip_path = os.path.join(BUILD_CACHE_ROOT, "client.zip")
+    manifest_path = zip_path + ".json"
+
+    files_mapping: List[Tuple[str, str]] = sorted(
+        get_client_files_mapping(),
+        key=lambda item: item[1].replace(os.path.sep, "/")
+    )
+
+    previous_manifest: Dict[str, Any] = {}
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r") as stream:
+                previous_manifest = json.load(stream)
+        except (OSError, ValueError):
+            previous_manifest = {}
+    if previous_manifest.get("compress_level") != ZIP_COMPRESS_LEVEL:
+        previous_manifest = {}
+    previous_hashes: Dict[str, str] = previous_manifest.get("files", {})
+    previous_entries = _read_raw_zip_entries(zip_path)
+
+    # Find which files can reuse the previous compressed entry
+    hashes: Dict[str, str] = {}
+    to_compress: List[Tuple[str, str]] = []
+    for src_path, subpath in files_mapping:
+        arcname = subpath.replace(os.path.sep, "/")
+        if arcname in previous_entries and arcname in previous_hashes:
+            file_hash = _hash_file(src_path)
+            if file_hash == previous_hashes[arcname]:
+                hashes[arcname] = file_hash
+                continue
+        to_compress.append((src_path, arcname))
+
+    compressed_by_arcname: Dict[str, Tuple[str, int, int, bytes]] = {}
+    if to_compress:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _hash_and_compress_file,
+                [src_path for src_path, _ in to_compress],
+                chunksize=8
+            )
+            for (_, arcname), result in zip(to_compress, results):
+                compressed_by_arcname[arcname] = result
+                hashes[arcname] = result[0]
+
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".client.", suffix=".zip", dir=BUILD_CACHE_ROOT
+    )
+    previous_stream = None
+    try:
+        if previous_entries:
+            previous_stream = open(zip_path, "rb")
+        with os.fdopen(fd, "wb") as stream:
+            writer = ReproducibleZipWriter(stream)
+            for _, subpath in files_mapping:
+                arcname = subpath.replace(os.path.sep, "/")
+                result = compressed_by_arcname.get(arcname)
+                if result is not None:
+                    _, crc, file_size, compressed = result
+                else:
+                    info, data_offset = previous_entries[arcname]
+                    previous_stream.seek(data_offset)
+                    compressed = previous_stream.read(info.compress_size)
+                    crc = info.CRC
+                    file_size = info.file_size
+                writer.write_raw(arcname, crc, file_size, compressed)
+            writer.close()
+        if previous_stream is not None:
+            previous_stream.close()
+            previous_stream = None
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        if previous_stream is not None:
+            previous_stream.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    with open(manifest_path, "w") as stream:
+        json.dump(
+            {"compress_level": ZIP_COMPRESS_LEVEL, "files": hashes},
+            stream,
+            indent=4,
+            sort_keys=True
+        )
+
+    duration = time.perf_counter() - start_time
+    log.info(
+        f"Client zip ready in {duration:.2f}s: {len(to_compress)} compressed,"
+        f" {len(files_mapping) - len(to_compress)} reused"
+    )
+    return zip_path
 
 
 def get_base_files_mapping() -> List[FileMapping]:
@@ -302,6 +584,9 @@ def get_base_files_mapping() -> List[FileMapping]:
 def copy_client_code(output_dir: str, log: logging.Logger):
     """Copies server side folders to 'addon_package_dir'
 
+    Only files that changed since last copy are copied and files which are
+    not part of the client code anymore are removed.
+
     Args:
         output_dir (str): Output directory path.
         log (logging.Logger)
@@ -312,15 +597,26 @@ def copy_client_code(output_dir: str, log: logging.Logger):
     full_output_path = os.path.join(
         output_dir, f"{ADDON_NAME}_{ADDON_VERSION}"
     )
-    if os.path.exists(full_output_path):
-        shutil.rmtree(full_output_path)
     os.makedirs(full_output_path, exist_ok=True)
 
+    expected_paths = set()
+    copied = 0
     for src_path, dst_subpath in get_client_files_mapping():
         dst_path = os.path.join(full_output_path, dst_subpath)
+        expected_paths.add(os.path.normpath(dst_path))
+        if _is_file_up_to_date(src_path, dst_path):
+            continue
         safe_copy_file(src_path, dst_path)
+        copied += 1
 
-    log.info("Client copy finished")
+    # Remove files that are not part of client code anymore
+    for root, _, filenames in os.walk(full_output_path):
+        for filename in filenames:
+            path = os.path.normpath(os.path.join(root, filename))
+            if path not in expected_paths:
+                os.remove(path)
+
+    log.info(f"Client copy finished ({copied} files copied)")
 
 
 def copy_addon_package(
@@ -375,13 +671,26 @@ def create_addon_package(
         output_dir, f"{ADDON_NAME}-{ADDON_VERSION}.zip"
     )
 
+    # Sort entries and use fixed metadata so the package is reproducible
+    files_mapping = sorted(
+        files_mapping, key=lambda item: item[1].replace(os.path.sep, "/")
+    )
     with ZipFileLongPaths(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
         # Copy server content
         for src_file, dst_subpath in files_mapping:
+            zip_info = zipfile.ZipInfo(
+                dst_subpath.replace(os.path.sep, "/"), ZIP_DATE_TIME
+            )
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            zip_info.external_attr = ZIP_FILE_MODE << 16
             if isinstance(src_file, io.BytesIO):
-                zipf.writestr(dst_subpath, src_file.getvalue())
-            else:
-                zipf.write(src_file, dst_subpath)
+                zipf.writestr(zip_info, src_file.getvalue())
+                continue
+
+            # Stream file content instead of reading it to memory
+            with open(src_file, "rb") as src_stream, \
+                    zipf.open(zip_info, "w") as dst_stream:
+                shutil.copyfileobj(src_stream, dst_stream, 1024 * 1024)
 
     log.info("Package created")
 
@@ -424,7 +733,7 @@ def main(
 
     if has_client_code:
         files_mapping.append(
-            (get_client_zip_content(log), "private/client.zip")
+            (build_client_zip(log), "private/client.zip")
         )
 
     # Skip server zipping
@@ -8,8 +8,23 @@ from .imageio import FusionImageIOModel
 
 class CopyFusionSettingsModel(BaseSettingsModel):
     copy_path: str = SettingsField("", title="Local Fusion profile directory")
-    copy_status: bool = SettingsField(title="Copy profile on first launch")
-    force_sync: bool = SettingsField(title="Resync profile on each launch")
+    copy_status: bool = SettingsField(
+        title="Copy profile on first launch",
+        description=(
+            "Copy the Fusion profile to the local Fusion profile directory. "
+            "On later launches only source files that changed since the "
+            "last sync are copied, files changed in the local profile "
+            "are kept."
+        )
+    )
+    force_sync: bool = SettingsField(
+        title="Resync profile on each launch",
+        description=(
+            "Overwrite any changes in the local Fusion profile with the "
+            "source profile on each launch. Only files that differ are "
+            "copied."
+        )
+    )
 
 
 def _create_saver_instance_attributes_enum():
@@ -36,6 +51,39 @@ def _image_format_enum():
     ]
 
 
+def _review_saver_format_enum():
+    return [
+        {"value": "none", "label": "None"},
+        {"value": "jpg", "label": "jpg"},
+        {"value": "png", "label": "png"},
+        {"value": "mov", "label": "mov"},
+    ]
+
+
+def _exr_compression_enum():
+    return [
+        {"value": "default", "label": "Saver default"},
+        {"value": "none", "label": "None"},
+        {"value": "rle", "label": "RLE"},
+        {"value": "zip1", "label": "ZIP (1 line)"},
+        {"value": "zip16", "label": "ZIP (16 lines)"},
+        {"value": "piz", "label": "PIZ"},
+        {"value": "pxr24", "label": "PXR24"},
+        {"value": "b44", "label": "B44"},
+        {"value": "b44a", "label": "B44A"},
+        {"value": "dwaa", "label": "DWAA"},
+        {"value": "dwab", "label": "DWAB"},
+    ]
+
+
+def _exr_depth_enum():
+    return [
+        {"value": "default", "label": "Saver default"},
+        {"value": "half", "label": "Half float (16 bit)"},
+        {"value": "float", "label": "Float (32 bit)"},
+    ]
+
+
 def _frame_range_options_enum():
     return [
         {"value": "current_context", "label": "Current context"},
@@ -96,6 +144,21 @@ class CreateSaverPluginModel(BaseSettingsModel):
         enum_resolver=_image_format_enum,
         title="Output Image Format"
     )
+    exr_compression: str = SettingsField(
+        "default",
+        enum_resolver=_exr_compression_enum,
+        title="EXR Compression",
+        description=(
+            "Default compression of exr output. Use the benchmark in "
+            "'ayon_fusion.scripts.benchmark_saver_options' to compare the "
+            "write time and size per frame of the options."
+        )
+    )
+    exr_depth: str = SettingsField(
+        "default",
+        enum_resolver=_exr_depth_enum,
+        title="EXR Depth"
+    )
 
 
 class HookOptionalModel(BaseSettingsModel):
@@ -105,6 +168,17 @@ class HookOptionalModel(BaseSettingsModel):
     )
 
 
+class InstallPySideHookModel(HookOptionalModel):
+    force_recheck: bool = SettingsField(
+        False,
+        title="Force re-check",
+        description=(
+            "Always probe Fusion's python for the Qt binding on launch "
+            "instead of using the cached result of an earlier probe."
+        )
+    )
+
+
 class HooksModel(BaseSettingsModel):
     set_fusion_master_prefs: str = SettingsField(
         "set",
@@ -123,8 +197,8 @@ class HooksModel(BaseSettingsModel):
         ),
         enum_resolver=_set_masterprefs_mode_enum
     )
-    InstallPySideToFusion: HookOptionalModel = SettingsField(
-        default_factory=HookOptionalModel,
+    InstallPySideToFusion: InstallPySideHookModel = SettingsField(
+        default_factory=InstallPySideHookModel,
         title="Install PySide2"
     )
     FusionLaunchMenuHook: HookOptionalModel = SettingsField(
@@ -141,6 +215,22 @@ class CreateSaverModel(CreateSaverPluginModel):
         enum_resolver=_frame_range_options_enum,
         title="Default frame range source"
     )
+    review_saver_format: str = SettingsField(
+        default="none",
+        enum_resolver=_review_saver_format_enum,
+        title="Default review Saver format",
+        description=(
+            "Create a linked low resolution review Saver that renders in "
+            "the same render as the Saver. Its output is used for review "
+            "instead of transcoding the full resolution frames."
+        )
+    )
+    review_saver_scale: float = SettingsField(
+        default=0.5,
+        ge=0.1,
+        le=1.0,
+        title="Default review Saver scale"
+    )
     product_type_items: list[ProductTypeItemModel] = SettingsField(
         default_factory=list,
         title="Product type items",
@@ -185,6 +275,95 @@ class FusionRenderLocalModel(BaseSettingsModel):
             "Suppress the Fusion 'Render Completed' and 'Render Failed'"
             " dialogs.")
     )
+    render_timeout: int = SettingsField(
+        0,
+        ge=0,
+        title="Render timeout",
+        description=(
+            "Seconds after which a local render is aborted and the publish "
+            "fails. Zero for no timeout."
+        )
+    )
+    render_to_scratch: bool = SettingsField(
+        False,
+        title="Render to local scratch",
+        description=(
+            "Render the Savers into a local scratch folder and copy the "
+            "frames to their output path in the background while the "
+            "render continues."
+        )
+    )
+    scratch_dir: str = SettingsField(
+        "",
+        title="Local scratch folder",
+        description=(
+            "Local folder to render to, e.g. on a local NVMe drive. "
+            "Defaults to the temp folder when empty."
+        )
+    )
+    copy_workers: int = SettingsField(
+        4,
+        ge=1,
+        title="Copy threads",
+        description="Amount of threads copying frames from scratch."
+    )
+    resume_renders: bool = SettingsField(
+        False,
+        title="Resume interrupted renders",
+        description=(
+            "Keep a journal of the rendered frames next to the output of "
+            "each Saver, so a render interrupted by e.g. a crash only "
+            "renders the missing frames on the next publish. Frames are "
+            "rendered again when their upstream tools, animation or input "
+            "media changed. A finished render is rendered again in full."
+        )
+    )
+    skip_unchanged_frames: bool = SettingsField(
+        False,
+        title="Skip unchanged frames",
+        description=(
+            "Keep a journal of the rendered frames and a hash of their "
+            "upstream graph next to the output of each Saver, and only "
+            "render frames of which the upstream tools, animation or input "
+            "media changed since they were rendered, also after a finished "
+            "render. Includes resuming interrupted renders."
+        )
+    )
+    render_held_frames_once: bool = SettingsField(
+        False,
+        title="Render held frames once",
+        description=(
+            "Detect spans of identical frames, e.g. slates or holds without "
+            "animation or changing input media, render only the first "
+            "frame of each span and hardlink or copy it to the other "
+            "frames. Only graphs of tools known to not change over time "
+            "by themselves are detected."
+        )
+    )
+    render_precomps_first: bool = SettingsField(
+        False,
+        title="Render precomps first",
+        description=(
+            "Render Savers of which the output is read by Loaders upstream "
+            "of the rendered Savers first, in dependency order. Precomps "
+            "that don't depend on each other render together."
+        )
+    )
+    slow_frame_threshold: float = SettingsField(
+        3.5,
+        gt=0.0,
+        title="Slow frame threshold",
+        description=(
+            "Frames of which the render time deviates more than this "
+            "modified z-score from the median frame are reported as slow."
+        )
+    )
+
+
+class OptionalPluginModel(BaseSettingsModel):
+    enabled: bool = SettingsField(True, title="Enabled")
+    optional: bool = SettingsField(True, title="Optional")
+    active: bool = SettingsField(True, title="Active")
 
 
 class PublishPluginsModel(BaseSettingsModel):
@@ -193,6 +372,19 @@ class PublishPluginsModel(BaseSettingsModel):
         title="Render Local",
         description="Plug-in to render in current Fusion session."
     )
+    PrepareFramesHardlinks: OptionalPluginModel = SettingsField(
+        default_factory=OptionalPluginModel,
+        title="Publish Existing Frames As Hardlinks",
+        description=(
+            "Publish 'Use existing frames' renders as hardlinks instead of "
+            "copies when the render and publish folders are on the same "
+            "filesystem. Local renders from the publisher remove linked "
+            "frames before rendering them again, but renders started "
+            "in Fusion or on the farm write into the existing frames and "
+            "would change the published frames too, so it is off by "
+            "default."
+        )
+    )
 
 
 class FusionSettings(BaseSettingsModel):
@@ -233,7 +425,8 @@ DEFAULT_VALUES = {
     "hooks": {
         "set_fusion_master_prefs": "set",
         "InstallPySideToFusion": {
-            "enabled": True
+            "enabled": True,
+            "force_recheck": False
         },
         "FusionLaunchMenuHook": {
             "enabled": False
@@ -251,7 +444,11 @@ DEFAULT_VALUES = {
                 "farm_rendering"
             ],
             "image_format": "exr",
-            "default_frame_range_option": "current_context"
+            "exr_compression": "default",
+            "exr_depth": "default",
+            "default_frame_range_option": "current_context",
+            "review_saver_format": "none",
+            "review_saver_scale": 0.5
         },
         "CreateImageSaver": {
             "temp_rendering_path_template": "{workdir}/renders/fusion/{product[name]}/{product[name]}.{ext}",
@@ -264,12 +461,28 @@ DEFAULT_VALUES = {
                 "farm_rendering"
             ],
             "image_format": "exr",
+            "exr_compression": "default",
+            "exr_depth": "default",
             "default_frame": 0
         }
     },
     "publish": {
         "FusionRenderLocal": {
-            "suppress_dialogs": True
+            "suppress_dialogs": True,
+            "render_timeout": 0,
+            "render_to_scratch": False,
+            "scratch_dir": "",
+            "copy_workers": 4,
+            "resume_renders": False,
+            "skip_unchanged_frames": False,
+            "render_held_frames_once": False,
+            "render_precomps_first": False,
+            "slow_frame_threshold": 3.5
+        },
+        "PrepareFramesHardlinks": {
+            "enabled": True,
+            "optional": True,
+            "active": False
         }
     }
 }
@@ -0,0 +1,17 @@
+import pytest
+
+from ayon_fusion.api.graph_hash import get_held_frame_spans
+
+
+@pytest.mark.parametrize("frame_hashes, spans", [
+    ({}, []),
+    ({1: "a"}, []),
+    ({1: "a", 2: "a", 3: "a"}, [(1, 3)]),
+    ({1: "a", 2: "b", 3: "c"}, []),
+    ({1: "a", 2: "a", 3: "b", 4: "a", 5: "a"}, [(1, 2), (4, 5)]),
+    # Frames with a gap between them are separate spans
+    ({1: "a", 2: "a", 4: "a", 5: "a", 7: "a"}, [(1, 2), (4, 5)]),
+    ({3: "a", 1: "a", 2: "a"}, [(1, 3)]),
+])
+def test_held_frame_spans(frame_hashes, spans):
+    assert get_held_frame_spans(frame_hashes) == spans
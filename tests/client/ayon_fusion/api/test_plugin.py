@@ -0,0 +1,91 @@
+import logging
+
+import pytest
+
+from ayon_fusion.api import plugin
+
+CACHE_KEY = plugin.FusionColormanagedPluginMixin.colorspace_cache_key
+
+
+class ColorspacePlugin(plugin.FusionColormanagedPluginMixin):
+    log = logging.getLogger("test")
+
+    def __init__(self):
+        self.resolved = []
+
+    def set_representation_colorspace(self, representation, context):
+        self.resolved.append(representation["stagingDir"])
+        representation["colorspaceData"] = {"colorspace": "ACEScg"}
+
+
+class Context:
+    def __init__(self):
+        self.data = {"projectName": "Project", "project_settings": {}}
+
+
+class Instance:
+    def __init__(self, context, product_name):
+        self.context = context
+        self.data = {"productName": product_name}
+
+
+def _get_representation(product_name, root="/proj/sh010/renders/fusion"):
+    return {
+        "ext": "exr",
+        "files": [f"{product_name}.{frame}.exr" for frame in (1001, 1002)],
+        "stagingDir": f"{root}/{product_name}",
+    }
+
+
+def _resolve(colorspace_plugin, context, product_name, **kwargs):
+    representation = _get_representation(product_name, **kwargs)
+    colorspace_plugin.set_representation_colorspace_cached(
+        representation, Instance(context, product_name)
+    )
+    return representation
+
+
+@pytest.fixture
+def file_rules(monkeypatch):
+    rules = []
+    monkeypatch.setattr(
+        plugin, "get_imageio_file_rules", lambda *args, **kwargs: rules
+    )
+    return rules
+
+
+def test_second_product_with_same_layout_is_cached(file_rules):
+    file_rules.append({"pattern": r"renders", "ext": "exr"})
+    colorspace_plugin = ColorspacePlugin()
+    context = Context()
+
+    main = _resolve(colorspace_plugin, context, "renderMain")
+    background = _resolve(colorspace_plugin, context, "renderBackground")
+
+    assert colorspace_plugin.resolved == [main["stagingDir"]]
+    assert background["colorspaceData"] == main["colorspaceData"]
+    assert background["colorspaceData"] is not main["colorspaceData"]
+    cache = context.data[CACHE_KEY]
+    assert (cache["hits"], cache["misses"]) == (1, 1)
+
+
+def test_file_rule_matching_product_name_is_not_shared(file_rules):
+    file_rules.append({"pattern": r"Background", "ext": "exr"})
+    colorspace_plugin = ColorspacePlugin()
+    context = Context()
+
+    _resolve(colorspace_plugin, context, "renderMain")
+    _resolve(colorspace_plugin, context, "renderBackground")
+    _resolve(colorspace_plugin, context, "renderBackground")
+
+    assert len(colorspace_plugin.resolved) == 2
+
+
+def test_different_layout_is_not_shared(file_rules):
+    colorspace_plugin = ColorspacePlugin()
+    context = Context()
+
+    _resolve(colorspace_plugin, context, "renderMain")
+    _resolve(colorspace_plugin, context, "renderMain", root="/proj/other")
+
+    assert len(colorspace_plugin.resolved) == 2
@@ -0,0 +1,196 @@
+import os
+import json
+
+import pytest
+
+from ayon_fusion.api import render
+
+FRAMES = (1001, 1002, 1003)
+
+
+def _write_frame(path, content, mtime):
+    with open(path, "w") as stream:
+        stream.write(content)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def frame_paths(tmp_path):
+    return {
+        frame: str(tmp_path / f"render.{frame}.exr") for frame in FRAMES
+    }
+
+
+def _get_journal(frame_paths, frame_hashes=None, reuse_finished=True):
+    if frame_hashes is None:
+        frame_hashes = {frame: "hash" for frame in frame_paths}
+    path = os.path.join(
+        os.path.dirname(frame_paths[FRAMES[0]]), ".render.journal.json"
+    )
+    journal = render.RenderJournal(path, frame_paths, frame_hashes)
+    return journal, journal.load(reuse_finished=reuse_finished)
+
+
+def _render_frames(journal, frame_paths, frames, frame_end=None):
+    for frame in frames:
+        _write_frame(frame_paths[frame], f"frame {frame}", 1000 + frame)
+    recorded = journal.record_frames(frame_end=frame_end)
+    journal.save()
+    return recorded
+
+
+def test_journal_resumes_rendered_frames(frame_paths):
+    journal, invalidated = _get_journal(frame_paths)
+    assert invalidated == 0
+    assert journal.get_missing_frames() == list(FRAMES)
+
+    assert _render_frames(journal, frame_paths, FRAMES[:2]) == 2
+
+    journal, invalidated = _get_journal(frame_paths)
+    assert invalidated == 0
+    assert journal.get_missing_frames() == [1003]
+
+
+@pytest.mark.parametrize("reuse_finished", [True, False])
+def test_journal_resumes_interrupted_render(frame_paths, reuse_finished):
+    journal, _ = _get_journal(frame_paths)
+    _render_frames(journal, frame_paths, FRAMES[:1])
+
+    journal, _ = _get_journal(frame_paths, reuse_finished=reuse_finished)
+    assert journal.get_missing_frames() == [1002, 1003]
+
+
+def test_journal_of_finished_render(frame_paths):
+    journal, _ = _get_journal(frame_paths)
+    _render_frames(journal, frame_paths, FRAMES)
+
+    journal, _ = _get_journal(frame_paths)
+    assert journal.get_missing_frames() == []
+
+    journal, invalidated = _get_journal(frame_paths, reuse_finished=False)
+    assert invalidated == 0
+    assert journal.get_missing_frames() == list(FRAMES)
+    # The existing frames are only recorded once rendered again
+    assert journal.record_frames() == 0
+
+
+def test_journal_records_up_to_frame_end(frame_paths):
+    journal, _ = _get_journal(frame_paths)
+    # Frame 1002 may be partially written while Fusion finished 1001
+    assert _render_frames(journal, frame_paths, FRAMES, frame_end=1001) == 1
+
+    journal, _ = _get_journal(frame_paths)
+    assert journal.get_missing_frames() == [1002, 1003]
+
+
+def test_journal_invalidates_changed_graph_hash(frame_paths):
+    journal, _ = _get_journal(frame_paths)
+    _render_frames(journal, frame_paths, FRAMES)
+
+    frame_hashes = {frame: "hash" for frame in FRAMES}
+    frame_hashes[1002] = "changed"
+    journal, invalidated = _get_journal(frame_paths, frame_hashes)
+    assert invalidated == 1
+    assert journal.get_missing_frames() == [1002]
+
+
+@pytest.mark.parametrize("content, mtime", [
+    ("frame 1002 changed", 2002),
+    ("frame 1002", 3000),
+])
+def test_journal_invalidates_changed_files(frame_paths, content, mtime):
+    journal, _ = _get_journal(frame_paths)
+    _render_frames(journal, frame_paths, FRAMES)
+
+    _write_frame(frame_paths[1002], content, mtime)
+    journal, invalidated = _get_journal(frame_paths)
+    assert invalidated == 1
+    assert journal.get_missing_frames() == [1002]
+
+
+def test_journal_invalidates_other_version(frame_paths):
+    journal, _ = _get_journal(frame_paths)
+    _render_frames(journal, frame_paths, FRAMES)
+    with open(journal.path, "r") as stream:
+        data = json.load(stream)
+    data["version"] = journal.version - 1
+    with open(journal.path, "w") as stream:
+        json.dump(data, stream)
+
+    journal, invalidated = _get_journal(frame_paths)
+    assert invalidated == len(FRAMES)
+    assert journal.get_missing_frames() == list(FRAMES)
+
+
+def test_journal_ignores_files_existing_before_render(frame_paths):
+    # A frame of an earlier render without journal is not verified
+    _write_frame(frame_paths[1001], "old frame", 500)
+    journal, _ = _get_journal(frame_paths)
+    assert journal.record_frames() == 0
+    assert journal.get_missing_frames() == list(FRAMES)
+
+    assert _render_frames(journal, frame_paths, [1001]) == 1
+    assert journal.get_missing_frames() == [1002, 1003]
+
+
+def test_journal_ignores_unreadable_file(frame_paths):
+    journal, _ = _get_journal(frame_paths)
+    with open(journal.path, "w") as stream:
+        stream.write("{")
+    journal, invalidated = _get_journal(frame_paths)
+    assert invalidated == 0
+    assert journal.get_missing_frames() == list(FRAMES)
+
+
+def test_render_levels():
+    levels = render.get_render_levels({
+        "comp": {"pre", "bg"},
+        "pre": {"plate"},
+        "plate": set(),
+        "bg": {"outside"},
+    })
+    assert levels == [["bg", "plate"], ["pre"], ["comp"]]
+
+
+def test_render_levels_cycle():
+    levels = render.get_render_levels({
+        "a": {"b"},
+        "b": {"a"},
+        "c": set(),
+        "comp": {"a"},
+    })
+    assert levels == [["c"], ["a", "b", "comp"]]
+
+
+def test_render_levels_empty():
+    assert render.get_render_levels({}) == []
+
+
+def test_frame_times_summary():
+    summary = render.get_frame_times_summary(
+        {1: 1.0, 2: 1.2, 3: 0.9, 4: 1.1, 5: 9.0}
+    )
+    assert summary["frames"] == 5
+    assert summary["median"] == 1.1
+    assert summary["max_frame"] == 5
+    assert summary["slow_frames"] == [5]
+
+
+@pytest.mark.parametrize("frame_times, slow_frames", [
+    ({1: 2.0}, []),
+    ({1: 2.0, 2: 2.0, 3: 2.0}, []),
+    ({1: 1.0, 2: 1.0, 3: 1.0, 4: 10.0}, [4]),
+    ({1: 0.0, 2: 0.0, 3: 0.0}, []),
+    ({1: 0.0, 2: 0.0, 3: 5.0}, []),
+])
+def test_frame_times_summary_degenerate(frame_times, slow_frames):
+    summary = render.get_frame_times_summary(frame_times)
+    assert summary["frames"] == len(frame_times)
+    assert summary["slow_frames"] == slow_frames
+
+
+def test_frame_times_summary_empty():
+    summary = render.get_frame_times_summary({})
+    assert summary["frames"] == 0
+    assert summary["max_frame"] is None
+    assert summary["slow_frames"] == []
@@ -0,0 +1,172 @@
+import pytest
+
+from ayon_fusion import comp_file
+
+COMP_TEXT = r'''Composition {
+	CurrentTime = 1001,
+	-- A comment with a brace } and a "quote
+	--[[ A block comment
+	with } braces { and ]] --
+	Tools = ordered() {
+		Loader1 = Loader {
+			Clips = {
+				Clip {
+					ID = "Clip1",
+					Filename = "C:\\renders\\plate.1001.exr",
+					FormatID = "OpenEXRFormat",
+				}
+			},
+			CustomData = {
+				avalon = {
+					representation = "repre-1",
+					loader = "FusionLoadSequence",
+					project_name = "Project",
+				},
+			},
+			Inputs = {
+				Comments = Input { Value = "a } { \" b", },
+				Notes = Input { Value = [==[long ]] } string]==], },
+			},
+			ViewInfo = OperatorInfo { Pos = { 0, 0 } },
+		},
+		Group1 = GroupOperator {
+			Tools = ordered() {
+				Loader2 = Loader {
+					Clips = {
+						Clip { Filename = 'D:\\plate\'s.1001.exr', },
+					},
+					CustomData = {
+						avalon = { representation = "repre-2", },
+					},
+				},
+				Macro1 = MacroOperator {
+					Tools = ordered() {
+						Blur1 = Blur { Inputs = { ["XBlurSize"] = 2, } },
+					},
+				},
+			},
+		},
+	},
+	Prefs = {
+		Comp = {
+			Paths = {
+				Map = {
+					["Shots:"] = "S:\\shots\\",
+				},
+			},
+		},
+	},
+}
+'''
+
+
+def _get_tools(text):
+    return {tool.key: tool for tool in comp_file.iter_tools(text)}
+
+
+def _get_clip_filename(tool):
+    clip = tool.get_table("Clips").get_tables("Clip")[0]
+    return clip.get_string("Filename")
+
+
+def test_iter_tools_includes_groups_and_macros():
+    tools = _get_tools(COMP_TEXT)
+    assert list(tools) == ["Loader1", "Group1", "Loader2", "Macro1", "Blur1"]
+    assert tools["Group1"].type_name == "GroupOperator"
+    assert tools["Macro1"].type_name == "MacroOperator"
+    assert tools["Blur1"].type_name == "Blur"
+
+
+def test_strings_comments_and_long_brackets():
+    tools = _get_tools(COMP_TEXT)
+    inputs = tools["Loader1"].get_table("Inputs")
+    comments = inputs.get_table("Comments").get_string("Value")
+    assert comments.value == 'a } { " b'
+    notes = inputs.get_table("Notes").get_string("Value")
+    assert notes.value == "long ]] } string"
+
+    filename = _get_clip_filename(tools["Loader2"])
+    assert filename.value == "D:\\plate's.1001.exr"
+
+
+def test_get_tool_data():
+    tools = _get_tools(COMP_TEXT)
+    data = comp_file.get_tool_data(tools["Loader1"], "avalon")
+    assert {key: value.value for key, value in data.items()} == {
+        "representation": "repre-1",
+        "loader": "FusionLoadSequence",
+        "project_name": "Project",
+    }
+    assert comp_file.get_tool_data(tools["Blur1"], "avalon") == {}
+
+
+def test_bracketed_keys():
+    root = comp_file.get_root_table(COMP_TEXT)
+    path_map = root.get_path("Prefs", "Comp", "Paths", "Map")
+    assert path_map.get_string("Shots:").value == "S:\\shots\\"
+
+
+@pytest.mark.parametrize("value", [
+    "C:\\renders\\plate.1001.exr",
+    'quote " and } brace',
+    "new\nline",
+    "",
+])
+def test_encode_decode_round_trip(value):
+    literal = comp_file.encode_lua_string(value)
+    assert comp_file.decode_lua_string(literal) == value
+
+
+def test_decode_escapes():
+    assert comp_file.decode_lua_string(r'"\65\t\\"') == "A\t\\"
+    assert comp_file.decode_lua_string("[[raw \\n]]") == "raw \\n"
+
+
+def test_replace_keeps_rest_of_file():
+    tools = _get_tools(COMP_TEXT)
+    filename = _get_clip_filename(tools["Loader1"])
+    representation = comp_file.get_tool_data(
+        tools["Loader2"], "avalon")["representation"]
+    new_path = 'C:\\renders\\v002 "final"\\plate.1001.exr'
+    new_text = comp_file.apply_replacements(COMP_TEXT, [
+        (filename.start, filename.end,
+         comp_file.encode_lua_string(new_path)),
+        (representation.start, representation.end,
+         comp_file.encode_lua_string("repre-3")),
+    ])
+
+    new_tools = _get_tools(new_text)
+    assert _get_clip_filename(new_tools["Loader1"]).value == new_path
+    new_data = comp_file.get_tool_data(new_tools["Loader2"], "avalon")
+    assert new_data["representation"].value == "repre-3"
+    assert list(new_tools) == list(tools)
+
+    # Everything outside the replaced literals is unchanged
+    assert new_text[:filename.start] == COMP_TEXT[:filename.start]
+    assert (
+        new_text[new_data["representation"].end:]
+        == COMP_TEXT[representation.end:]
+    )
+
+
+def test_overlapping_replacements():
+    with pytest.raises(ValueError):
+        comp_file.apply_replacements("abcdef", [(0, 3, "x"), (2, 4, "y")])
+
+
+@pytest.mark.parametrize("text", [
+    'Composition { Tools = ordered() { Loader1 = Loader { ',
+    'Composition { Comments = "unterminated }',
+    'Composition { Comments = [[unterminated }',
+])
+def test_malformed_comp(text):
+    with pytest.raises(comp_file.CompFileError):
+        list(comp_file.iter_tools(text))
+
+
+def test_write_comp_file_round_trip(tmp_path):
+    path = str(tmp_path / "shot.comp")
+    text = COMP_TEXT.replace("\n", "\r\n")
+    comp_file.write_comp_file(path, text)
+    assert comp_file.read_comp_file(path) == text
+    assert [p.name for p in tmp_path.iterdir()] == ["shot.comp"]
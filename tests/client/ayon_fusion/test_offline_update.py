@@ -0,0 +1,124 @@
+import os
+
+from ayon_fusion import comp_file, offline_update
+from ayon_fusion.relink import reverse_map_path
+
+COMP_TEXT = '''Composition {
+	Tools = ordered() {
+		Loader1 = Loader {
+			Clips = {
+				Clip {
+					ID = "Clip1",
+					Filename = "Shots:sh010/plate_v001/plate.1001.exr",
+				}
+			},
+			CustomData = {
+				avalon = {
+					representation = "repre-1",
+					loader = "FusionLoadSequence",
+				},
+			},
+		},
+		Loader2 = Loader {
+			Clips = {
+				Clip { Filename = "/elsewhere/bg.1001.exr", },
+			},
+			CustomData = {
+				avalon = { representation = "repre-2", },
+			},
+		},
+	},
+	Prefs = {
+		Comp = {
+			Paths = {
+				Map = {
+					["Shots:"] = "/proj/shots/",
+					["Plates:"] = "Shots:sh010/",
+					["Search:"] = "/proj;/other",
+				},
+			},
+		},
+	},
+}
+'''
+
+
+def test_reverse_map_path_uses_longest_path_map():
+    path_maps = {
+        "Shots:": "/proj/shots/",
+        "Plates:": "Shots:sh010/",
+        "Search:": "/proj;/other",
+    }
+    comp_path = "/proj/shots/sh010/work/sh010.comp"
+    assert reverse_map_path(
+        "/proj/shots/sh020/plate.1001.exr", path_maps, comp_path
+    ) == "Shots:sh020/plate.1001.exr"
+    assert reverse_map_path(
+        "/proj/shots/sh010/plate_v002/plate.1001.exr", path_maps, comp_path
+    ) == "Plates:plate_v002/plate.1001.exr"
+    assert reverse_map_path(
+        "/proj/shots/sh010/work/render/out.1001.exr", path_maps, comp_path
+    ) == "Comp:render/out.1001.exr"
+    assert reverse_map_path(
+        "/elsewhere/bg.1001.exr", path_maps, comp_path
+    ) == "/elsewhere/bg.1001.exr"
+
+
+def test_reverse_map_path_windows():
+    path_maps = {"Shots:": "S:\\Shots\\"}
+    assert reverse_map_path(
+        "s:\\shots\\sh010\\plate.1001.exr", path_maps, "C:\\work\\a.comp"
+    ) == "Shots:sh010\\plate.1001.exr"
+
+
+def test_patch_comp_containers(tmp_path):
+    path = str(tmp_path / "sh010.comp")
+    comp_file.write_comp_file(path, COMP_TEXT)
+
+    updates = {
+        "repre-1": {
+            "id": "repre-3",
+            "path": os.path.normpath(
+                "/proj/shots/sh010/plate_v002/plate.1001.exr"
+            ),
+        },
+        "repre-2": {
+            "id": "repre-4",
+            "path": os.path.normpath("/elsewhere/bg_v002/bg.1001.exr"),
+        },
+    }
+    result = offline_update.patch_comp_containers(path, updates)
+    assert result["error"] is None
+    assert result["updated"] == ["Loader1", "Loader2"]
+
+    scan = offline_update.scan_comp_containers(path)
+    containers = {
+        container["tool"]: container for container in scan["containers"]
+    }
+    assert containers["Loader1"]["representation"] == "repre-3"
+    assert containers["Loader1"]["filename"] == os.path.join(
+        "Plates:plate_v002", "plate.1001.exr"
+    )
+    assert containers["Loader2"]["representation"] == "repre-4"
+    assert containers["Loader2"]["filename"] == updates["repre-2"]["path"]
+
+    # Only the patched literals changed
+    text = comp_file.read_comp_file(path)
+    assert text.count("\n") == COMP_TEXT.count("\n")
+    assert text[text.index("\tPrefs"):] == COMP_TEXT[
+        COMP_TEXT.index("\tPrefs"):
+    ]
+
+
+def test_patch_comp_containers_dry_run(tmp_path):
+    path = str(tmp_path / "sh010.comp")
+    comp_file.write_comp_file(path, COMP_TEXT)
+    result = offline_update.patch_comp_containers(
+        path, {"repre-2": {"id": "repre-4", "path": "/new/bg.1001.exr"}},
+        dry_run=True,
+    )
+    assert result["updated"] == ["Loader2"]
+    assert '+\t\t\t\tClip { Filename = "/new/bg.1001.exr", },' in (
+        result["diff"]
+    )
+    assert comp_file.read_comp_file(path) == COMP_TEXT
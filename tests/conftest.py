@@ -0,0 +1,11 @@
+import os
+import sys
+
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client"
+)
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+# Set by the AYON launcher, required to import `ayon_fusion.api`
+os.environ.setdefault("AYON_MENU_LABEL", "AYON")